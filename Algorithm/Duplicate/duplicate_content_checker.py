@@ -1,4 +1,3 @@
-import difflib
 import logging
 from typing import Tuple, List, Dict, Set
 import json
@@ -6,11 +5,12 @@ import os
 from collections import defaultdict
 import nltk
 from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
 import yaml
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from Duplicate.template_index import TemplateIndex
+from Grammar.text_normalizer import TextNormalizer, english_stop_words
 
 @dataclass
 class DuplicateMatch:
@@ -45,7 +45,10 @@ class DuplicateContentChecker:
         if custom_templates_path:
             self.load_custom_templates(custom_templates_path)
         
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = english_stop_words()
+        self.normalizer = TextNormalizer(stop_words=self.stop_words, join_punctuation=True)
+        # Built on first use from the preprocessed templates
+        self._template_index = None
 
     def setup_logging(self):
         """Configure logging with detailed formatting"""
@@ -135,6 +138,7 @@ class DuplicateContentChecker:
                         self.template_categories[category].extend(templates)
                     else:
                         self.template_categories[category] = templates
+            self._template_index = None  # Rebuilt with the new templates on next use
             self.logger.info(f"Successfully loaded custom templates from {file_path}")
         except Exception as e:
             self.logger.error(f"Error loading custom templates: {str(e)}")
@@ -149,18 +153,20 @@ class DuplicateContentChecker:
         Returns:
             str: Preprocessed text
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and extra whitespace
-        text = re.sub(r'[^\w\s]', '', text)
-        text = ' '.join(text.split())
-        
-        # Remove stopwords
-        words = text.split()
-        words = [word for word in words if word not in self.stop_words]
-        
-        return ' '.join(words)
+        # Lowercase, remove special characters and drop stopwords in one pass
+        return self.normalizer.normalize(text)
+
+    @property
+    def template_index(self) -> TemplateIndex:
+        """Shingle index of every template, preprocessed once."""
+        if self._template_index is None:
+            index = TemplateIndex()
+            for category, templates in self.template_categories.items():
+                for template in templates:
+                    index.add(template, self.preprocess_text(template), category)
+            self._template_index = index
+            self.logger.info(f"Indexed {len(index)} templates")
+        return self._template_index
 
     def check_duplicate_content(self, resume_text: str, threshold: float = 0.85) -> Tuple[bool, List[DuplicateMatch]]:
         """
@@ -176,28 +182,21 @@ class DuplicateContentChecker:
         try:
             duplicate_matches = []
             sentences = sent_tokenize(resume_text)
+            index = self.template_index
             
             for sentence in sentences:
                 preprocessed_sentence = self.preprocess_text(sentence)
                 
-                for category, templates in self.template_categories.items():
-                    for template in templates:
-                        preprocessed_template = self.preprocess_text(template)
-                        similarity = difflib.SequenceMatcher(
-                            None,
-                            preprocessed_template,
-                            preprocessed_sentence
-                        ).ratio()
-                        
-                        if similarity >= threshold:
-                            match = DuplicateMatch(
-                                original_text=sentence,
-                                matched_template=template,
-                                similarity_score=similarity,
-                                section_type=category,
-                                suggested_improvement=self.generate_improvement_suggestion(category)
-                            )
-                            duplicate_matches.append(match)
+                # Only templates passing the index filters get an exact score
+                for template, similarity in index.search(preprocessed_sentence, threshold):
+                    match = DuplicateMatch(
+                        original_text=sentence,
+                        matched_template=template.template,
+                        similarity_score=similarity,
+                        section_type=template.category,
+                        suggested_improvement=self.generate_improvement_suggestion(template.category)
+                    )
+                    duplicate_matches.append(match)
             
             has_duplicates = len(duplicate_matches) > 0
             self.logger.info(f"Found {len(duplicate_matches)} duplicate matches")
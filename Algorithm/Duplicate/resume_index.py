@@ -0,0 +1,380 @@
+import hashlib
+import random
+import sqlite3
+import struct
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Modulus of the permutation hashes (a Mersenne prime larger than every shingle hash)
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+@dataclass
+class SimilarResume:
+    """A previously indexed resume found to be a near-duplicate."""
+    resume_id: str
+    filename: str
+    added_at: str
+    similarity: float
+
+class ResumeIndex:
+    """
+    Persistent MinHash/LSH index of submitted resumes.
+
+    Each resume is normalized with ``preprocess`` (the duplicate checker's
+    preprocess_text), split into overlapping word shingles and summarized by a
+    MinHash signature whose matching positions estimate the Jaccard similarity
+    of two resumes. Signatures are cut into ``bands`` bands; resumes sharing
+    any band bucket become candidates, so a query only compares against the
+    few resumes in its buckets instead of the whole applicant pool. Signatures
+    and buckets live in SQLite, so the index grows incrementally and survives
+    restarts. Resumes can be linked to the submitter who uploaded them, so a
+    candidate's edited re-upload is not reported as a copy of their own
+    earlier submission.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS resumes (
+            resume_id TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            added_at TEXT NOT NULL,
+            signature BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS lsh_buckets (
+            band INTEGER NOT NULL,
+            bucket TEXT NOT NULL,
+            resume_id TEXT NOT NULL,
+            PRIMARY KEY (band, bucket, resume_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_lsh_buckets_resume ON lsh_buckets (resume_id);
+        CREATE TABLE IF NOT EXISTS resume_submitters (
+            submitter TEXT NOT NULL,
+            resume_id TEXT NOT NULL,
+            PRIMARY KEY (submitter, resume_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_resume_submitters_resume ON resume_submitters (resume_id);
+    '''
+
+    def __init__(self, db_path: str = 'resume_index.db', preprocess: Optional[Callable[[str], str]] = None,
+                 num_perm: int = 128, bands: int = 16, shingle_size: int = 3, seed: int = 1,
+                 retention_days: Optional[int] = None, retention_interval: int = 100):
+        """
+        Open (and create if needed) the index database.
+
+        With the defaults (16 bands of 8 rows) resumes above roughly 0.7
+        Jaccard similarity are very likely to share a bucket.
+
+        Args:
+            db_path (str): SQLite database file
+            preprocess (Callable): Text normalization applied before shingling
+            num_perm (int): Number of MinHash permutations (signature length)
+            bands (int): Number of LSH bands; must divide num_perm
+            shingle_size (int): Words per shingle
+            seed (int): Seed of the permutations; must stay the same for an existing database
+            retention_days (int): Resumes older than this are removed (None keeps them forever)
+            retention_interval (int): Retention is applied again after this many additions
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.db_path = db_path
+        self.preprocess = preprocess or (lambda text: ' '.join(text.lower().split()))
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        generator = random.Random(seed)
+        self._permutations = [
+            (generator.randint(1, _PRIME - 1), generator.randint(0, _PRIME - 1)) for _ in range(num_perm)
+        ]
+        self._local = threading.local()
+        self.retention_days = retention_days
+        self.retention_interval = retention_interval
+        self._adds_since_retention = 0
+        self._retention_lock = threading.Lock()
+
+        with self._connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+        self.apply_retention()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def shingles(self, text: str) -> set:
+        """32-bit hashes of the word shingles of the normalized text."""
+        words = self.preprocess(text).split()
+        size = min(self.shingle_size, len(words)) or 1
+        return {
+            struct.unpack('<I', hashlib.blake2b(' '.join(words[i:i + size]).encode('utf-8'), digest_size=4).digest())[0]
+            for i in range(max(len(words) - size + 1, 0))
+        }
+
+    def signature(self, text: str) -> List[int]:
+        """
+        MinHash signature of a text.
+
+        Args:
+            text (str): Resume text
+
+        Returns:
+            List[int]: num_perm minimum hash values (all maximal for an empty text)
+        """
+        shingles = self.shingles(text)
+        if not shingles:
+            return self._empty_signature()
+        return [
+            min(((a * shingle + b) % _PRIME) & _MAX_HASH for shingle in shingles)
+            for a, b in self._permutations
+        ]
+
+    def _empty_signature(self) -> List[int]:
+        return [_MAX_HASH] * self.num_perm
+
+    def _buckets(self, signature: List[int]) -> List[Tuple[int, str]]:
+        """(band, bucket key) of every band of a signature."""
+        return [
+            (band, hashlib.blake2b(
+                struct.pack(f'<{self.rows}I', *signature[band * self.rows:(band + 1) * self.rows]), digest_size=8
+            ).hexdigest())
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def _pack(signature: List[int]) -> bytes:
+        return struct.pack(f'<{len(signature)}I', *signature)
+
+    def _unpack(self, blob: bytes) -> List[int]:
+        return list(struct.unpack(f'<{self.num_perm}I', blob))
+
+    @staticmethod
+    def estimate_similarity(first: List[int], second: List[int]) -> float:
+        """Estimated Jaccard similarity: the fraction of equal signature positions."""
+        return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+    def add(self, resume_id: str, text: str, filename: str = '', added_at: Optional[str] = None,
+            signature: Optional[List[int]] = None, submitter: Optional[str] = None) -> List[int]:
+        """
+        Insert or replace a resume.
+
+        Args:
+            resume_id (str): Identifier, e.g. the file hash
+            text (str): Resume text
+            filename (str): Name of the submitted file
+            added_at (str): ISO timestamp (defaults to now)
+            signature (List[int]): Precomputed signature of text
+            submitter (str): Key of the candidate who submitted it, if known
+
+        Returns:
+            List[int]: The resume's signature
+        """
+        signature = signature or self.signature(text)
+        # A text without shingles would share every bucket with all other empty texts
+        buckets = [] if signature == self._empty_signature() else self._buckets(signature)
+        with self._connection() as conn:
+            conn.execute('DELETE FROM lsh_buckets WHERE resume_id = ?', (resume_id,))
+            conn.execute(
+                'INSERT OR REPLACE INTO resumes (resume_id, filename, added_at, signature) VALUES (?, ?, ?, ?)',
+                (resume_id, filename, added_at or datetime.now().isoformat(), self._pack(signature))
+            )
+            conn.executemany(
+                'INSERT OR IGNORE INTO lsh_buckets (band, bucket, resume_id) VALUES (?, ?, ?)',
+                [(band, bucket, resume_id) for band, bucket in buckets]
+            )
+            if submitter:
+                # The same file may be submitted by several candidates, so submitters are added, never replaced
+                conn.execute(
+                    'INSERT OR IGNORE INTO resume_submitters (submitter, resume_id) VALUES (?, ?)',
+                    (submitter, resume_id)
+                )
+
+        with self._retention_lock:
+            self._adds_since_retention += 1
+            due = self._adds_since_retention >= self.retention_interval
+            if due:
+                self._adds_since_retention = 0
+        if due:
+            self.apply_retention()
+        return signature
+
+    def add_many(self, resumes: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Insert several resumes.
+
+        Args:
+            resumes (Iterable[Tuple[str, str, str]]): (resume_id, text, filename) tuples
+
+        Returns:
+            int: Number of resumes added
+        """
+        added = 0
+        for resume_id, text, filename in resumes:
+            self.add(resume_id, text, filename)
+            added += 1
+        return added
+
+    def remove(self, resume_id: str) -> None:
+        """Remove a resume from the index."""
+        with self._connection() as conn:
+            conn.execute('DELETE FROM lsh_buckets WHERE resume_id = ?', (resume_id,))
+            conn.execute('DELETE FROM resume_submitters WHERE resume_id = ?', (resume_id,))
+            conn.execute('DELETE FROM resumes WHERE resume_id = ?', (resume_id,))
+
+    def apply_retention(self) -> int:
+        """
+        Remove resumes added more than retention_days ago.
+
+        Returns:
+            int: Number of resumes removed
+        """
+        if self.retention_days is None:
+            return 0
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+        with self._connection() as conn:
+            conn.execute(
+                'DELETE FROM lsh_buckets WHERE resume_id IN (SELECT resume_id FROM resumes WHERE added_at < ?)',
+                (cutoff,)
+            )
+            conn.execute(
+                'DELETE FROM resume_submitters WHERE resume_id IN (SELECT resume_id FROM resumes WHERE added_at < ?)',
+                (cutoff,)
+            )
+            return conn.execute('DELETE FROM resumes WHERE added_at < ?', (cutoff,)).rowcount
+
+    def query(self, text: str, threshold: float = 0.8, exclude: Optional[str] = None,
+              signature: Optional[List[int]] = None, exclude_submitter: Optional[str] = None) -> List[SimilarResume]:
+        """
+        Find indexed resumes similar to a text.
+
+        Args:
+            text (str): Resume text
+            threshold (float): Minimum estimated Jaccard similarity
+            exclude (str): Resume id to leave out, e.g. the upload itself
+            signature (List[int]): Precomputed signature of text
+            exclude_submitter (str): Leave out every resume this submitter submitted earlier
+
+        Returns:
+            List[SimilarResume]: Near-duplicates, most similar first
+        """
+        signature = signature or self.signature(text)
+        if signature == self._empty_signature():
+            return []
+        conn = self._connection()
+        candidates = set()
+        for band, bucket in self._buckets(signature):
+            candidates.update(
+                row[0] for row in conn.execute(
+                    'SELECT resume_id FROM lsh_buckets WHERE band = ? AND bucket = ?', (band, bucket)
+                )
+            )
+        candidates.discard(exclude)
+        if exclude_submitter and candidates:
+            candidates.difference_update(
+                row[0] for row in conn.execute(
+                    'SELECT resume_id FROM resume_submitters WHERE submitter = ?', (exclude_submitter,)
+                )
+            )
+
+        results = []
+        for resume_id in candidates:
+            row = conn.execute(
+                'SELECT filename, added_at, signature FROM resumes WHERE resume_id = ?', (resume_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            similarity = self.estimate_similarity(signature, self._unpack(row[2]))
+            if similarity >= threshold:
+                results.append(SimilarResume(resume_id, row[0], row[1], similarity))
+        return sorted(results, key=lambda result: result.similarity, reverse=True)
+
+    def cluster(self, threshold: float = 0.8) -> List[List[str]]:
+        """
+        Group the whole index into clusters of near-duplicate resumes.
+
+        Only resumes sharing an LSH bucket are compared, and pairs above the
+        threshold are joined transitively.
+
+        Args:
+            threshold (float): Minimum estimated Jaccard similarity of a linked pair
+
+        Returns:
+            List[List[str]]: Resume ids of every cluster with more than one resume, largest first
+        """
+        conn = self._connection()
+        signatures = {row[0]: self._unpack(row[1]) for row in conn.execute('SELECT resume_id, signature FROM resumes')}
+        parent = {resume_id: resume_id for resume_id in signatures}
+
+        def find(resume_id):
+            while parent[resume_id] != resume_id:
+                parent[resume_id] = parent[parent[resume_id]]
+                resume_id = parent[resume_id]
+            return resume_id
+
+        compared = set()
+        buckets = conn.execute(
+            'SELECT group_concat(resume_id, char(31)) FROM lsh_buckets '
+            'GROUP BY band, bucket HAVING COUNT(*) > 1'
+        )
+        for (members,) in buckets:
+            members = sorted(member for member in members.split('\x1f') if member in signatures)
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    if (first, second) in compared or find(first) == find(second):
+                        continue
+                    compared.add((first, second))
+                    if self.estimate_similarity(signatures[first], signatures[second]) >= threshold:
+                        parent[find(second)] = find(first)
+
+        clusters: Dict[str, List[str]] = defaultdict(list)
+        for resume_id in signatures:
+            clusters[find(resume_id)].append(resume_id)
+        return sorted((sorted(members) for members in clusters.values() if len(members) > 1), key=len, reverse=True)
+
+    def __len__(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+# Run from the Algorithm directory, e.g. python -m Duplicate.resume_index cluster
+if __name__ == '__main__':
+    import argparse
+    import glob
+    import json
+    from Format.parsed_document import ParsedDocument
+    from Duplicate.duplicate_content_checker import DuplicateContentChecker
+
+    parser = argparse.ArgumentParser(description="Find near-duplicate resumes across the applicant pool")
+    parser.add_argument('--db', default='resume_index.db', help="Resume index database file")
+    parser.add_argument('--threshold', type=float, default=0.8, help="Minimum estimated similarity")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    add_parser = subparsers.add_parser('add', help="Index resume files")
+    add_parser.add_argument('paths', nargs='+', help="Resume files or glob patterns")
+    query_parser = subparsers.add_parser('query', help="List indexed near-duplicates of a resume file")
+    query_parser.add_argument('path', help="Resume file")
+    subparsers.add_parser('cluster', help="Group the indexed resumes into near-duplicate clusters")
+    args = parser.parse_args()
+
+    def read_resumes(paths):
+        """(resume_id, text, filename) of every file, closing each document once read."""
+        for pattern in paths:
+            for path in sorted(glob.glob(pattern)):
+                with ParsedDocument.from_file(path) as document:
+                    yield document.md5, document.text, document.filename
+
+    index = ResumeIndex(args.db, preprocess=DuplicateContentChecker().preprocess_text)
+    if args.command == 'add':
+        added = index.add_many(read_resumes(args.paths))
+        print(f"Indexed {added} resumes ({len(index)} in total)")
+    elif args.command == 'query':
+        with ParsedDocument.from_file(args.path) as document:
+            text, resume_id = document.text, document.md5
+        for match in index.query(text, args.threshold, exclude=resume_id):
+            print(f"{match.similarity:.2f}  {match.filename}  ({match.resume_id}, added {match.added_at})")
+    elif args.command == 'cluster':
+        print(json.dumps(index.cluster(args.threshold), indent=4))
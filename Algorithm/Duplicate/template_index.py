@@ -0,0 +1,132 @@
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from rapidfuzz import fuzz
+
+@dataclass
+class IndexedTemplate:
+    """A template together with its preprocessed text and category."""
+    template: str
+    preprocessed: str
+    category: str
+
+def similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """
+    Similarity of two preprocessed texts between 0 and 1.
+
+    This is rapidfuzz's normalized Indel similarity, 1 - (insertions + deletions)
+    / (len(a) + len(b)), i.e. twice the longest common subsequence over the
+    total length. It is never lower than the Ratcliff/Obershelp ratio of
+    difflib.SequenceMatcher that the checker used before.
+
+    Args:
+        a (str): First text
+        b (str): Second text
+        threshold (float): Scores below this may be returned as 0
+
+    Returns:
+        float: Similarity score
+    """
+    return fuzz.ratio(a, b, score_cutoff=threshold * 100) / 100
+
+class TemplateIndex:
+    """
+    Character-shingle inverted index over preprocessed templates.
+
+    Templates are preprocessed once when added. A sentence is scored exactly
+    only against the templates that pass two filters which can never reject a
+    match above the threshold: a length filter (the similarity is at most
+    2 * min(len) / (len_a + len_b)) and a shared-shingle count filter (every
+    inserted or deleted character destroys at most ``shingle_size`` shingles).
+    """
+
+    def __init__(self, shingle_size: int = 3):
+        """
+        Initialize an empty index.
+
+        Args:
+            shingle_size (int): Characters per shingle
+        """
+        self.shingle_size = shingle_size
+        self.templates: List[IndexedTemplate] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._by_length: Dict[int, List[int]] = defaultdict(list)
+
+    def _shingles(self, text: str) -> Counter:
+        size = self.shingle_size
+        return Counter(text[i:i + size] for i in range(len(text) - size + 1))
+
+    def add(self, template: str, preprocessed: str, category: str) -> None:
+        """
+        Index a template.
+
+        Args:
+            template (str): Template as written
+            preprocessed (str): Template after preprocessing
+            category (str): Template category
+        """
+        template_id = len(self.templates)
+        self.templates.append(IndexedTemplate(template, preprocessed, category))
+        self._by_length[len(preprocessed)].append(template_id)
+        for shingle, count in self._shingles(preprocessed).items():
+            self._postings[shingle].append((template_id, count))
+
+    def candidates(self, text: str, threshold: float) -> List[int]:
+        """
+        Ids of the templates that may reach threshold similarity with text.
+
+        Args:
+            text (str): Preprocessed sentence
+            threshold (float): Minimum similarity
+
+        Returns:
+            List[int]: Template ids passing the length and shingle filters
+        """
+        length = len(text)
+        shared = Counter()
+        for shingle, count in self._shingles(text).items():
+            for template_id, template_count in self._postings.get(shingle, ()):
+                shared[template_id] += min(count, template_count)
+
+        # Short texts can match without sharing any shingle; consider every template of such lengths
+        result = set()
+        for template_length, template_ids in self._by_length.items():
+            if self._required_shingles(length, template_length, threshold) <= 0:
+                result.update(template_ids)
+
+        for template_id, count in shared.items():
+            template_length = len(self.templates[template_id].preprocessed)
+            if count >= self._required_shingles(length, template_length, threshold):
+                result.add(template_id)
+        return sorted(result)
+
+    def _required_shingles(self, length: int, template_length: int, threshold: float) -> float:
+        """Shared shingles needed to reach threshold, or infinity if the lengths alone rule it out."""
+        total = length + template_length
+        if total == 0 or 2 * min(length, template_length) < threshold * total:
+            return float('inf')
+        # Indel distance allowed by the threshold, and the shingles that must survive it
+        max_distance = (1 - threshold) * total
+        return max(length, template_length) - self.shingle_size + 1 - max_distance * self.shingle_size
+
+    def search(self, text: str, threshold: float) -> List[Tuple[IndexedTemplate, float]]:
+        """
+        Templates whose similarity with text is at least threshold.
+
+        Args:
+            text (str): Preprocessed sentence
+            threshold (float): Minimum similarity
+
+        Returns:
+            List[Tuple[IndexedTemplate, float]]: Matching templates and scores, in index order
+        """
+        matches = []
+        for template_id in self.candidates(text, threshold):
+            template = self.templates[template_id]
+            score = similarity(template.preprocessed, text, threshold)
+            if score >= threshold:
+                matches.append((template, score))
+        return matches
+
+    def __len__(self) -> int:
+        return len(self.templates)
@@ -0,0 +1,248 @@
+import hashlib
+import io
+import logging
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional
+import docx  # python-docx for Word documents
+import fitz  # PyMuPDF for PDFs
+import magic
+
+PDF_MIME = 'application/pdf'
+
+@dataclass
+class PageContent:
+    """Text, spans and image placements of one PDF page."""
+    number: int
+    width: float
+    height: float
+    text: str
+    spans: List[Dict] = field(default_factory=list)
+    images: List[Dict] = field(default_factory=list)
+
+@dataclass
+class DocxParagraph:
+    """Text and style name of one DOCX paragraph."""
+    text: str
+    style: Optional[str]
+
+class ParsedDocument:
+    """
+    An uploaded resume read from disk once and parsed at most once.
+
+    The file bytes are read when the object is created; the MIME type, the
+    PDF pages (text, span dicts and image metadata) and the DOCX paragraphs
+    are derived from those bytes on first access and then shared by every
+    checker, so no checker reopens the file.
+
+    PDF extraction stops at ``max_pages`` pages or ``max_chars`` characters
+    so that very long uploads cannot exhaust memory; ``truncated`` tells
+    whether a cap was hit.
+    """
+
+    def __init__(self, file_path: str, data: bytes, max_pages: Optional[int] = None,
+                 max_chars: Optional[int] = None):
+        """
+        Initialize the document from bytes already read.
+
+        Args:
+            file_path (str): Path the bytes were read from
+            data (bytes): File contents
+            max_pages (int): Maximum number of PDF pages extracted (None for no limit)
+            max_chars (int): Maximum number of text characters extracted (None for no limit)
+        """
+        self.file_path = file_path
+        self.data = data
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.truncated = False
+        self._parsed_pages: List[PageContent] = []
+        self._parsed_chars = 0
+        self._pages_exhausted = False
+
+    @classmethod
+    def from_file(cls, file_path: str, max_pages: Optional[int] = None,
+                  max_chars: Optional[int] = None) -> 'ParsedDocument':
+        """Read a file in a single pass."""
+        with open(file_path, 'rb') as f:
+            return cls(file_path, f.read(), max_pages=max_pages, max_chars=max_chars)
+
+    @property
+    def filename(self) -> str:
+        return os.path.basename(self.file_path)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @cached_property
+    def md5(self) -> str:
+        """MD5 of the file contents, as used for the history key."""
+        return hashlib.md5(self.data).hexdigest()
+
+    @cached_property
+    def file_type(self) -> Optional[str]:
+        """MIME type detected from the in-memory bytes."""
+        try:
+            return magic.from_buffer(self.data, mime=True)
+        except Exception as e:
+            logging.error(f"Error determining file type: {e}")
+            return None
+
+    @cached_property
+    def pdf(self) -> fitz.Document:
+        """The PDF opened from memory."""
+        return fitz.open(stream=self.data, filetype='pdf')
+
+    def iter_pages(self) -> Iterator[PageContent]:
+        """
+        Yield PDF pages in order, parsing each one the first time it is reached.
+
+        Pages already parsed by an earlier iteration are reused, so consumers
+        can stop as soon as they have seen enough without paying for the rest.
+        """
+        index = 0
+        while True:
+            if index < len(self._parsed_pages):
+                yield self._parsed_pages[index]
+                index += 1
+            elif not self._parse_next_page():
+                return
+
+    def _parse_next_page(self) -> bool:
+        """Parse the next page within the caps; returns False once extraction has ended."""
+        if self._pages_exhausted:
+            return False
+
+        index = len(self._parsed_pages)
+        page_limit_hit = self.max_pages is not None and index >= self.max_pages
+        char_limit_hit = self.max_chars is not None and self._parsed_chars >= self.max_chars
+        if index >= self.pdf.page_count or page_limit_hit or char_limit_hit:
+            self.truncated = self.truncated or index < self.pdf.page_count
+            self._pages_exhausted = True
+            return False
+
+        page = self._parse_page(self.pdf[index])
+        if self.max_chars is not None and self._parsed_chars + len(page.text) > self.max_chars:
+            page.text = page.text[:self.max_chars - self._parsed_chars]
+            self.truncated = True
+        self._parsed_chars += len(page.text)
+        self._parsed_pages.append(page)
+        return True
+
+    @property
+    def pages(self) -> List[PageContent]:
+        """Every PDF page within the caps, parsed with a single get_text("dict") call each."""
+        return list(self.iter_pages())
+
+    def _parse_page(self, page: fitz.Page) -> PageContent:
+        # TEXTFLAGS_TEXT leaves image blocks (and their binary data) out of the dict
+        blocks = page.get_text('dict', flags=fitz.TEXTFLAGS_TEXT)['blocks']
+        spans = []
+        lines = []
+        for block in blocks:
+            for line in block.get('lines', []):
+                line_spans = line['spans']
+                spans.extend(line_spans)
+                lines.append(''.join(span['text'] for span in line_spans))
+
+        return PageContent(
+            number=page.number,
+            width=page.rect.width,
+            height=page.rect.height,
+            text='\n'.join(lines) + '\n' if lines else '',
+            spans=spans,
+            images=page.get_image_info(xrefs=True)
+        )
+
+    @cached_property
+    def paragraphs(self) -> List[DocxParagraph]:
+        """DOCX paragraphs with their style names."""
+        document = docx.Document(io.BytesIO(self.data))
+        return [
+            DocxParagraph(text=paragraph.text, style=paragraph.style.name if paragraph.style else None)
+            for paragraph in document.paragraphs
+        ]
+
+    def iter_text(self) -> Iterator[str]:
+        """
+        Yield the document text in pieces (pages or paragraphs) within the character cap.
+
+        Joining the pieces gives ``text``.
+        """
+        if self.file_type == PDF_MIME:
+            for page in self.iter_pages():
+                yield page.text
+            return
+
+        if self.file_type and self.file_type.endswith('wordprocessingml.document'):
+            pieces = (paragraph.text + '\n' for paragraph in self.paragraphs)
+        else:
+            pieces = iter([self.data.decode('utf-8', errors='replace')])
+
+        remaining = self.max_chars
+        for piece in pieces:
+            if remaining is not None and len(piece) > remaining:
+                self.truncated = True
+                if remaining:
+                    yield piece[:remaining]
+                return
+            if remaining is not None:
+                remaining -= len(piece)
+            yield piece
+
+    @cached_property
+    def text(self) -> str:
+        """Plain text of the whole document, within the caps."""
+        return ''.join(self.iter_text())
+
+    @cached_property
+    def fonts(self) -> Counter:
+        """Number of PDF text spans set in each font."""
+        return Counter(span['font'] for page in self.pages for span in page.spans)
+
+    @cached_property
+    def image_areas(self) -> Dict[int, float]:
+        """
+        Area in points covered by each image, keyed by xref.
+
+        Areas come from the placement rectangles reported by get_image_info,
+        clipped to the page, so no image data is decoded. An image placed
+        several times (e.g. a logo on every page) is counted once, with its
+        largest placement. Inline images have no xref and are keyed by a
+        negative counter instead.
+        """
+        areas: Dict[int, float] = {}
+        inline = 0
+        for page in self.pages:
+            page_rect = fitz.Rect(0, 0, page.width, page.height)
+            for image in page.images:
+                area = abs(fitz.Rect(image['bbox']) & page_rect)
+                xref = image.get('xref', 0)
+                if xref <= 0:
+                    inline -= 1
+                    xref = inline
+                if area > areas.get(xref, 0.0):
+                    areas[xref] = area
+        return areas
+
+    @cached_property
+    def image_coverage(self) -> float:
+        """Percentage of the total page area covered by images."""
+        total_page_area = sum(page.width * page.height for page in self.pages)
+        if total_page_area <= 0:
+            return 0.0
+        return sum(self.image_areas.values()) / total_page_area * 100
+
+    def close(self) -> None:
+        """Release the PDF handle if one was opened."""
+        if 'pdf' in self.__dict__:
+            self.pdf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,157 @@
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Tuple
+
+SEGMENTATION_CACHE_SIZE = int(os.environ.get('SECTION_SEGMENTATION_CACHE_SIZE', 16))
+
+@dataclass(frozen=True)
+class SectionSpan:
+    """A section heading line and the text up to the next heading, as character offsets."""
+    name: str
+    heading: str
+    start: int
+    content_start: int
+    end: int
+
+class Segmentation:
+    """
+    Section mentions and heading lines of one text.
+
+    A heading line is any line naming at least one section. Consumers that
+    only care about some of the sections ask for spans(sections); a line is
+    then a heading for them if it names one of their sections, so every
+    consumer reads its own view of the same single scan.
+    """
+
+    def __init__(self, text: str, mentions: FrozenSet[str], headings: List[Tuple[int, int, FrozenSet[str]]]):
+        """
+        Args:
+            text (str): The segmented text
+            mentions (FrozenSet[str]): Lowercased sections named anywhere in the text
+            headings (List[Tuple[int, int, FrozenSet[str]]]): (line start, line end, sections named) of every heading line
+        """
+        self.text = text
+        self.mentions = mentions
+        self.headings = headings
+
+    def mentions_section(self, section: str) -> bool:
+        """Whether the section is named anywhere in the text (case-insensitive)."""
+        return section.lower() in self.mentions
+
+    def spans(self, sections: Iterable[str]) -> List[SectionSpan]:
+        """
+        Section spans for a list of section names.
+
+        Args:
+            sections (Iterable[str]): Section names in priority order; when a line names
+                several, the first of them becomes the span name
+
+        Returns:
+            List[SectionSpan]: Spans in document order
+        """
+        sections = [(section, section.lower()) for section in sections]
+        starts = []
+        for line_start, line_end, names in self.headings:
+            name = next((section for section, lowered in sections if lowered in names), None)
+            if name is not None:
+                starts.append((line_start, line_end, name))
+
+        spans = []
+        for index, (line_start, line_end, name) in enumerate(starts):
+            end = starts[index + 1][0] if index + 1 < len(starts) else len(self.text)
+            spans.append(SectionSpan(
+                name=name,
+                heading=self.text[line_start:line_end].strip(),
+                start=line_start,
+                content_start=min(line_end + 1, end),
+                end=end
+            ))
+        return spans
+
+    def content_lines(self, span: SectionSpan) -> List[str]:
+        """Non-empty stripped lines of a span's content."""
+        return [line.strip() for line in self.text[span.content_start:span.end].split('\n') if line.strip()]
+
+class SectionSegmenter:
+    """
+    Single-pass, line-oriented section segmentation shared by the analyzers.
+
+    All section names are compiled into one case-insensitive alternation, so
+    the text is scanned once regardless of how many sections are configured.
+    A section counts wherever its name occurs as a substring, matching the
+    checks this replaces. Segmentations are cached by text hash, so the
+    required-section check and LinkedIn's section analysis of the same resume
+    share one scan.
+    """
+
+    def __init__(self, sections: Iterable[str], cache_size: int = SEGMENTATION_CACHE_SIZE):
+        """
+        Compile the section names.
+
+        Args:
+            sections (Iterable[str]): Section names to look for
+            cache_size (int): Segmentations kept in memory
+        """
+        self.sections = list(dict.fromkeys(section.lower() for section in sections if section))
+        # Longest first so a name is matched whole rather than as one of its substrings
+        alternatives = sorted(self.sections, key=len, reverse=True)
+        # Lookahead so overlapping names (e.g. "work history" / "history of work") are all found
+        self._pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(name) for name in alternatives) + '))', re.IGNORECASE
+        ) if alternatives else None
+        # Names contained in each name, found whenever the longer one matches
+        self._contained = {
+            name: frozenset(other for other in self.sections if other in name)
+            for name in self.sections
+        }
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def segment(self, text: str) -> Segmentation:
+        """
+        Return the segmentation of text, scanning it only if it is not cached.
+
+        Args:
+            text (str): Document text
+
+        Returns:
+            Segmentation: Mentions and heading lines of the text
+        """
+        text = text or ''
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        with self._lock:
+            segmentation = self._cache.get(key)
+            if segmentation is not None:
+                self._cache.move_to_end(key)
+                return segmentation
+
+        segmentation = self._scan(text)
+
+        with self._lock:
+            self._cache[key] = segmentation
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return segmentation
+
+    def _scan(self, text: str) -> Segmentation:
+        """Find every section name and group the matches by line."""
+        mentions = set()
+        lines = OrderedDict()  # line start -> [line end, names]
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                names = self._contained[match.group(1).lower()]
+                mentions.update(names)
+                line_start = text.rfind('\n', 0, match.start()) + 1
+                line = lines.get(line_start)
+                if line is None:
+                    line_end = text.find('\n', match.start())
+                    line = lines[line_start] = [len(text) if line_end == -1 else line_end, set()]
+                line[1].update(names)
+
+        headings = [(start, end, frozenset(names)) for start, (end, names) in lines.items()]
+        return Segmentation(text, frozenset(mentions), headings)
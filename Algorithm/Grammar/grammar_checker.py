@@ -1,16 +1,24 @@
-import language_tool_python
 import textstat
 from typing import List, Dict, Union
 import re
-from collections import Counter
-import spacy
+import copy
+import hashlib
+import threading
+from collections import Counter, OrderedDict
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from Grammar.language_tool_pool import LanguageToolPool, get_language_tool_pool
+from Grammar.sentence_cache import SentenceGrammarCache
+from Grammar.spacy_registry import get_doc, get_model
+from Grammar.new_grammar_checker import check_text_grammar_spelling
 
 class GrammarChecker:
     """
     Enhanced grammar checker with resume-specific analysis capabilities.
     """
+
+    # Number of recent texts whose full analysis is kept for reuse
+    ANALYSIS_CACHE_SIZE = 32
     
     def __init__(self, language: str = "en-US", spacy_model: str = "en_core_web_sm"):
         """
@@ -21,8 +29,15 @@ class GrammarChecker:
             spacy_model (str): Name of spaCy model to use for NLP tasks
         """
         try:
-            self.tool = language_tool_python.LanguageTool(language)
-            self.nlp = spacy.load(spacy_model)
+            # en-US checks share the process-wide pool of long-lived servers
+            self.tool = get_language_tool_pool() if language == "en-US" else LanguageToolPool(language)
+            self.tool.warm_up()
+            self.sentence_cache = SentenceGrammarCache(self.tool.check, language=language)
+            # One copy of each model per process, shared with the other checkers
+            self.spacy_model = spacy_model
+            self.nlp = get_model(spacy_model)
+            self._analyses = OrderedDict()
+            self._analyses_lock = threading.Lock()
             self.setup_logging()
         except Exception as e:
             logging.error(f"Initialization error: {str(e)}")
@@ -46,27 +61,34 @@ class GrammarChecker:
             List[Dict]: List of grammar issues with detailed information
         """
         try:
-            matches = self.tool.check(text)
-            issues = []
-            
-            for match in matches:
-                issue = {
-                    'error': match.context,
-                    'suggestions': match.replacements,
-                    'category': match.category,
-                    'rule_id': match.ruleId,
-                    'message': match.message,
-                    'position': (match.offset, match.offset + match.errorLength)
-                }
-                
-                issues.append(issue)
-            
-            logging.info(f"Found {len(issues)} grammar issues")
-            return issues
+            return self._grammar_issues(self._grammar_matches(text))
         except Exception as e:
             logging.error(f"Grammar check error: {str(e)}")
             return []
 
+    def _grammar_matches(self, text: str) -> List:
+        """LanguageTool matches for text; only sentences not seen before reach LanguageTool."""
+        return self.sentence_cache.check(text)
+
+    def _grammar_issues(self, matches: List) -> List[Dict[str, str]]:
+        """Describe LanguageTool matches with their context and category."""
+        issues = []
+        
+        for match in matches:
+            issue = {
+                'error': match.context,
+                'suggestions': match.replacements,
+                'category': match.category,
+                'rule_id': match.ruleId,
+                'message': match.message,
+                'position': (match.offset, match.offset + match.errorLength)
+            }
+            
+            issues.append(issue)
+        
+        logging.info(f"Found {len(issues)} grammar issues")
+        return issues
+
     def analyze_readability(self, text: str) -> Dict[str, float]:
         """
         Compute comprehensive readability metrics.
@@ -78,21 +100,24 @@ class GrammarChecker:
             Dict[str, float]: Dictionary of readability scores
         """
         try:
-            scores = {
-                "Flesch Reading Ease": textstat.flesch_reading_ease(text),
-                "Gunning Fog Index": textstat.gunning_fog(text),
-                "SMOG Index": textstat.smog_index(text),
-                "Automated Readability Index": textstat.automated_readability_index(text),
-                "Coleman Liau Index": textstat.coleman_liau_index(text),
-                "Dale Chall Readability": textstat.dale_chall_readability_score(text),
-                "Difficult Words": textstat.difficult_words(text),
-                "Syllable Count": textstat.syllable_count(text)
-            }
-            return scores
+            return self._readability_scores(text)
         except Exception as e:
             logging.error(f"Readability analysis error: {str(e)}")
             return {}
 
+    def _readability_scores(self, text: str) -> Dict[str, float]:
+        """textstat readability scores of text; errors are raised to the caller."""
+        return {
+            "Flesch Reading Ease": textstat.flesch_reading_ease(text),
+            "Gunning Fog Index": textstat.gunning_fog(text),
+            "SMOG Index": textstat.smog_index(text),
+            "Automated Readability Index": textstat.automated_readability_index(text),
+            "Coleman Liau Index": textstat.coleman_liau_index(text),
+            "Dale Chall Readability": textstat.dale_chall_readability_score(text),
+            "Difficult Words": textstat.difficult_words(text),
+            "Syllable Count": textstat.syllable_count(text)
+        }
+
     def analyze_resume_keywords(self, text: str, industry_keywords: List[str]) -> Dict[str, Union[int, List[str]]]:
         """
         Analyze presence of industry-specific keywords in the resume.
@@ -105,8 +130,9 @@ class GrammarChecker:
             Dict: Analysis of keyword usage
         """
         try:
-            doc = self.nlp(text.lower())
-            words = [token.text for token in doc if not token.is_stop and not token.is_punct]
+            # The Doc of the original text is shared with the other checks; stop words are case-insensitive
+            doc = get_doc(text, self.spacy_model)
+            words = [token.lower_ for token in doc if not token.is_stop and not token.is_punct]
             
             keyword_matches = []
             for keyword in industry_keywords:
@@ -133,18 +159,16 @@ class GrammarChecker:
             List[str]: Sentences containing passive voice
         """
         try:
-            doc = self.nlp(text)
-            passive_sentences = []
-            
-            for sent in doc.sents:
-                if any(token.dep_ == "nsubjpass" for token in sent):
-                    passive_sentences.append(sent.text)
-            
-            return passive_sentences
+            return self._passive_sentences(text)
         except Exception as e:
             logging.error(f"Passive voice check error: {str(e)}")
             return []
 
+    def _passive_sentences(self, text: str) -> List[str]:
+        """Sentences of text with a passive subject; errors are raised to the caller."""
+        doc = get_doc(text, self.spacy_model)
+        return [sent.text for sent in doc.sents if any(token.dep_ == "nsubjpass" for token in sent)]
+
     def get_improvement_suggestions(self, text: str) -> Dict[str, List[str]]:
         """
         Provide comprehensive improvement suggestions for the text.
@@ -155,25 +179,96 @@ class GrammarChecker:
         Returns:
             Dict: Various improvement suggestions
         """
-        suggestions = {
-            'grammar_issues': self.check_grammar(text),
-            'passive_voice': self.check_passive_voice(text),
-            'readability_scores': self.analyze_readability(text),
+        analysis = self.analyze(text)
+        return {
+            key: analysis[key]
+            for key in ('grammar_issues', 'passive_voice', 'readability_scores', 'style_suggestions')
+        }
+
+    def analyze(self, text: str) -> Dict:
+        """
+        Run every grammar-related check on a text once and return the results together.
+
+        LanguageTool, the spell checker, spaCy and textstat each run at most
+        once per text; the result is kept for the most recent texts, so later
+        calls with the same text are answered from memory. Every call returns
+        its own copy, which the caller may change freely. Analyses in which
+        any check failed are not kept, so a transient error is retried on the
+        next call.
+        
+        Args:
+            text (str): Text to analyze
+            
+        Returns:
+            Dict: 'grammar_issues' (detailed LanguageTool issues), 'grammar_spelling_issues'
+                (grammar and spelling issues excluding proper nouns, as returned by
+                check_text_grammar_spelling), 'spelling_issues', 'passive_voice',
+                'readability_scores' and 'style_suggestions'
+        """
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        with self._analyses_lock:
+            if key in self._analyses:
+                self._analyses.move_to_end(key)
+                return copy.deepcopy(self._analyses[key])
+
+        failed = False
+        try:
+            matches = self._grammar_matches(text)
+        except Exception as e:
+            logging.error(f"Grammar check error: {str(e)}")
+            matches = []
+            failed = True
+
+        try:
+            grammar_spelling_issues = check_text_grammar_spelling(text, grammar_matches=matches)
+        except Exception as e:
+            logging.error(f"Spelling check error: {str(e)}")
+            grammar_spelling_issues = []
+            failed = True
+
+        try:
+            passive_voice = self._passive_sentences(text)
+        except Exception as e:
+            logging.error(f"Passive voice check error: {str(e)}")
+            passive_voice = []
+            failed = True
+
+        try:
+            readability_scores = self._readability_scores(text)
+        except Exception as e:
+            logging.error(f"Readability analysis error: {str(e)}")
+            readability_scores = {}
+            failed = True
+
+        analysis = {
+            'grammar_issues': self._grammar_issues(matches),
+            'grammar_spelling_issues': grammar_spelling_issues,
+            'spelling_issues': [issue for issue in grammar_spelling_issues if issue['type'] == 'Spelling'],
+            'passive_voice': passive_voice,
+            'readability_scores': readability_scores,
             'style_suggestions': []
         }
         
         # Add style suggestions based on analysis
-        readability = suggestions['readability_scores'].get('Flesch Reading Ease', 0)
+        readability = analysis['readability_scores'].get('Flesch Reading Ease', 0)
         if readability < 40:
-            suggestions['style_suggestions'].append("Consider simplifying language for better readability")
+            analysis['style_suggestions'].append("Consider simplifying language for better readability")
         
-        if len(suggestions['passive_voice']) > 2:
-            suggestions['style_suggestions'].append("Consider reducing use of passive voice")
-        
-        return suggestions
+        if len(analysis['passive_voice']) > 2:
+            analysis['style_suggestions'].append("Consider reducing use of passive voice")
+
+        if failed:
+            return analysis
+        with self._analyses_lock:
+            self._analyses[key] = analysis
+            while len(self._analyses) > self.ANALYSIS_CACHE_SIZE:
+                self._analyses.popitem(last=False)
+        return copy.deepcopy(analysis)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.tool.close()
\ No newline at end of file
+        # The shared pool outlives any single checker
+        if self.tool is not get_language_tool_pool():
+            self.tool.close()
\ No newline at end of file
@@ -0,0 +1,214 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional
+import language_tool_python
+
+# Pool settings, overridable through the environment
+POOL_SIZE = int(os.environ.get('LANGUAGE_TOOL_POOL_SIZE', 2))
+CHECK_TIMEOUT = float(os.environ.get('LANGUAGE_TOOL_CHECK_TIMEOUT', 30))
+ACQUIRE_TIMEOUT = float(os.environ.get('LANGUAGE_TOOL_ACQUIRE_TIMEOUT', 60))
+
+class _PooledTool:
+    """A LanguageTool instance together with the thread that runs its checks."""
+
+    def __init__(self, tool):
+        self.tool = tool
+        self.last_checked = time.monotonic()
+        # One long-lived thread per instance: checks on an instance never overlap, and
+        # a hung check only blocks the thread of the instance being closed for it
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='languagetool-check')
+
+    def check(self, text: str, timeout: float) -> List:
+        """Run a check on this instance's thread and wait up to timeout seconds."""
+        return self._executor.submit(self.tool.check, text).result(timeout=timeout)
+
+    def close(self) -> None:
+        """Close the instance, which also ends a check still running on its thread."""
+        self._executor.shutdown(wait=False)
+        self.tool.close()
+
+class LanguageToolPool:
+    """
+    Pool of long-lived local LanguageTool servers.
+
+    Starting LanguageTool launches a JVM, which takes seconds, so instances are
+    created on first demand (up to ``size``) and then reused. At most ``size``
+    instances are alive, counting those checked out, so at most ``size``
+    checks run at once. Each instance runs its checks on its own long-lived
+    thread. An instance idle for longer than ``health_check_interval`` is
+    pinged before reuse and replaced if it does not answer. A check exceeding
+    ``check_timeout`` has its server shut down at once, which also ends the
+    request still waiting on it, so a stuck JVM never holds a slot or a thread.
+
+    Latest code's core/language_tool_pool.py follows the same design; the two
+    trees are deployed separately and share no code, so keep them in step.
+    """
+
+    def __init__(self, language: str = 'en-US', size: int = 2, check_timeout: float = 30.0,
+                 acquire_timeout: float = 60.0, health_check_interval: float = 300.0,
+                 factory: Optional[Callable[[str], object]] = None):
+        """
+        Initialize an empty pool; instances are started on demand.
+
+        Args:
+            language (str): LanguageTool language code
+            size (int): Maximum number of instances, and of concurrent checks
+            check_timeout (float): Seconds a single check may take
+            acquire_timeout (float): Seconds to wait for a free instance
+            health_check_interval (float): Idle seconds after which an instance is pinged before use
+            factory (Callable): Creates an instance for a language (defaults to a local LanguageTool server)
+        """
+        self.language = language
+        self.size = max(1, size)
+        self.check_timeout = check_timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._factory = factory or language_tool_python.LanguageTool
+        self._idle: List[_PooledTool] = []  # Most recently used last
+        self._available = threading.Condition()
+        self._created = 0  # Instances started over the pool's lifetime
+        self._live = 0  # Instances alive or being started, idle or checked out
+        self._closed = False
+
+    def warm_up(self, count: int = 1) -> None:
+        """Start instances ahead of the first request; raises if LanguageTool is unavailable."""
+        with self._available:
+            missing = max(min(count, self.size) - self._live, 0)
+            self._live += missing
+        for _ in range(missing):
+            self._release(self._start())
+
+    def _start(self) -> _PooledTool:
+        """Start an instance whose place is already counted in _live, releasing the place if it fails."""
+        try:
+            pooled = _PooledTool(self._factory(self.language))
+        except Exception:
+            with self._available:
+                self._live -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._created += 1
+        return pooled
+
+    def _acquire(self) -> _PooledTool:
+        """Take the most recently used healthy instance, starting one while the pool is not full."""
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._available:
+                while not self._idle and self._live >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if self._closed or remaining <= 0 or not self._available.wait(remaining):
+                        raise TimeoutError("No LanguageTool instance became available")
+                if self._closed:
+                    raise RuntimeError("LanguageTool pool is closed")
+                if not self._idle:
+                    self._live += 1
+                    pooled = None
+                else:
+                    pooled = self._idle.pop()
+
+            if pooled is None:
+                return self._start()
+            if self._is_healthy(pooled):
+                return pooled
+            self._discard(pooled)
+
+    def _release(self, pooled: _PooledTool) -> None:
+        """Return a healthy instance to the pool."""
+        with self._available:
+            if not self._closed:
+                pooled.last_checked = time.monotonic()
+                self._idle.append(pooled)
+                self._available.notify()
+                return
+        self._discard(pooled)
+
+    def _discard(self, pooled: _PooledTool) -> None:
+        """Shut an instance down and free its place."""
+        with self._available:
+            self._live -= 1
+            self._available.notify()
+        try:
+            pooled.close()
+        except Exception as e:
+            logging.warning(f"Failed to close LanguageTool instance: {str(e)}")
+
+    def _is_healthy(self, pooled: _PooledTool) -> bool:
+        """Ping an instance that has been idle for a while."""
+        if time.monotonic() - pooled.last_checked < self.health_check_interval:
+            return True
+        try:
+            pooled.check('Health check.', self.check_timeout)
+            return True
+        except Exception as e:
+            logging.warning(f"LanguageTool instance failed its health check: {str(e)}")
+            return False
+
+    def check(self, text: str, timeout: Optional[float] = None) -> List:
+        """
+        Check text on a pooled instance.
+
+        Args:
+            text (str): Text to check
+            timeout (float): Seconds to wait for the result (defaults to check_timeout)
+
+        Returns:
+            List: LanguageTool matches for text
+
+        Raises:
+            TimeoutError: if no instance became free or the check took too long
+        """
+        timeout = timeout or self.check_timeout
+        pooled = self._acquire()
+        try:
+            matches = pooled.check(text, timeout)
+        except FutureTimeoutError:
+            # Closed right away so the request stuck on this server is released
+            self._discard(pooled)
+            raise TimeoutError(f"LanguageTool check exceeded {timeout}s")
+        except Exception:
+            self._discard(pooled)
+            raise
+        self._release(pooled)
+        return matches
+
+    def close(self) -> None:
+        """Shut down every idle instance; busy ones are closed when their check ends."""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def stats(self) -> dict:
+        """Pool size and instance counters."""
+        with self._available:
+            return {
+                'size': self.size,
+                'idle': len(self._idle),
+                'live': self._live,
+                'created': self._created
+            }
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_language_tool_pool() -> LanguageToolPool:
+    """Return the process-wide LanguageTool pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = LanguageToolPool(
+                language='en-US',
+                size=POOL_SIZE,
+                check_timeout=CHECK_TIMEOUT,
+                acquire_timeout=ACQUIRE_TIMEOUT
+            )
+            atexit.register(_pool.close)
+        return _pool
@@ -1,8 +1,8 @@
-import language_tool_python
-from textblob import TextBlob
-import spacy
-
-nlp = spacy.load("en_core_web_sm")
+import bisect
+from Grammar.language_tool_pool import get_language_tool_pool
+from Grammar.sentence_cache import sentence_spans
+from Grammar.spacy_registry import get_doc
+from Grammar.spell_checker import get_spell_checker
 
 # Custom whitelist for proper nouns
 # CUSTOM_PROPER_NOUNS = {"Codeforces", "Codechef", "LinkedIn"}
@@ -10,7 +10,8 @@ CUSTOM_PROPER_NOUNS = {}
 
 def extract_proper_nouns(text):
     """Extract proper nouns using spaCy and custom whitelist."""
-    doc = nlp(text)
+    # Shared with the other checkers analysing the same text; the model loads on first use
+    doc = get_doc(text)
     proper_nouns = {token.text for token in doc if token.pos_ == "PROPN"}
     return proper_nouns.union(CUSTOM_PROPER_NOUNS)
 
@@ -20,15 +21,26 @@ def trim_context(context, error_offset, max_length=50):
     end = min(start + max_length, len(context))
     return "..." + context[start:end].strip() + "..."
 
-def check_text_grammar_spelling(text: str):
-    tool = language_tool_python.LanguageTool('en-US')
+def check_text_grammar_spelling(text: str, grammar_matches=None):
+    """
+    Report grammar and spelling issues, skipping those involving proper nouns.
+
+    Args:
+        text (str): Text to check
+        grammar_matches (List): LanguageTool matches already computed for text (checked here if None)
+
+    Returns:
+        List[Dict]: Issues of type "Grammar" followed by issues of type "Spelling"
+    """
     results = []
 
     # Extract proper nouns
     proper_nouns = extract_proper_nouns(text)
 
     # Check grammar issues using LanguageTool
-    grammar_matches = tool.check(text)
+    if grammar_matches is None:
+        # Long-lived servers from the shared pool instead of a new JVM per call
+        grammar_matches = get_language_tool_pool().check(text)
     for match in grammar_matches:
         trimmed_context = trim_context(match.context, match.offset)
 
@@ -43,19 +55,20 @@ def check_text_grammar_spelling(text: str):
             "suggestions": match.replacements
         })
 
-    # Check spelling issues using TextBlob
-    blob = TextBlob(text)
-    for sentence in blob.sentences:
-        corrected = sentence.correct()
-        for original_word, corrected_word in zip(sentence.words, corrected.words):
-            if original_word != corrected_word and original_word not in proper_nouns:
-                trimmed_context = trim_context(str(sentence), str(sentence).find(original_word))
-                results.append({
-                    "type": "Spelling",
-                    "context": trimmed_context,
-                    "issue": f"Spelling mistake: '{original_word}'",
-                    "suggestions": [corrected_word]
-                })
+    # Check spelling issues against the symmetric-delete dictionary index
+    spans = sentence_spans(text)
+    span_starts = [start for start, _ in spans]
+    for misspelling in get_spell_checker().check(text, ignore=proper_nouns):
+        index = bisect.bisect_right(span_starts, misspelling.offset) - 1
+        start, end = spans[index] if index >= 0 else (0, len(text))
+        sentence = text[start:end]
+        trimmed_context = trim_context(sentence, misspelling.offset - start)
+        results.append({
+            "type": "Spelling",
+            "context": trimmed_context,
+            "issue": f"Spelling mistake: '{misspelling.word}'",
+            "suggestions": [misspelling.suggestion]
+        })
 
     return results
 
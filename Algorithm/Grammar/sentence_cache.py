@@ -0,0 +1,232 @@
+import bisect
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import nltk
+
+# Cache settings, overridable through the environment
+CACHE_SIZE = int(os.environ.get('GRAMMAR_CACHE_SIZE', 20000))
+CACHE_DB = os.environ.get('GRAMMAR_CACHE_DB')
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Split text into sentence spans with nltk.sent_tokenize.
+
+    Sentences may run across line breaks, so a sentence wrapped over several
+    lines is checked as a whole. Latest code's core/grammar_cache.py splits
+    sentences the same way; the two trees share no code, so keep them in step.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) offsets of the sentences in text
+    """
+    spans = []
+    position = 0
+    for sentence in nltk.sent_tokenize(text):
+        start = text.find(sentence, position)
+        if start == -1:
+            continue
+        spans.append((start, start + len(sentence)))
+        position = start + len(sentence)
+    return spans
+
+# Characters of document text kept on each side of an error in a match's context
+CONTEXT_CHARS = 40
+
+def relocate_match(match, offset: int, text: str, start: int, end: int):
+    """
+    Copy of a LanguageTool match moved into text.
+
+    The context and sentence are rebuilt from text, so a match never carries
+    text from the request it was found in.
+
+    Args:
+        match: LanguageTool match
+        offset (int): Offset of the error in text
+        text (str): Text the match is moved into
+        start (int): Offset of the match's sentence in text
+        end (int): End of the match's sentence in text
+
+    Returns:
+        Match: The relocated copy
+    """
+    relocated = copy.copy(match)
+    context_start = max(offset - CONTEXT_CHARS, 0)
+    relocated.offset = offset
+    relocated.context = text[context_start:offset + match.errorLength + CONTEXT_CHARS]
+    relocated.offsetInContext = offset - context_start
+    relocated.sentence = text[start:end]
+    return relocated
+
+class SentenceMatchStore:
+    """
+    Bounded LRU of per-sentence matches with an optional SQLite backing file.
+    """
+
+    def __init__(self, max_size: int = CACHE_SIZE, db_path: Optional[str] = CACHE_DB):
+        """
+        Initialize the store.
+
+        Args:
+            max_size (int): Sentences kept in memory
+            db_path (str): SQLite file persisting matches across runs (None disables it)
+        """
+        self.max_size = max_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+
+        if db_path:
+            try:
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute('PRAGMA journal_mode=WAL')
+                self._conn.execute(
+                    'CREATE TABLE IF NOT EXISTS grammar_matches (key TEXT PRIMARY KEY, value BLOB NOT NULL)'
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Grammar cache database unavailable, using memory only: {str(e)}")
+                self._conn = None
+
+    def get(self, key: str) -> Optional[List]:
+        """Return the cached matches for key, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute('SELECT value FROM grammar_matches WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    self.hits += 1
+                    value = pickle.loads(row[0])
+                    self._remember(key, value)
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put_many(self, entries: Dict[str, List]) -> None:
+        """Store the matches of several sentences in one transaction."""
+        with self._lock:
+            for key, value in entries.items():
+                self._remember(key, value)
+            if self._conn is not None:
+                try:
+                    self._conn.executemany(
+                        'INSERT OR REPLACE INTO grammar_matches (key, value) VALUES (?, ?)',
+                        [(key, pickle.dumps(value)) for key, value in entries.items()]
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logging.warning(f"Grammar cache write failed: {str(e)}")
+
+    def _remember(self, key: str, value: List) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+class SentenceGrammarCache:
+    """
+    Check grammar sentence by sentence, reusing the matches of sentences seen before.
+
+    Each sentence's LanguageTool matches are cached under a hash of its text
+    with offsets and context relative to the sentence. Only sentences missing from the
+    cache are sent to the checker, joined into a single request, and every
+    match is moved back to its position in the full document.
+    """
+
+    SEPARATOR = '\n\n'
+
+    def __init__(self, check: Callable[[str], List], store: Optional[SentenceMatchStore] = None,
+                 language: str = 'en-US'):
+        """
+        Initialize the cache.
+
+        Args:
+            check (Callable): Function returning LanguageTool matches for a text
+            store (SentenceMatchStore): Where matches are kept (a new in-memory store by default)
+            language (str): Language mixed into the keys
+        """
+        self._check = check
+        self.store = store or SentenceMatchStore()
+        self.language = language
+
+    # Part of every key; bump to ignore entries stored in an older format
+    KEY_VERSION = 2
+
+    def _key(self, sentence: str) -> str:
+        return f"v{self.KEY_VERSION}:{self.language}:{hashlib.sha256(sentence.encode('utf-8')).hexdigest()}"
+
+    def check(self, text: str) -> List:
+        """
+        Check text, sending only uncached sentences to LanguageTool.
+
+        Args:
+            text (str): Text to analyze
+
+        Returns:
+            List: LanguageTool matches with offsets into text
+        """
+        spans = sentence_spans(text)
+        sentence_matches: Dict[str, List] = {}
+        misses = []
+
+        for start, end in spans:
+            sentence = text[start:end]
+            if sentence in sentence_matches:
+                continue
+            cached = self.store.get(self._key(sentence))
+            if cached is None:
+                misses.append(sentence)
+                sentence_matches[sentence] = []
+            else:
+                sentence_matches[sentence] = cached
+
+        if misses:
+            checked = self._check_sentences(misses)
+            sentence_matches.update(checked)
+            self.store.put_many({self._key(sentence): matches for sentence, matches in checked.items()})
+
+        return [
+            relocate_match(match, match.offset + start, text, start, end)
+            for start, end in spans
+            for match in sentence_matches[text[start:end]]
+        ]
+
+    def _check_sentences(self, sentences: List[str]) -> Dict[str, List]:
+        """
+        Check sentences in one request and split the matches back per sentence.
+
+        Matches are stored relative to their own sentence, with the context
+        rebuilt from that sentence alone, since the joined request holds
+        sentences from other documents.
+        """
+        starts = []
+        position = 0
+        for sentence in sentences:
+            starts.append(position)
+            position += len(sentence) + len(self.SEPARATOR)
+
+        results: Dict[str, List] = {sentence: [] for sentence in sentences}
+        for match in self._check(self.SEPARATOR.join(sentences)):
+            index = bisect.bisect_right(starts, match.offset) - 1
+            sentence = sentences[index]
+            # Matches reaching into the separator belong to no sentence
+            if match.offset - starts[index] + match.errorLength <= len(sentence):
+                results[sentence].append(
+                    relocate_match(match, match.offset - starts[index], sentence, 0, len(sentence))
+                )
+        return results
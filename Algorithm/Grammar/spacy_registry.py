@@ -0,0 +1,90 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict
+import spacy
+
+DEFAULT_MODEL = 'en_core_web_sm'
+# Annotated documents kept for reuse, overridable through the environment
+DOC_CACHE_SIZE = int(os.environ.get('SPACY_DOC_CACHE_SIZE', 16))
+
+_models: Dict[str, object] = {}
+_models_lock = threading.Lock()
+
+def get_model(name: str = DEFAULT_MODEL):
+    """
+    Return the process-wide instance of a spaCy model, loading it on first call.
+
+    Args:
+        name (str): spaCy model name
+
+    Returns:
+        Language: The loaded pipeline, shared by every caller
+    """
+    with _models_lock:
+        if name not in _models:
+            _models[name] = spacy.load(name)
+        return _models[name]
+
+class DocCache:
+    """
+    Bounded LRU of spaCy Docs keyed by model and text.
+
+    One analysis hands the same resume text to several checkers (proper-noun
+    extraction, keyword analysis, passive voice, LinkedIn readability); the
+    first one pays for the annotation and the others reuse its Doc.
+    """
+
+    def __init__(self, max_size: int = DOC_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int): Documents kept in memory
+        """
+        self.max_size = max_size
+        self._docs = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, model: str = DEFAULT_MODEL):
+        """
+        Return the Doc of text, annotating it only if it is not cached.
+
+        Args:
+            text (str): Text to annotate
+            model (str): spaCy model name
+
+        Returns:
+            Doc: The annotated text; treat it as read-only since it is shared
+        """
+        key = (model, hashlib.sha256(text.encode('utf-8')).hexdigest())
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is not None:
+                self._docs.move_to_end(key)
+                self.hits += 1
+                return doc
+            self.misses += 1
+
+        doc = get_model(model)(text)
+
+        with self._lock:
+            self._docs[key] = doc
+            self._docs.move_to_end(key)
+            while len(self._docs) > self.max_size:
+                self._docs.popitem(last=False)
+        return doc
+
+    def clear(self) -> None:
+        """Drop every cached Doc."""
+        with self._lock:
+            self._docs.clear()
+
+_doc_cache = DocCache()
+
+def get_doc(text: str, model: str = DEFAULT_MODEL):
+    """Return the shared Doc of text from the process-wide cache."""
+    return _doc_cache.get(text, model)
@@ -0,0 +1,376 @@
+import logging
+import os
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Spell checker settings, overridable through the environment
+MAX_EDIT_DISTANCE = int(os.environ.get('SPELLING_MAX_EDIT_DISTANCE', 2))
+PREFIX_LENGTH = int(os.environ.get('SPELLING_PREFIX_LENGTH', 7))
+# Word frequency list ("word count" per line); defaults to the one shipped with TextBlob
+DICTIONARY_PATH = os.environ.get('SPELLING_DICTIONARY')
+# Symmetric-delete index of the frequency list, built offline by python -m Grammar.spell_checker
+INDEX_PATH = os.environ.get(
+    'SPELLING_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spelling_index.pickle')
+)
+# Extra vocabulary files, separated by os.pathsep
+VOCABULARY_PATHS = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tech_vocabulary.txt')
+] + [path for path in os.environ.get('SPELLING_VOCABULARY', '').split(os.pathsep) if path]
+
+# Inflections accepted when the word without them is known (the dictionary lists mostly base forms)
+INFLECTION_SUFFIXES = ('s', 'es', 'ed', 'ing')
+
+# Words written in letters only, with an optional possessive or contraction; tokens that touch
+# digits, '@' or a preceding '.' (e-mail addresses, URLs, version numbers) are left out
+_WORD_PATTERN = re.compile(r"(?<![\w@.])[A-Za-z]+(?:['’][A-Za-z]+)?(?![\w@])")
+_APOSTROPHE = re.compile(r"['’]")
+
+@dataclass
+class Misspelling:
+    """A word missing from the dictionary together with its best correction."""
+    word: str
+    offset: int
+    suggestion: str
+    distance: int
+
+def edit_distance(source: str, target: str, max_distance: int) -> Optional[int]:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions).
+
+    Args:
+        source (str): First word
+        target (str): Second word
+        max_distance (int): Largest distance of interest
+
+    Returns:
+        int: The distance, or None if it exceeds max_distance
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return None
+
+    previous_previous = None
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_min = i
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and j > 1 and source[i - 1] == target[j - 2]
+                    and source[i - 2] == target[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return None
+        previous_previous, previous = previous, current
+
+    distance = previous[len(target)]
+    return distance if distance <= max_distance else None
+
+class SymSpellChecker:
+    """
+    Spell checker based on a precomputed symmetric-delete index (SymSpell).
+
+    Every dictionary word is indexed under the strings obtained by deleting up
+    to ``max_edit_distance`` characters from its first ``prefix_length``
+    characters. Looking a word up only generates the deletes of the word itself
+    and compares it with the dictionary words sharing one of them, instead of
+    generating every insertion, replacement and transposition as Norvig's
+    corrector does, so an unknown word costs a few dozen dictionary probes.
+    Known words cost a single set lookup.
+    """
+
+    def __init__(self, max_edit_distance: int = MAX_EDIT_DISTANCE, prefix_length: int = PREFIX_LENGTH,
+                 lookup_cache_size: int = 10000):
+        """
+        Initialize an empty checker.
+
+        Args:
+            max_edit_distance (int): Largest edit distance of a suggestion
+            prefix_length (int): Characters of each word used to build the index
+            lookup_cache_size (int): Looked-up words whose suggestion is kept in memory
+        """
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = max(prefix_length, max_edit_distance + 1)
+        self.lookup_cache_size = lookup_cache_size
+        self.counts: Dict[str, int] = {}
+        self._deletes: Dict[str, List[str]] = {}
+        self._lookups = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prefix_deletes(self, word: str) -> Set[str]:
+        """Strings obtained by deleting up to max_edit_distance characters from the prefix of word."""
+        prefix = word[:self.prefix_length]
+        deletes = {prefix}
+        frontier = {prefix}
+        for _ in range(self.max_edit_distance):
+            frontier = {
+                candidate[:i] + candidate[i + 1:]
+                for candidate in frontier if len(candidate) > 1
+                for i in range(len(candidate))
+            }
+            deletes |= frontier
+        return deletes
+
+    def add_word(self, word: str, count: int = 1) -> None:
+        """
+        Add a word to the dictionary, or raise the count of a known word.
+
+        Args:
+            word (str): Word to accept (case-insensitive)
+            count (int): Frequency used to rank suggestions
+        """
+        word = word.strip().lower()
+        if not word:
+            return
+        if word in self.counts:
+            self.counts[word] += count
+            return
+
+        self.counts[word] = count
+        for delete in self._prefix_deletes(word):
+            self._deletes.setdefault(delete, []).append(word)
+        self._lookups.clear()
+
+    def add_words(self, words: Iterable[str], count: int = 1) -> None:
+        """Add several words, e.g. technology names or proper nouns."""
+        for word in words:
+            self.add_word(word, count)
+
+    def load_frequency_file(self, path: str) -> int:
+        """
+        Load a "word count" frequency list such as TextBlob's en-spelling.txt.
+
+        Lines starting with ';' or '#' are comments; a missing count counts as 1.
+
+        Args:
+            path (str): Frequency list file
+
+        Returns:
+            int: Number of lines loaded
+        """
+        loaded = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if not parts or parts[0].startswith((';', '#')):
+                    continue
+                count = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
+                self.add_word(parts[0], count)
+                loaded += 1
+        return loaded
+
+    # Bump when the layout written by save changes
+    INDEX_FORMAT = 1
+
+    @classmethod
+    def load(cls, path: str = INDEX_PATH) -> 'SymSpellChecker':
+        """
+        Load an index written by save.
+
+        The index keeps the edit distance and prefix length it was built with.
+
+        Args:
+            path (str): Index file
+
+        Returns:
+            SymSpellChecker: Checker holding the saved dictionary and index
+        """
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+        if data.get('format') != cls.INDEX_FORMAT:
+            raise ValueError(f"Spelling index {path} has format {data.get('format')}, expected {cls.INDEX_FORMAT}")
+        checker = cls(max_edit_distance=data['max_edit_distance'], prefix_length=data['prefix_length'])
+        checker.counts = data['counts']
+        checker._deletes = data['deletes']
+        return checker
+
+    def save(self, path: str = INDEX_PATH) -> None:
+        """Write the dictionary and its index, replacing any previous file atomically."""
+        data = {
+            'format': self.INDEX_FORMAT,
+            'max_edit_distance': self.max_edit_distance,
+            'prefix_length': self.prefix_length,
+            'counts': self.counts,
+            'deletes': self._deletes
+        }
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    def is_known(self, word: str) -> bool:
+        """Whether word (in any case), or the word without a regular inflection, is in the dictionary."""
+        word = word.lower()
+        if word in self.counts:
+            return True
+        return any(
+            word.endswith(suffix) and len(word) - len(suffix) > 2 and word[:-len(suffix)] in self.counts
+            for suffix in INFLECTION_SUFFIXES
+        )
+
+    def lookup(self, word: str) -> Optional[str]:
+        """
+        Return the most frequent dictionary word closest to word.
+
+        Args:
+            word (str): Word to correct
+
+        Returns:
+            str: The word itself if known, its best correction, or None if
+                nothing is within max_edit_distance
+        """
+        word = word.lower()
+        if word in self.counts:
+            return word
+        return self._suggest(word)[0]
+
+    def _suggest(self, word: str) -> Tuple[Optional[str], int]:
+        """Best correction of an unknown lowercase word and its distance, memoized."""
+        with self._lock:
+            if word in self._lookups:
+                self._lookups.move_to_end(word)
+                return self._lookups[word]
+
+        suggestion = self._closest(word)
+
+        with self._lock:
+            self._lookups[word] = suggestion
+            while len(self._lookups) > self.lookup_cache_size:
+                self._lookups.popitem(last=False)
+        return suggestion
+
+    def _closest(self, word: str) -> Tuple[Optional[str], int]:
+        best_word = None
+        best_distance = self.max_edit_distance
+        best_count = 0
+        compared = set()
+        prefix = word[:self.prefix_length]
+
+        # Deletes of the prefix, fewest deletions first
+        candidates = [prefix]
+        queued = {prefix}
+        index = 0
+        while index < len(candidates):
+            candidate = candidates[index]
+            index += 1
+            deleted = len(prefix) - len(candidate)
+            if deleted > best_distance:
+                break
+
+            for suggestion in self._deletes.get(candidate, ()):
+                if suggestion in compared or abs(len(suggestion) - len(word)) > best_distance:
+                    continue
+                compared.add(suggestion)
+                distance = edit_distance(word, suggestion, best_distance)
+                if distance is None:
+                    continue
+                count = self.counts[suggestion]
+                if distance < best_distance or count > best_count or best_word is None:
+                    best_word, best_distance, best_count = suggestion, distance, count
+
+            if deleted < self.max_edit_distance and len(candidate) > 1:
+                for i in range(len(candidate)):
+                    delete = candidate[:i] + candidate[i + 1:]
+                    if delete not in queued:
+                        queued.add(delete)
+                        candidates.append(delete)
+
+        return best_word, best_distance
+
+    def check(self, text: str, ignore: Iterable[str] = (), min_length: int = 3) -> List[Misspelling]:
+        """
+        Find the misspelled words of a text.
+
+        Words in all capitals (acronyms), words shorter than min_length and
+        words in ignore are skipped, as are unknown words with no correction
+        close enough (typically names).
+
+        Args:
+            text (str): Text to check
+            ignore (Iterable[str]): Words to accept for this text only, e.g. proper nouns
+            min_length (int): Shortest word checked
+
+        Returns:
+            List[Misspelling]: Misspelled words in the order they appear
+        """
+        ignored = {word.lower() for word in ignore}
+        results = []
+        for match in _WORD_PATTERN.finditer(text):
+            word = _APOSTROPHE.split(match.group())[0]
+            if len(word) < min_length or word.isupper():
+                continue
+            lower = word.lower()
+            if lower in ignored or self.is_known(lower):
+                continue
+            suggestion, distance = self._suggest(lower)
+            if suggestion is None:
+                continue
+            if word.istitle():  # Preserve capitalization
+                suggestion = suggestion.title()
+            results.append(Misspelling(word=word, offset=match.start(), suggestion=suggestion, distance=distance))
+        return results
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+def default_dictionary_path() -> str:
+    """Return the word frequency list to load (TextBlob's en-spelling.txt unless overridden)."""
+    if DICTIONARY_PATH:
+        return DICTIONARY_PATH
+    import textblob
+    return os.path.join(os.path.dirname(textblob.__file__), 'en', 'en-spelling.txt')
+
+_checker = None
+_checker_lock = threading.Lock()
+
+def build_spell_checker(dictionary_path: Optional[str] = None) -> SymSpellChecker:
+    """Build the index of a word frequency list (the default dictionary if None); takes several seconds."""
+    checker = SymSpellChecker()
+    checker.load_frequency_file(dictionary_path or default_dictionary_path())
+    return checker
+
+def get_spell_checker() -> SymSpellChecker:
+    """
+    Return the process-wide spell checker, loading its index on first call.
+
+    The index of the dictionary is read from INDEX_PATH; if it is missing it
+    is built at runtime instead. The vocabulary files are small and added on
+    every load, so edits to them need no rebuild.
+    """
+    global _checker
+    with _checker_lock:
+        if _checker is None:
+            try:
+                checker = SymSpellChecker.load(INDEX_PATH)
+            except FileNotFoundError:
+                logging.warning(f"No spelling index at {INDEX_PATH}; run python -m Grammar.spell_checker to build one")
+                checker = build_spell_checker()
+            except Exception as e:
+                logging.error(f"Error loading spelling index from {INDEX_PATH}: {e}")
+                checker = build_spell_checker()
+            for path in VOCABULARY_PATHS:
+                try:
+                    checker.load_frequency_file(path)
+                except OSError as e:
+                    logging.error(f"Error loading spelling vocabulary {path}: {e}")
+            _checker = checker
+        return _checker
+
+# Run from the Algorithm directory, e.g. python -m Grammar.spell_checker --dictionary words.txt
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the symmetric-delete index used for spell checking")
+    parser.add_argument('--dictionary', help="Word frequency list (defaults to TextBlob's en-spelling.txt)")
+    parser.add_argument('--output', default=INDEX_PATH, help="Index file to write")
+    args = parser.parse_args()
+
+    checker = build_spell_checker(args.dictionary)
+    checker.save(args.output)
+    print(f"Indexed {len(checker)} words to {args.output}")
@@ -0,0 +1,75 @@
+import re
+import threading
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional
+
+# Runs of word characters, including punctuation inside a run (e.g. "problem-solving", "ci/cd")
+_WORD_RUN = re.compile(r'\w+(?:[^\w\s]+\w+)*')
+_NON_WORD = re.compile(r'[^\w\s]')
+
+_stop_words = None
+_stop_words_lock = threading.Lock()
+
+def english_stop_words() -> FrozenSet[str]:
+    """NLTK's English stopwords, read from the corpus once per process."""
+    global _stop_words
+    with _stop_words_lock:
+        if _stop_words is None:
+            from nltk.corpus import stopwords
+            _stop_words = frozenset(stopwords.words('english'))
+        return _stop_words
+
+class TextNormalizer:
+    """
+    Lowercasing, punctuation handling, stopword removal and lemmatization in one pass.
+
+    The text is lowercased and tokenized by a single precompiled regex; each
+    token is checked against a frozen stopword set and lemmatized through a
+    cache, so repeated words (the common case in resumes and job descriptions)
+    are lemmatized only once per process.
+    """
+
+    def __init__(self, stop_words: Optional[Iterable[str]] = None, lemmatizer=None,
+                 join_punctuation: bool = False, lemma_cache_size: int = 50000):
+        """
+        Initialize the normalizer.
+
+        Args:
+            stop_words (Iterable[str]): Words to drop (defaults to NLTK's English stopwords)
+            lemmatizer: Object with a lemmatize(word) method, e.g. WordNetLemmatizer (None disables lemmatization)
+            join_punctuation (bool): Delete punctuation inside words ("problem-solving" -> "problemsolving")
+                instead of splitting on it ("problem solving")
+            lemma_cache_size (int): Distinct words whose lemma is kept in memory
+        """
+        self.stop_words = frozenset(stop_words) if stop_words is not None else english_stop_words()
+        self.join_punctuation = join_punctuation
+        self._lemmatize = lru_cache(maxsize=lemma_cache_size)(lemmatizer.lemmatize) if lemmatizer else None
+
+    def tokens(self, text: str) -> List[str]:
+        """
+        Normalized tokens of a text.
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            List[str]: Lowercased, lemmatized tokens without stopwords or punctuation
+        """
+        stop_words = self.stop_words
+        lemmatize = self._lemmatize
+        result = []
+        for run in _WORD_RUN.findall(text.lower()):
+            if run.isalnum():
+                words = (run,)
+            elif self.join_punctuation:
+                words = (_NON_WORD.sub('', run),)
+            else:
+                words = _NON_WORD.sub(' ', run).split()
+            for word in words:
+                if word not in stop_words:
+                    result.append(lemmatize(word) if lemmatize else word)
+        return result
+
+    def normalize(self, text: str) -> str:
+        """Normalized tokens of a text joined by single spaces."""
+        return ' '.join(self.tokens(text))
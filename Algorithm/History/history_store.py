@@ -0,0 +1,353 @@
+import glob
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+@dataclass
+class HistoryEntry:
+    """One analysis of a file."""
+    file_hash: str
+    filename: str
+    last_checked: str
+    result: Dict
+
+    def to_dict(self) -> Dict:
+        """Return the entry in the layout used by file_history.json."""
+        return {
+            'filename': self.filename,
+            'last_checked': self.last_checked,
+            'result': self.result
+        }
+
+class HistoryStore:
+    """
+    Append-only analysis history backed by SQLite.
+
+    Every analysis is inserted as a new row, so saving never rewrites earlier
+    entries. Rows are indexed by file hash and by date, and old rows are
+    dropped by retention rules instead of the file growing without bound.
+    The database runs in WAL mode and each thread uses its own connection, so
+    concurrent requests can read while another one writes.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            file_hash TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            last_checked TEXT NOT NULL,
+            result TEXT NOT NULL,
+            UNIQUE (file_hash, last_checked)
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_last_checked ON history (last_checked);
+    '''
+
+    # Schema changes applied in order to databases created by older versions, one list of statements each
+    MIGRATIONS = [
+        [
+            'ALTER TABLE history ADD COLUMN analysis_key TEXT',
+            'CREATE INDEX IF NOT EXISTS idx_history_analysis_key ON history (analysis_key, last_checked)',
+        ],
+    ]
+
+    def __init__(self, db_path: str = 'file_history.db', retention_days: Optional[int] = None,
+                 max_entries_per_file: Optional[int] = None, memory_entries: int = 256,
+                 retention_interval: int = 100):
+        """
+        Open (and create if needed) the history database.
+
+        Args:
+            db_path (str): SQLite database file
+            retention_days (int): Age after which entries are removed by apply_retention
+            max_entries_per_file (int): Entries kept per file hash by apply_retention
+            memory_entries (int): Recent results kept in memory for lookup()
+            retention_interval (int): apply_retention runs again after this many add() calls
+        """
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self.max_entries_per_file = max_entries_per_file
+        self.memory_entries = memory_entries
+        self._local = threading.local()
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+        self.retention_interval = retention_interval
+        self._adds_since_retention = 0
+        self._retention_lock = threading.Lock()
+
+        with self._connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+            self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """
+        Bring an existing database up to the current schema version.
+
+        The migrations run in one write transaction and the version is read
+        again once the write lock is held, so workers starting together on
+        the same database apply each migration exactly once.
+        """
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= len(self.MIGRATIONS):
+            return
+        conn.commit()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for number, statements in enumerate(self.MIGRATIONS[version:], start=version + 1):
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute(f'PRAGMA user_version = {number}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def add(self, file_hash: str, filename: str, result: Dict, last_checked: Optional[str] = None,
+            analysis_key: Optional[str] = None) -> None:
+        """
+        Append an analysis result.
+
+        Args:
+            file_hash (str): Hash of the analysed file
+            filename (str): Name of the analysed file
+            result (Dict): Analysis result
+            last_checked (str): ISO timestamp of the analysis (defaults to now)
+            analysis_key (str): Key under which lookup() finds this result again
+        """
+        last_checked = last_checked or datetime.now().isoformat()
+        serialized = json.dumps(result)
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO history (file_hash, filename, last_checked, result, analysis_key) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (file_hash, filename, last_checked, serialized, analysis_key)
+            )
+        if analysis_key:
+            self._remember(analysis_key, last_checked, serialized)
+
+        # Long-running servers keep one store per worker, so retention cannot only run at startup
+        with self._retention_lock:
+            self._adds_since_retention += 1
+            due = self._adds_since_retention >= self.retention_interval
+            if due:
+                self._adds_since_retention = 0
+        if due:
+            self.apply_retention()
+
+    def lookup(self, analysis_key: str, max_age: Optional[timedelta] = None) -> Optional[Dict]:
+        """
+        Return the latest result stored under an analysis key, if still fresh.
+
+        Recent results are answered from memory; older ones from the index on
+        analysis_key. Results are kept serialized, so every call returns a new
+        dict the caller is free to change. Results older than retention_days
+        are missing even before apply_retention has removed them, in memory
+        as in the database.
+
+        Args:
+            analysis_key (str): Key passed to add()
+            max_age (timedelta): Results older than this are treated as missing (None accepts any age)
+
+        Returns:
+            Dict: The stored result, or None
+        """
+        with self._recent_lock:
+            entry = self._recent.get(analysis_key)
+            if entry is not None:
+                self._recent.move_to_end(analysis_key)
+
+        if entry is None:
+            row = self._connection().execute(
+                'SELECT last_checked, result FROM history WHERE analysis_key = ? '
+                'ORDER BY last_checked DESC LIMIT 1',
+                (analysis_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            entry = (row[0], row[1])
+            self._remember(analysis_key, *entry)
+
+        last_checked, serialized = entry
+        if self.retention_days is not None:
+            retention_age = timedelta(days=self.retention_days)
+            max_age = retention_age if max_age is None else min(max_age, retention_age)
+        if max_age is not None and datetime.fromisoformat(last_checked) < datetime.now() - max_age:
+            return None
+        return json.loads(serialized)
+
+    def _remember(self, analysis_key: str, last_checked: str, serialized: str) -> None:
+        with self._recent_lock:
+            self._recent[analysis_key] = (last_checked, serialized)
+            self._recent.move_to_end(analysis_key)
+            while len(self._recent) > self.memory_entries:
+                self._recent.popitem(last=False)
+
+    def clear_memory(self) -> None:
+        """Forget the in-memory results, e.g. after a configuration change."""
+        with self._recent_lock:
+            self._recent.clear()
+
+    def latest(self, file_hash: str) -> Optional[HistoryEntry]:
+        """Return the most recent analysis of a file, if any."""
+        row = self._connection().execute(
+            'SELECT file_hash, filename, last_checked, result FROM history '
+            'WHERE file_hash = ? ORDER BY last_checked DESC LIMIT 1',
+            (file_hash,)
+        ).fetchone()
+        return self._entry(row) if row else None
+
+    def entries_for(self, file_hash: str) -> List[HistoryEntry]:
+        """Return every analysis of a file, newest first."""
+        rows = self._connection().execute(
+            'SELECT file_hash, filename, last_checked, result FROM history '
+            'WHERE file_hash = ? ORDER BY last_checked DESC',
+            (file_hash,)
+        ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def between(self, start: datetime, end: Optional[datetime] = None) -> List[HistoryEntry]:
+        """
+        Return analyses performed in a date range, oldest first.
+
+        Args:
+            start (datetime): Inclusive lower bound
+            end (datetime): Exclusive upper bound (defaults to no bound)
+        """
+        end_value = end.isoformat() if end else '9999'
+        rows = self._connection().execute(
+            'SELECT file_hash, filename, last_checked, result FROM history '
+            'WHERE last_checked >= ? AND last_checked < ? ORDER BY last_checked',
+            (start.isoformat(), end_value)
+        ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def apply_retention(self) -> int:
+        """
+        Remove entries older than retention_days and beyond max_entries_per_file.
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        with self._connection() as conn:
+            if self.retention_days is not None:
+                cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+                removed += conn.execute('DELETE FROM history WHERE last_checked < ?', (cutoff,)).rowcount
+            if self.max_entries_per_file is not None:
+                removed += conn.execute(
+                    'DELETE FROM history WHERE id IN ('
+                    ' SELECT id FROM (SELECT id, ROW_NUMBER() OVER ('
+                    '  PARTITION BY file_hash ORDER BY last_checked DESC) AS position FROM history)'
+                    ' WHERE position > ?)',
+                    (self.max_entries_per_file,)
+                ).rowcount
+        if removed:
+            # The memory tier may hold some of the removed results
+            self.clear_memory()
+        return removed
+
+    def import_json(self, paths: Iterable[str]) -> int:
+        """
+        Import legacy file_history.json files and their backup snapshots.
+
+        Entries already present (same hash and timestamp) are skipped, so the
+        import can safely be repeated.
+
+        Args:
+            paths (Iterable[str]): JSON files or glob patterns
+
+        Returns:
+            int: Number of entries added
+        """
+        added = 0
+        for pattern in paths:
+            for path in sorted(glob.glob(pattern)):
+                try:
+                    with open(path, 'r') as f:
+                        history = json.load(f)
+                except Exception as e:
+                    logging.error(f"Error reading history file {path}: {e}")
+                    continue
+
+                rows = [
+                    (file_hash, entry.get('filename', ''), entry.get('last_checked', ''), json.dumps(entry.get('result', {})))
+                    for file_hash, entry in history.items()
+                ]
+                with self._connection() as conn:
+                    before = conn.total_changes
+                    conn.executemany(
+                        'INSERT OR IGNORE INTO history (file_hash, filename, last_checked, result) VALUES (?, ?, ?, ?)',
+                        rows
+                    )
+                    added += conn.total_changes - before
+        return added
+
+    def export_json(self, path: str) -> None:
+        """Write the latest entry per file in the legacy file_history.json layout."""
+        rows = self._connection().execute(
+            'SELECT file_hash, filename, MAX(last_checked), result FROM history GROUP BY file_hash'
+        ).fetchall()
+        with open(path, 'w') as f:
+            json.dump({row[0]: self._entry(row).to_dict() for row in rows}, f, indent=4)
+
+    def backup(self, path: str) -> None:
+        """Write a consistent copy of the database, even while other threads write."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        target = sqlite3.connect(path)
+        try:
+            self._connection().backup(target)
+        finally:
+            target.close()
+
+    def __len__(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM history').fetchone()[0]
+
+    @staticmethod
+    def _entry(row) -> HistoryEntry:
+        return HistoryEntry(file_hash=row[0], filename=row[1], last_checked=row[2], result=json.loads(row[3]))
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Maintain the analysis history database")
+    parser.add_argument('--db', default='file_history.db', help="History database file")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    import_parser = subparsers.add_parser('import', help="Import legacy JSON history files")
+    import_parser.add_argument('paths', nargs='+', help="JSON files or glob patterns")
+    backup_parser = subparsers.add_parser('backup', help="Write a consistent copy of the database")
+    backup_parser.add_argument('path', help="Destination database file")
+    retention_parser = subparsers.add_parser('retention', help="Apply retention rules")
+    retention_parser.add_argument('--days', type=int, help="Remove entries older than this many days")
+    retention_parser.add_argument('--per-file', type=int, help="Entries kept per file hash")
+    export_parser = subparsers.add_parser('export', help="Export the latest entry per file as JSON")
+    export_parser.add_argument('path', help="Destination JSON file")
+    args = parser.parse_args()
+
+    if args.command == 'retention':
+        store = HistoryStore(args.db, retention_days=args.days, max_entries_per_file=args.per_file)
+        print(f"Removed {store.apply_retention()} entries")
+    else:
+        store = HistoryStore(args.db)
+        if args.command == 'import':
+            print(f"Imported {store.import_json(args.paths)} entries")
+        elif args.command == 'backup':
+            store.backup(args.path)
+            print(f"Backed up {len(store)} entries to {args.path}")
+        elif args.command == 'export':
+            store.export_json(args.path)
+            print(f"Exported history to {args.path}")
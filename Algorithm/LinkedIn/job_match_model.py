@@ -0,0 +1,135 @@
+import hashlib
+import logging
+import os
+import threading
+from typing import Iterable, Optional
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+MODEL_PATH = os.environ.get(
+    'JOB_MATCH_MODEL_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_match_tfidf.joblib')
+)
+MAX_FEATURES = int(os.environ.get('JOB_MATCH_MAX_FEATURES', 20000))
+
+class JobMatchModel:
+    """
+    TF-IDF vectorizer fitted offline on preprocessed resumes and job descriptions.
+
+    Profiles and job descriptions are only transformed at runtime, so the
+    IDF reflects the whole corpus instead of the two compared texts and the
+    vocabulary is not rebuilt for every comparison. Without a fitted
+    vectorizer each comparison is fitted on its own two texts, as before.
+    """
+
+    def __init__(self, vectorizer: Optional[TfidfVectorizer] = None, version: str = 'two-document'):
+        """
+        Initialize the model.
+
+        Args:
+            vectorizer (TfidfVectorizer): Fitted vectorizer, or None for the two-document fallback
+            version (str): Identifies the fitted model
+        """
+        self.vectorizer = vectorizer
+        self.version = version
+
+    @classmethod
+    def fit(cls, documents: Iterable[str], max_features: int = MAX_FEATURES, min_df: int = 2) -> 'JobMatchModel':
+        """
+        Fit a model on a corpus.
+
+        Args:
+            documents (Iterable[str]): Texts already passed through LinkedInProfileAnalyzer.preprocess_text
+            max_features (int): Vocabulary size
+            min_df (int): Minimum number of documents a term must appear in
+
+        Returns:
+            JobMatchModel: The fitted model
+        """
+        vectorizer = TfidfVectorizer(max_features=max_features, min_df=min_df, sublinear_tf=True)
+        vectorizer.fit(documents)
+        return cls(vectorizer)
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> 'JobMatchModel':
+        """Load a model written by save."""
+        with open(path, 'rb') as f:
+            version = hashlib.sha256(f.read()).hexdigest()[:16]
+        return cls(joblib.load(path), version)
+
+    def save(self, path: str = MODEL_PATH) -> None:
+        """Write the fitted vectorizer, replacing any previous model atomically."""
+        if self.vectorizer is None:
+            raise ValueError("Only a fitted model can be saved")
+        temp_path = f'{path}.tmp'
+        joblib.dump(self.vectorizer, temp_path)
+        os.replace(temp_path, path)
+
+    def similarity(self, first: str, second: str) -> float:
+        """
+        Cosine similarity of two preprocessed texts.
+
+        Args:
+            first (str): Preprocessed text
+            second (str): Preprocessed text
+
+        Returns:
+            float: Similarity between 0 and 1
+        """
+        if self.vectorizer is not None:
+            matrix = self.vectorizer.transform([first, second])
+        else:
+            matrix = TfidfVectorizer().fit_transform([first, second])
+        return float(cosine_similarity(matrix[0:1], matrix[1:2])[0][0])
+
+_model = None
+_model_lock = threading.Lock()
+
+def get_job_match_model() -> JobMatchModel:
+    """Load the persisted model once per process, falling back to two-document fits if it is missing."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            try:
+                _model = JobMatchModel.load(MODEL_PATH)
+            except FileNotFoundError:
+                logging.warning(f"No job match model at {MODEL_PATH}; run python -m LinkedIn.job_match_model to fit one")
+                _model = JobMatchModel()
+            except Exception as e:
+                logging.error(f"Error loading job match model from {MODEL_PATH}: {e}")
+                _model = JobMatchModel()
+        return _model
+
+# Run from the Algorithm directory, e.g. python -m LinkedIn.job_match_model "corpus/resumes/*.pdf" "corpus/jobs/*.txt"
+if __name__ == '__main__':
+    import argparse
+    import glob
+    from nltk.stem import WordNetLemmatizer
+    from Format.parsed_document import ParsedDocument
+    from Grammar.text_normalizer import TextNormalizer
+
+    parser = argparse.ArgumentParser(description="Fit the TF-IDF model used for LinkedIn job matching")
+    parser.add_argument('paths', nargs='+', help="Resume and job description files (PDF, DOCX or TXT) or glob patterns")
+    parser.add_argument('--output', default=MODEL_PATH, help="Model file to write")
+    parser.add_argument('--max-features', type=int, default=MAX_FEATURES, help="Vocabulary size")
+    parser.add_argument('--min-df', type=int, default=2, help="Minimum number of documents a term must appear in")
+    args = parser.parse_args()
+
+    # Same normalization as LinkedInProfileAnalyzer.preprocess_text
+    normalizer = TextNormalizer(lemmatizer=WordNetLemmatizer())
+    documents = []
+    for path in (path for pattern in args.paths for path in sorted(glob.glob(pattern))):
+        try:
+            with ParsedDocument.from_file(path) as document:
+                text = normalizer.normalize(document.text)
+        except Exception as e:
+            logging.error(f"Skipping {path}: {e}")
+            continue
+        if text:
+            documents.append(text)
+    if not documents:
+        parser.error("no documents found")
+
+    model = JobMatchModel.fit(documents, args.max_features, min(args.min_df, len(documents)))
+    model.save(args.output)
+    print(f"Fitted {len(model.vectorizer.vocabulary_)} terms on {len(documents)} documents; written to {args.output}")
@@ -1,9 +1,6 @@
 import nltk
 from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import json
 import os
 import logging
@@ -13,7 +10,10 @@ from dataclasses import dataclass
 from datetime import datetime
 import pandas as pd
 from collections import Counter
-import spacy
+from Grammar.spacy_registry import get_doc, get_model
+from Grammar.text_normalizer import TextNormalizer
+from Format.section_segmenter import SectionSegmenter
+from LinkedIn.job_match_model import get_job_match_model
 
 @dataclass
 class ProfileSection:
@@ -47,7 +47,11 @@ class LinkedInProfileAnalyzer:
         self.load_nlp_resources()
         self.config = self.load_config(config_file)
         self.lemmatizer = WordNetLemmatizer()
-        self.nlp = spacy.load('en_core_web_sm')
+        self.normalizer = TextNormalizer(lemmatizer=self.lemmatizer)
+        self.nlp = get_model('en_core_web_sm')
+        self.job_match_model = get_job_match_model()
+        # Replaced by the ATS checker's segmenter so both share one scan per resume
+        self.section_segmenter = SectionSegmenter(self.config['required_sections'])
         
         # Initialize industry-specific keywords
         self.industry_keywords = self.load_industry_keywords()
@@ -148,19 +152,8 @@ class LinkedInProfileAnalyzer:
         Returns:
             str: Preprocessed text
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and extra whitespace
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = ' '.join(text.split())
-        
-        # Lemmatize words
-        words = word_tokenize(text)
-        words = [self.lemmatizer.lemmatize(word) for word in words 
-                if word not in stopwords.words('english')]
-        
-        return ' '.join(words)
+        # Lowercase, split on special characters, drop stopwords and lemmatize in one pass
+        return self.normalizer.normalize(text)
 
     def extract_sections(self, text: str) -> Dict[str, ProfileSection]:
         """
@@ -173,29 +166,15 @@ class LinkedInProfileAnalyzer:
             Dict[str, ProfileSection]: Dictionary of analyzed sections
         """
         sections = {}
-        current_section = None
-        current_content = []
+        segmentation = self.section_segmenter.segment(text)
+        spans = segmentation.spans(self.config['required_sections'])
 
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line:
+        for index, span in enumerate(spans):
+            content = ' '.join(segmentation.content_lines(span))
+            # The last section is only kept if it has content
+            if index == len(spans) - 1 and not content:
                 continue
-
-            # Check if line is a section header
-            if any(section.lower() in line.lower() for section in self.config['required_sections']):
-                if current_section:
-                    content = ' '.join(current_content)
-                    sections[current_section] = self.analyze_section(current_section, content)
-                current_section = next(s for s in self.config['required_sections'] 
-                                    if s.lower() in line.lower())
-                current_content = []
-            else:
-                current_content.append(line)
-
-        # Add last section
-        if current_section and current_content:
-            content = ' '.join(current_content)
-            sections[current_section] = self.analyze_section(current_section, content)
+            sections[span.name] = self.analyze_section(span.name, content)
 
         return sections
 
@@ -211,8 +190,9 @@ class LinkedInProfileAnalyzer:
             ProfileSection: Analyzed section data
         """
         words = word_tokenize(content)
+        all_keywords = self.get_all_keywords()
         keywords = set(word.lower() for word in words 
-                      if word.lower() in self.get_all_keywords())
+                      if word.lower() in all_keywords)
         
         # Calculate section score based on length and keyword presence
         recommended_length = self.config['recommended_lengths'].get(section_name, {'min': 50, 'max': 500})
@@ -257,10 +237,8 @@ class LinkedInProfileAnalyzer:
         profile_processed = self.preprocess_text(profile_text)
         job_processed = self.preprocess_text(job_description)
 
-        # TF-IDF similarity
-        vectorizer = TfidfVectorizer()
-        tfidf_matrix = vectorizer.fit_transform([profile_processed, job_processed])
-        cosine_sim = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+        # TF-IDF similarity under the corpus-fitted model
+        cosine_sim = self.job_match_model.similarity(profile_processed, job_processed)
 
         # Keyword matching
         profile_keywords = set(profile_processed.split())
@@ -319,7 +297,7 @@ class LinkedInProfileAnalyzer:
                 all_keywords.update(section.keywords)
             
             # Calculate readability metrics
-            doc = self.nlp(profile_text)
+            doc = get_doc(profile_text)
             readability_metrics = {
                 'avg_sentence_length': sum(len(sent.text.split()) for sent in doc.sents) / len(list(doc.sents)),
                 'unique_words_ratio': len(set(word.text.lower() for word in doc)) / len(doc)
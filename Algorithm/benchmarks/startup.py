@@ -0,0 +1,120 @@
+"""
+Startup benchmark for the headless server.
+
+Imports ``server`` in a fresh interpreter, fails if any GUI module ends up in
+its import graph, and enforces a budget on the time the import takes.
+
+Usage (from the Algorithm directory):
+    python benchmarks/startup.py [--budget SECONDS] [--runs N] [--top N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ALGORITHM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that need a display and must never be imported by the server
+GUI_MODULES = ('tkinter', '_tkinter', 'Config.config_gui', 'turtle', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'wx')
+
+DEFAULT_BUDGET = float(os.environ.get('STARTUP_IMPORT_BUDGET', 8.0))
+
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import server
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+'''
+
+def run_probe(importtime=False):
+    """
+    Import server in a fresh interpreter.
+
+    Args:
+        importtime (bool): Also collect the per-module ``-X importtime`` report
+
+    Returns:
+        Tuple[Dict, str]: Probe result and the raw importtime report
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', PROBE]
+
+    completed = subprocess.run(command, cwd=ALGORITHM_DIR, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing server failed:\n{completed.stderr}")
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result, completed.stderr if importtime else ''
+
+def slowest_imports(report, top):
+    """
+    Parse an ``-X importtime`` report.
+
+    Args:
+        report (str): stderr of an interpreter run with ``-X importtime``
+        top (int): Number of entries to return
+
+    Returns:
+        List[Tuple[float, str]]: (cumulative seconds, module) of the slowest top-level imports
+    """
+    entries = []
+    for line in report.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Only top-level imports (a single leading space) so that nested costs are not counted twice
+        if not name.startswith('  '):
+            entries.append((int(cumulative) / 1e6, name.strip()))
+    return sorted(entries, reverse=True)[:top]
+
+def gui_modules(modules):
+    """Return the GUI modules (or their submodules) present in modules."""
+    return [
+        module for module in modules
+        if any(module == gui or module.startswith(gui + '.') for gui in GUI_MODULES)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure and enforce the server import-time budget")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help="Maximum median import time in seconds")
+    parser.add_argument('--runs', type=int, default=3, help="Number of fresh-interpreter imports to time")
+    parser.add_argument('--top', type=int, default=10, help="Number of slowest imports to list")
+    args = parser.parse_args()
+
+    timings = []
+    modules = []
+    for _ in range(args.runs):
+        result, _ = run_probe()
+        timings.append(result['seconds'])
+        modules = result['modules']
+
+    _, report = run_probe(importtime=True)
+    median = statistics.median(timings)
+
+    print(f"server import: median {median:.2f}s over {args.runs} runs "
+          f"(min {min(timings):.2f}s, max {max(timings):.2f}s, budget {args.budget:.2f}s)")
+    print(f"modules loaded: {len(modules)}")
+    print("slowest imports:")
+    for seconds, name in slowest_imports(report, args.top):
+        print(f"  {seconds:7.3f}s  {name}")
+
+    failures = []
+    found = gui_modules(modules)
+    if found:
+        failures.append(f"GUI modules imported on the server path: {', '.join(found)}")
+    if median > args.budget:
+        failures.append(f"Import time {median:.2f}s exceeds the {args.budget:.2f}s budget")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
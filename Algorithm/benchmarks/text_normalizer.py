@@ -0,0 +1,86 @@
+"""
+Throughput benchmark for the shared text normalizer.
+
+Normalizes a generated resume-like text of ``--words`` words with the
+LinkedIn (lemmatizing) and duplicate-checker (stopwords only) configurations
+of TextNormalizer, and with the previous LinkedIn preprocessing that reloaded
+the stopword corpus for every token.
+
+Usage (from the Algorithm directory):
+    python benchmarks/text_normalizer.py [--words N] [--runs N] [--skip-legacy]
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nltk.corpus import stopwords
+from nltk.stem import WordNetLemmatizer
+from nltk.tokenize import word_tokenize
+from Grammar.text_normalizer import TextNormalizer
+
+VOCABULARY = (
+    "Led a cross-functional team of engineers to design and deliver scalable microservices on AWS. "
+    "Improved API latency by 40% through caching, query optimization and load testing. "
+    "Experienced in Python, Java, SQL, Docker, Kubernetes and CI/CD pipelines; mentored junior developers, "
+    "managed stakeholder communication and owned the project roadmap for the analytics platform."
+).split()
+
+def sample_text(words, seed=0):
+    """Resume-like text of the given number of words."""
+    generator = random.Random(seed)
+    lines = []
+    for start in range(0, words, 12):
+        lines.append(' '.join(generator.choice(VOCABULARY) for _ in range(min(12, words - start))))
+    return '\n'.join(lines)
+
+def legacy_preprocess(text, lemmatizer):
+    """LinkedInProfileAnalyzer.preprocess_text before the shared normalizer."""
+    text = text.lower()
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = ' '.join(text.split())
+    words = word_tokenize(text)
+    words = [lemmatizer.lemmatize(word) for word in words
+             if word not in stopwords.words('english')]
+    return ' '.join(words)
+
+def measure(function, text, runs):
+    """Median seconds of function(text) over runs calls, after one warm-up call."""
+    function(text)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(text)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure text normalization throughput")
+    parser.add_argument('--words', type=int, default=5000, help="Words in the generated input")
+    parser.add_argument('--runs', type=int, default=20, help="Timed runs per configuration")
+    parser.add_argument('--skip-legacy', action='store_true', help="Do not time the previous implementation")
+    args = parser.parse_args()
+
+    text = sample_text(args.words)
+    lemmatizer = WordNetLemmatizer()
+    configurations = [
+        ('linkedin (lemmatized)', TextNormalizer(lemmatizer=lemmatizer).normalize, args.runs),
+        ('duplicate (stopwords only)', TextNormalizer(join_punctuation=True).normalize, args.runs),
+    ]
+    if not args.skip_legacy:
+        # Slow enough that a single timed run is representative
+        configurations.append(('legacy linkedin', lambda value: legacy_preprocess(value, lemmatizer), 1))
+
+    print(f"input: {args.words} words, {len(text)} characters")
+    for name, function, runs in configurations:
+        seconds = measure(function, text, runs)
+        print(f"  {name:28s} {seconds * 1000:9.2f} ms  {args.words / seconds:12,.0f} words/s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
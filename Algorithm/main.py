@@ -1,24 +1,29 @@
-import magic
-import tkinter as tk
-from tkinter import filedialog, messagebox
-import fitz  # PyMuPDF
 from pathlib import Path
-import docx  # python-docx for Word documents
 import os
 import hashlib
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
+import threading
 from Format.resume_format_checker import ResumeFormatChecker
-from Config.config_gui import ConfigGUI
+from Format.parsed_document import ParsedDocument
 from LinkedIn.linkedin_checker import LinkedInProfileAnalyzer
+from Format.section_segmenter import SectionSegmenter
 from Grammar.grammar_checker import GrammarChecker
 from Duplicate.duplicate_content_checker import DuplicateContentChecker
-from Grammar.new_grammar_checker import check_text_grammar_spelling
+from Duplicate.resume_index import ResumeIndex
+from History.history_store import HistoryStore
+
+# Bump whenever the analysis changes so that stored results are not reused
+ANALYZER_VERSION = '8'
 
 class ATSFormatChecker:
+    """
+    Resume analyzer whose models and configuration are loaded once and reused.
 
-    file_path = ''
+    The instance holds no per-request state: the file and job description are
+    passed to each call, so a single checker can serve concurrent requests.
+    """
 
     def __init__(self):
         self.format_scores = {
@@ -36,20 +41,21 @@ class ATSFormatChecker:
 
 
         
-        # Initialize tkinter
-        self.root = tk.Tk()
-        self.root.withdraw()
-        
         # Setup logging
         self.setup_logging()
         
         # Load configuration
         self.config = self.load_config()
+        self.config_fingerprint = self.get_config_fingerprint()
+        self.load_section_segmenter()
         
         # Initialize file history
         self.history_file = 'file_history.json'
         self.load_history()
 
+        # Index of every analysed resume, for near-duplicates across candidates
+        self.load_resume_index()
+
     def setup_logging(self):
         """Setup logging configuration"""
         logging.basicConfig(
@@ -67,7 +73,22 @@ class ATSFormatChecker:
             'max_word_count': 5000,
             'required_sections': ['experience', 'education', 'skills'],
             'forbidden_characters': ['□', '■', '�', '°'],
-            'max_image_percentage': 30
+            'max_image_percentage': 30,
+            'max_pages': 50,  # Pages extracted from a PDF; longer uploads are analysed up to here
+            'max_text_chars': 200000,  # Characters of text analysed per document
+            'history': {
+                'db_path': 'file_history.db',
+                'retention_days': 365,
+                'max_entries_per_file': 20,
+                'retention_interval': 100,  # Analyses saved between retention runs
+                'reuse_max_age_hours': 24 * 7  # null reuses stored results of any age
+            },
+            'resume_index': {
+                'enabled': True,
+                'db_path': 'resume_index.db',
+                'similarity_threshold': 0.8,  # Estimated Jaccard similarity of word shingles
+                'retention_days': 365  # null keeps indexed resumes forever
+            }
         }
         
         try:
@@ -81,46 +102,127 @@ class ATSFormatChecker:
             logging.error(f"Error loading config: {e}")
         return default_config
 
+    def reload_config(self):
+        """Reload config.json; results stored under the previous configuration are no longer reused"""
+        self.config = self.load_config()
+        self.config_fingerprint = self.get_config_fingerprint()
+        self.load_section_segmenter()
+        if self.history is not None:
+            self.history.clear_memory()
+
+    def load_section_segmenter(self):
+        """One segmenter for the required sections of this checker and the LinkedIn analyzer, shared by both"""
+        self.section_segmenter = SectionSegmenter(
+            list(self.config['required_sections']) + list(self.linkedin_checker.config['required_sections'])
+        )
+        self.linkedin_checker.section_segmenter = self.section_segmenter
+
+    def get_config_fingerprint(self):
+        """Hash of the configuration and job match model the analysis depends on"""
+        settings = {'config': self.config, 'job_match_model': self.linkedin_checker.job_match_model.version}
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def get_analysis_key(self, file_hash, job_description=None, submitter_id=None):
+        """Key identifying an analysis: file content, job description, configuration, analyzer version and submitter"""
+        jd_hash = hashlib.sha256((job_description or '').strip().encode('utf-8')).hexdigest()
+        key = f"{file_hash}:{jd_hash}:{self.config_fingerprint}:{ANALYZER_VERSION}"
+        # The near-duplicate findings depend on who submitted the file
+        if submitter_id:
+            key += ':' + hashlib.sha256(submitter_id.encode('utf-8')).hexdigest()[:16]
+        return key
+
+    def find_previous_result(self, analysis_key):
+        """Return a stored result for the same analysis, unless it is stale"""
+        max_age_hours = self.config.get('history', {}).get('reuse_max_age_hours')
+        max_age = timedelta(hours=max_age_hours) if max_age_hours is not None else None
+        if self.history is None:
+            return None
+        try:
+            return self.history.lookup(analysis_key, max_age)
+        except Exception as e:
+            logging.error(f"Error reading history: {e}")
+            return None
+
     def load_history(self):
-        """Load file processing history"""
+        """Open the history store, importing the legacy JSON history on first run"""
+        history_config = self.config.get('history', {})
+        self.history = None
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    self.history = json.load(f)
-            else:
-                self.history = {}
+            self.history = HistoryStore(
+                history_config.get('db_path', 'file_history.db'),
+                retention_days=history_config.get('retention_days'),
+                max_entries_per_file=history_config.get('max_entries_per_file'),
+                retention_interval=history_config.get('retention_interval', 100)
+            )
+            if len(self.history) == 0:
+                imported = self.history.import_json([
+                    self.history_file,
+                    os.path.join('..', 'resume_analyzer', 'backups', 'file_history_*.json')
+                ])
+                if imported:
+                    logging.info(f"Imported {imported} entries from legacy history files")
+            self.history.apply_retention()
         except Exception as e:
             logging.error(f"Error loading history: {e}")
-            self.history = {}
 
-    def save_to_history(self, result):
+    def load_resume_index(self):
+        """Open the index of submitted resumes used for cross-candidate duplicate detection"""
+        index_config = self.config.get('resume_index', {})
+        self.resume_index = None
+        if not index_config.get('enabled', True):
+            return
+        try:
+            self.resume_index = ResumeIndex(
+                index_config.get('db_path', 'resume_index.db'),
+                preprocess=self.duplicate_checker.preprocess_text,
+                retention_days=index_config.get('retention_days', 365)
+            )
+        except Exception as e:
+            logging.error(f"Error opening resume index: {e}")
+
+    def find_similar_resumes(self, document, text_content, submitter_id=None):
+        """Report other submitters' resumes that are near-duplicates of this one, then index it"""
+        if self.resume_index is None or not text_content:
+            return []
+        threshold = self.config.get('resume_index', {}).get('similarity_threshold', 0.8)
+        try:
+            signature = self.resume_index.signature(text_content)
+            similar = self.resume_index.query(
+                text_content, threshold, exclude=document.md5, signature=signature, exclude_submitter=submitter_id
+            )
+            self.resume_index.add(
+                document.md5, text_content, document.filename, signature=signature, submitter=submitter_id
+            )
+            return similar
+        except Exception as e:
+            logging.error(f"Error checking resume index: {e}")
+            return []
+
+    def save_to_history(self, file_path, result, file_hash=None, analysis_key=None):
         """Save file processing result to history"""
-        file_hash = self.get_file_hash()
-        self.history[file_hash] = {
-            'filename': os.path.basename(self.file_path),
-            'last_checked': datetime.now().isoformat(),
-            'result': result
-        }
-        
+        if self.history is None:
+            return
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=4)
+            self.history.add(
+                file_hash or self.get_file_hash(file_path),
+                os.path.basename(file_path),
+                result,
+                analysis_key=analysis_key
+            )
         except Exception as e:
             logging.error(f"Error saving history: {e}")
 
-    def get_file_hash(self):
+    def get_file_hash(self, file_path):
         """Generate hash for file"""
-        hasher = hashlib.md5()
-        with open(self.file_path, 'rb') as f:
-            buf = f.read(65536)
-            while len(buf) > 0:
-                hasher.update(buf)
-                buf = f.read(65536)
-        return hasher.hexdigest()
-
-    def check_file_size(self):
+        file_hash = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                file_hash.update(block)
+        return file_hash.hexdigest()
+
+    def check_file_size(self, file_path):
         """Check if file size is within acceptable range"""
-        file_size = os.path.getsize(self.file_path)
+        file_size = os.path.getsize(file_path)
         min_size = self.config['min_file_size_kb'] * 1024
         max_size = self.config['max_file_size_mb'] * 1024 * 1024
         
@@ -145,11 +247,9 @@ class ATSFormatChecker:
 
     def check_required_sections(self, text):
         """Check for required sections in the document"""
-        text_lower = text.lower()
-        missing_sections = []
-        for section in self.config['required_sections']:
-            if section not in text_lower:
-                missing_sections.append(section)
+        segmentation = self.section_segmenter.segment(text)
+        missing_sections = [section for section in self.config['required_sections']
+                            if not segmentation.mentions_section(section)]
         return not missing_sections, missing_sections
 
     def check_forbidden_characters(self, text):
@@ -164,56 +264,28 @@ class ATSFormatChecker:
         return not found_chars, found_chars
 
 
-    def get_file_type(self):
+    def get_file_type(self, document):
         """Determine the file type using magic library"""
-        try:
-            mime = magic.Magic(mime=True)
-            return mime.from_file(self.file_path)
-        except Exception as e:
-            logging.error(f"Error determining file type: {e}")
-            return None
+        return document.file_type
 
 
-    def extract_text_from_docx(self):
+    def extract_text_from_docx(self, document):
         """Extract text from DOCX file"""
         try:
-            doc = docx.Document(self.file_path)
-            return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+            return ''.join(document.iter_text()).rstrip('\n')
         except Exception as e:
             logging.error(f"Error extracting text from DOCX: {e}")
             return None
 
-    def is_ats_compliant_pdf(self):
+    def is_ats_compliant_pdf(self, document):
         """Check if the PDF contains selectable text and analyze its structure"""
         try:
-            doc = fitz.open(self.file_path)
-            text_content = ""
-            total_image_area = 0
-            total_page_area = 0
+            text_content = document.text
             
-            for page in doc:
-                text_content += page.get_text()
-                
-                # Calculate image coverage
-                image_list = page.get_images(full=True)
-                page_area = page.rect.width * page.rect.height
-                total_page_area += page_area
-                
-                for img in image_list:
-                    xref = img[0]
-                    image = doc.extract_image(xref)
-                    if image:
-                        pix = fitz.Pixmap(image["image"])
-                        image_area = pix.width * pix.height
-                        total_image_area += image_area
-            
-            doc.close()
-            
-            # Calculate image percentage
-            if total_page_area > 0:
-                image_percentage = (total_image_area / total_page_area) * 100
-                if image_percentage > self.config['max_image_percentage']:
-                    return False, f"Too many images ({image_percentage:.1f}% of document)"
+            # Image coverage from placement rectangles, in the same units as the page area
+            image_percentage = document.image_coverage
+            if image_percentage > self.config['max_image_percentage']:
+                return False, f"Too many images ({image_percentage:.1f}% of document)"
             
             # Check for substantial text content
             if len(text_content.strip()) > 100:
@@ -224,7 +296,7 @@ class ATSFormatChecker:
             logging.error(f"Error analyzing PDF: {e}")
             return None, str(e)
 
-    def calculate_format_score(self):
+    def calculate_format_score(self, file_path, job_description=None, submitter_id=None):
         """Calculate comprehensive format compatibility score"""
         result = {
             'score': 0,
@@ -238,18 +310,35 @@ class ATSFormatChecker:
         }
 
         # Check if file exists
-        if not Path(self.file_path).exists():
+        if not Path(file_path).exists():
             result['messages'].append("File not found.")
             return result
 
-        # Check file size
-        size_ok, size_message = self.check_file_size()
+        # Check file size before the file is read into memory
+        size_ok, size_message = self.check_file_size(file_path)
         if not size_ok:
             result['messages'].append(size_message)
             return result
 
+        document = ParsedDocument.from_file(
+            file_path,
+            max_pages=self.config.get('max_pages'),
+            max_chars=self.config.get('max_text_chars')
+        )
+        with document:
+            return self.analyze_document(document, file_path, job_description, result, submitter_id)
+
+    def analyze_document(self, document, file_path, job_description, result, submitter_id=None):
+        """Analyse a document read by calculate_format_score, which closes it afterwards"""
+        file_hash = document.md5
+        # Serve repeated uploads of the same file, JD and configuration from history
+        analysis_key = self.get_analysis_key(file_hash, job_description, submitter_id)
+        previous_result = self.find_previous_result(analysis_key)
+        if previous_result is not None:
+            return previous_result
+
         # Get file type
-        file_type = self.get_file_type()
+        file_type = self.get_file_type(document)
         result['file_type'] = file_type
 
         if file_type not in self.format_scores:
@@ -260,17 +349,23 @@ class ATSFormatChecker:
         # Extract text based on file type
         text_content = None
         if file_type == 'application/pdf':
-            is_ats_friendly, message = self.is_ats_compliant_pdf()
+            is_ats_friendly, message = self.is_ats_compliant_pdf(document)
             if not is_ats_friendly:
                 result['messages'].append(message)
                 result['recommendations'].append("Convert PDF to searchable text format")
                 return result
-            text_content = fitz.open(self.file_path).get_page_text(0)
+            # Every page (within the configured caps), not just the first one
+            text_content = document.text
         elif file_type.endswith('wordprocessingml.document'):
-            text_content = self.extract_text_from_docx()
+            text_content = self.extract_text_from_docx(document)
         elif file_type == 'text/plain':
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                text_content = f.read()
+            text_content = document.text
+
+        if document.truncated:
+            result['messages'].append(
+                f"Document exceeds the analysis limits ({self.config.get('max_pages')} pages / "
+                f"{self.config.get('max_text_chars')} characters); only the beginning was analysed."
+            )
                 
         # ✅ Resume Keyword Analysis
         industry_keywords = set(self.linkedin_checker.get_all_keywords())
@@ -279,17 +374,19 @@ class ATSFormatChecker:
             result["messages"].append("Not enough industry-specific keywords detected.")
             result["recommendations"].append("Add more relevant keywords related to your industry.")
 
+        # Grammar, spelling, passive voice and readability, each computed once for this text
+        grammar_analysis = self.grammar_checker.analyze(text_content or '')
+
         # ✅ Passive Voice Check
-        passive_sentences = self.grammar_checker.check_passive_voice(text_content)
+        passive_sentences = grammar_analysis['passive_voice']
         if passive_sentences:
             result["messages"].append(f"Found {len(passive_sentences)} sentences using passive voice.")
             result["recommendations"].append("Use active voice for stronger impact.")
 
         # ✅ Improvement Suggestions
-        improvement_suggestions = self.grammar_checker.get_improvement_suggestions(text_content)
-        if improvement_suggestions['style_suggestions']:
+        if grammar_analysis['style_suggestions']:
             result["messages"].append("Stylistic Improvements Suggested:")
-            for suggestion in improvement_suggestions['style_suggestions']:
+            for suggestion in grammar_analysis['style_suggestions']:
                 result["recommendations"].append(suggestion)
 
         # ✅ Extract resume sections
@@ -306,8 +403,8 @@ class ATSFormatChecker:
         if text_content:
             # ✅ NEW: Grammar and Readability Check
             # grammar_issues = self.grammar_checker.check_grammar(text_content)
-            grammar_issues = check_text_grammar_spelling(text_content)
-            readability_scores = self.grammar_checker.analyze_readability(text_content)
+            grammar_issues = grammar_analysis['grammar_spelling_issues']
+            readability_scores = grammar_analysis['readability_scores']
 
             if grammar_issues:
                 result["messages"].append(f"Grammar Issues Found: {len(grammar_issues)}")
@@ -354,7 +451,6 @@ class ATSFormatChecker:
         if text_content:
             # ✅ LinkedIn Compatibility & Job Matching
             # job_description = input("Paste Job Description (or press Enter to skip): ").strip()
-            job_description = self.job_description
             linkedin_results = self.linkedin_checker.analyze_profile(text_content, job_description if job_description else None)
 
             # ✅ LinkedIn Best Practices Check
@@ -376,9 +472,19 @@ class ATSFormatChecker:
             for section in duplicate_sections:
                 result['messages'].append(f" - Duplicate section: {section[:50]}...")
 
+        # Near-duplicates among resumes submitted by other candidates. Without a
+        # submitter id an edited re-upload cannot be told apart from a copy, so
+        # the upload is only indexed and nothing is reported to the candidate.
+        similar_resumes = self.find_similar_resumes(document, text_content, submitter_id)
+        if similar_resumes and submitter_id:
+            result['messages'].append(f"Resume closely matches {len(similar_resumes)} previously submitted resume(s).")
+            result['recommendations'].append("Write your resume yourself instead of reusing another candidate's.")
+            # Other candidates' filenames are never reported to the uploader
+            result['messages'].append(f" - Highest similarity: {similar_resumes[0].similarity:.0%}")
+
 
         # ✅ NEW: Analyze formatting using the ResumeFormatChecker module
-        format_analysis = self.format_checker.analyze_format(self.file_path,file_type)
+        format_analysis = self.format_checker.analyze_format(document)
         
         if format_analysis:
             # Font consistency check
@@ -453,14 +559,14 @@ class ATSFormatChecker:
         result['score'] = max(0, base_score - deductions)
 
         # Save to history
-        self.save_to_history(result)
+        self.save_to_history(file_path, result, file_hash, analysis_key)
 
         return result
 
     
-    def check_file(self):
+    def check_file(self, file_path, job_description=None, submitter_id=None):
         """Open file dialog and check format compatibility"""
-        # self.file_path = filedialog.askopenfilename(
+        # file_path = filedialog.askopenfilename(
         #     title="Select Resume File",
         #     filetypes=[
         #         ("All Supported Formats", "*.pdf;*.docx;*.doc;*.txt;*.rtf"),
@@ -471,14 +577,14 @@ class ATSFormatChecker:
         #     ]
         # )
 
-        if not self.file_path:
+        if not file_path:
             return {
                 'score': 0,
                 'messages': ["No file selected."],
                 'file_type': None
             }
 
-        return self.calculate_format_score()
+        return self.calculate_format_score(file_path, job_description, submitter_id)
 
     def generate_report(self, result):
         """Generate a detailed report of the analysis"""
@@ -503,9 +609,7 @@ class ATSFormatChecker:
 
 def main():
     checker = ATSFormatChecker()
-    checker.file_path='Uploads/Jay Amrish Fanse_Resume_December2024.pdf'
-    checker.job_description = ''
-    result = checker.check_file()
+    result = checker.check_file('Uploads/Jay Amrish Fanse_Resume_December2024.pdf', '')
     report = checker.generate_report(result)
     
     print(report)
@@ -518,11 +622,21 @@ def main():
 if __name__ == "__main__":
     main()
 
-def analyseResume(file_path, job_description):
-    checker = ATSFormatChecker()
-    checker.file_path = file_path
-    checker.job_description = job_description
-    result = checker.check_file()
+# Checker shared by every request of this worker, created on first use
+_checker = None
+_checker_lock = threading.Lock()
+
+def get_checker():
+    """Return the process-wide ATSFormatChecker, loading its models once"""
+    global _checker
+    with _checker_lock:
+        if _checker is None:
+            _checker = ATSFormatChecker()
+        return _checker
+
+def analyseResume(file_path, job_description, submitter_id=None):
+    checker = get_checker()
+    result = checker.check_file(file_path, job_description, submitter_id)
     report = checker.generate_report(result)
     
     
@@ -540,6 +654,8 @@ def analyseResume(file_path, job_description):
 
     return response
 
+# Desktop mode only: import tkinter's messagebox and Config.config_gui.ConfigGUI
+# here rather than at module level so that server.py stays headless.
 # def main():
 #     checker = ATSFormatChecker()
 #     config_editor = ConfigGUI()
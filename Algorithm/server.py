@@ -20,6 +20,8 @@ def post_example():
         return jsonify({"error": "No file part"}), 400
 
     job_description = request.form.get('job_description')
+    # Identifies the candidate, so re-uploads are not reported as copies of their own resume
+    submitter_id = request.form.get('submitter_id')
 
     file = request.files['file']
     if file:
@@ -28,7 +30,7 @@ def post_example():
 
     if file.filename == '':
         return jsonify({"error": "No selected file"}), 400
-    response = analyseResume(file_path, job_description)
+    response = analyseResume(file_path, job_description, submitter_id)
 
     os.remove(file_path)
     
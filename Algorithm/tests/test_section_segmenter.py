@@ -0,0 +1,37 @@
+from Format.section_segmenter import SectionSegmenter
+
+SECTIONS = ['Summary', 'Experience', 'Work Experience', 'Education', 'Skills']
+
+RESUME = """Jane Doe
+PROFESSIONAL SUMMARY
+Experienced engineer with a background in data platforms.
+Work Experience
+Acme Corp - Senior Engineer
+Education
+BSc Computer Science
+"""
+
+def test_sections_match_as_case_insensitive_substrings():
+    segmentation = SectionSegmenter(SECTIONS).segment("Experienced engineer")
+
+    assert segmentation.mentions_section('Experience')
+    assert segmentation.mentions == {'experience'}
+
+def test_sections_match_the_substring_checks_they_replace():
+    segmentation = SectionSegmenter(SECTIONS).segment(RESUME)
+
+    assert segmentation.mentions == {section.lower() for section in SECTIONS if section.lower() in RESUME.lower()}
+    assert {'work experience', 'experience'} <= segmentation.mentions
+
+def test_every_line_naming_a_section_is_a_heading():
+    segmentation = SectionSegmenter(SECTIONS).segment(RESUME)
+    spans = segmentation.spans(SECTIONS)
+
+    assert [span.name for span in spans] == ['Summary', 'Experience', 'Experience', 'Education']
+    assert spans[-1].heading == 'Education'
+    assert segmentation.content_lines(spans[-1]) == ['BSc Computer Science']
+
+def test_line_naming_several_sections_takes_the_first_in_order():
+    segmentation = SectionSegmenter(SECTIONS).segment("Education and Skills")
+
+    assert [span.name for span in segmentation.spans(['Skills', 'Education'])] == ['Skills']
@@ -160,19 +160,95 @@
 #     """Health check endpoint"""
 #     return "Server is running successfully"
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from werkzeug.utils import secure_filename
 from api.utils import save_uploaded_file, cleanup_file, validate_file
 from core.scanner import EnhancedATSScanner
+from core.batch_executor import get_batch_executor
+from models.scan_result import ScanResult
 from config import Config
+import threading
+import json
 import uuid
 import os
 
 # Create blueprint
 api_bp = Blueprint('api', __name__)
 
-# Initialize scanner
-scanner = EnhancedATSScanner()
+# Scanner is created on first use so that batch worker processes importing
+# this module do not load a second copy of the models
+_scanner = None
+_scanner_lock = threading.Lock()
+
+def get_scanner() -> EnhancedATSScanner:
+    """Return the scanner used for single-file requests"""
+    global _scanner
+    with _scanner_lock:
+        if _scanner is None:
+            _scanner = EnhancedATSScanner()
+        return _scanner
+
+def _parsed_data(scan: ScanResult) -> dict:
+    """Build the parsed_data payload from a scan artifact"""
+    resume_data = scan.resume_data
+    return {
+        'skills': resume_data.get('skills', []),
+        'experience_years': resume_data.get('experience', 0),
+        'education': resume_data.get('education', []),
+        'contact_info': resume_data.get('contact_info', {}),
+        'sections': resume_data.get('sections', []),
+        'word_count': resume_data.get('word_count', 0),
+        'bullet_points': resume_data.get('bullet_points', 0),
+        'readability': scan.readability  # Only the scores dictionary
+    }
+
+def _batch_entry(filename: str, scan: ScanResult) -> dict:
+    """Build the per-file payload of a batch scan"""
+    result = scan.scoring_result
+    
+    if scan.error is not None:
+        return {
+            'filename': filename,
+            'success': False,
+            'error': scan.error
+        }
+    
+    # Handle validation errors
+    if scan.is_validation_error:
+        return {
+            'filename': filename,
+            'success': False,
+            'validation_error': True,
+            'error': 'Document validation failed - not a resume or CV',
+            'overall_score': result.overall_score,
+            'breakdown': result.breakdown,
+            'feedback': result.feedback,
+            'recommendations': result.recommendations
+        }
+    
+    return {
+        'filename': filename,
+        'success': True,
+        'overall_score': round(result.overall_score, 2),
+        'scoring_type': result.scoring_type,
+        'breakdown': {k: round(v, 2) for k, v in result.breakdown.items()},
+        'feedback': result.feedback,
+        'recommendations': result.recommendations,
+        'parsed_data': _parsed_data(scan)
+    }
+
+def _batch_summary(results: list) -> dict:
+    """Count successes and failures of a batch scan"""
+    failed_results = [r for r in results if not r.get('success')]
+    validation_failed = [r for r in failed_results if r.get('validation_error')]
+    
+    return {
+        'total_processed': len(results),
+        'successful': len(results) - len(failed_results),
+        'failed': len(failed_results),
+        'validation_failed': len(validation_failed),
+        'processing_failed': len(failed_results) - len(validation_failed)
+    }
 
 @api_bp.route('/api/scan', methods=['POST'])
 def scan_resume():
@@ -193,12 +269,15 @@ def scan_resume():
         # Save file temporarily
         file_path = save_uploaded_file(file)
         
-        # Scan resume (includes validation now)
-        result = scanner.scan_resume(file_path, job_description or None)
+        # Scan resume once (extraction, parsing, validation, readability and scoring)
+        scan = get_scanner().scan_resume(file_path, job_description or None)
+        result = scan.scoring_result
+        
+        # Clean up
+        cleanup_file(file_path)
         
         # Handle validation errors
-        if result.scoring_type == 'validation_error':
-            cleanup_file(file_path)
+        if scan.is_validation_error:
             return jsonify({
                 'success': False,
                 'error': 'Document validation failed',
@@ -213,16 +292,6 @@ def scan_resume():
                 'message': 'The uploaded document does not appear to be a resume or CV.'
             }), 400
         
-        # Extract text and parse resume data for successful validation
-        text = scanner.document_parser.extract_text(file_path)
-        resume_data = scanner.resume_parser.parse_resume(text)
-        
-        # Add readability analysis (only scores)
-        readability_scores = scanner.readability_analyzer.analyze(text)
-        
-        # Clean up
-        cleanup_file(file_path)
-        
         return jsonify({
             'success': True,
             'result': {
@@ -232,16 +301,7 @@ def scan_resume():
                 'feedback': result.feedback,
                 'recommendations': result.recommendations
             },
-            'parsed_data': {
-                'skills': resume_data.get('skills', []),
-                'experience_years': resume_data.get('experience', 0),
-                'education': resume_data.get('education', []),
-                'contact_info': resume_data.get('contact_info', {}),
-                'sections': resume_data.get('sections', []),
-                'word_count': resume_data.get('word_count', 0),
-                'bullet_points': resume_data.get('bullet_points', 0),
-                'readability': readability_scores  # Only the scores dictionary
-            }
+            'parsed_data': _parsed_data(scan)
         })
         
     except Exception as e:
@@ -251,12 +311,17 @@ def scan_resume():
 
 @api_bp.route('/api/batch-scan', methods=['POST'])
 def batch_scan():
-    """Scan multiple resumes"""
+    """Scan multiple resumes in parallel across the batch worker pool
+    
+    Pass ``stream=true`` to receive one JSON line per file as soon as it
+    finishes, followed by a summary line.
+    """
     if 'files' not in request.files:
         return jsonify({'success': False, 'error': 'No files provided'}), 400
     
     files = request.files.getlist('files')
     job_description = request.form.get('job_description', '').strip()
+    stream = request.values.get('stream', '').lower() in ('1', 'true', 'yes')
     
     if not files or all(f.filename == '' for f in files):
         return jsonify({'success': False, 'error': 'No files selected'}), 400
@@ -271,57 +336,39 @@ def batch_scan():
                 file_path = save_uploaded_file(file)
                 file_paths.append((file_path, file.filename))
         
-        # Scan all resumes
-        for file_path, original_name in file_paths:
-            try:
-                # Scan resume (includes validation now)
-                result = scanner.scan_resume(file_path, job_description or None)
-                
-                # Handle validation errors
-                if result.scoring_type == 'validation_error':
-                    results.append({
-                        'filename': original_name,
-                        'success': False,
-                        'validation_error': True,
-                        'error': 'Document validation failed - not a resume or CV',
-                        'overall_score': result.overall_score,
-                        'breakdown': result.breakdown,
-                        'feedback': result.feedback,
-                        'recommendations': result.recommendations
-                    })
-                    continue
-                
-                # Extract additional data for valid resumes
-                text = scanner.document_parser.extract_text(file_path)
-                resume_data = scanner.resume_parser.parse_resume(text)
-                readability_scores = scanner.readability_analyzer.analyze(text)
-                
-                results.append({
-                    'filename': original_name,
-                    'success': True,
-                    'overall_score': round(result.overall_score, 2),
-                    'scoring_type': result.scoring_type,
-                    'breakdown': {k: round(v, 2) for k, v in result.breakdown.items()},
-                    'feedback': result.feedback,
-                    'recommendations': result.recommendations,
-                    'parsed_data': {
-                        'skills': resume_data.get('skills', []),
-                        'experience_years': resume_data.get('experience', 0),
-                        'education': resume_data.get('education', []),
-                        'contact_info': resume_data.get('contact_info', {}),
-                        'sections': resume_data.get('sections', []),
-                        'word_count': resume_data.get('word_count', 0),
-                        'bullet_points': resume_data.get('bullet_points', 0),
-                        'readability': readability_scores  # Only the scores dictionary
-                    }
-                })
-                
-            except Exception as e:
-                results.append({
-                    'filename': original_name,
-                    'success': False,
-                    'error': str(e)
-                })
+        # Scan all resumes across the worker pool (results arrive in completion order)
+        original_names = dict(file_paths)
+        scans = get_batch_executor().scan_files(list(original_names), job_description or None)
+        
+        if stream:
+            def generate():
+                # Errors become entries of their own, so a started response always ends with the summary line
+                pending = dict(original_names)
+                try:
+                    try:
+                        for file_path, scan in scans:
+                            filename = pending.pop(file_path)
+                            try:
+                                entry = _batch_entry(filename, scan)
+                            except Exception as e:
+                                entry = {'filename': filename, 'success': False, 'error': str(e)}
+                            results.append(entry)
+                            yield json.dumps(entry) + '\n'
+                    except Exception as e:
+                        # The executor failed outright; report every file it did not get to
+                        for filename in pending.values():
+                            entry = {'filename': filename, 'success': False, 'error': str(e)}
+                            results.append(entry)
+                            yield json.dumps(entry) + '\n'
+                    yield json.dumps({'success': True, 'summary': _batch_summary(results)}) + '\n'
+                finally:
+                    for file_path, _ in file_paths:
+                        cleanup_file(file_path)
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
+        for file_path, scan in scans:
+            results.append(_batch_entry(original_names[file_path], scan))
         
         # Clean up files
         for file_path, _ in file_paths:
@@ -334,20 +381,10 @@ def batch_scan():
         # Failed results (including validation errors)
         failed_results = [r for r in results if not r.get('success')]
         
-        # Separate validation errors for better reporting
-        validation_failed = [r for r in failed_results if r.get('validation_error')]
-        processing_failed = [r for r in failed_results if not r.get('validation_error')]
-        
         return jsonify({
             'success': True,
             'results': successful_results + failed_results,
-            'summary': {
-                'total_processed': len(results),
-                'successful': len(successful_results),
-                'failed': len(failed_results),
-                'validation_failed': len(validation_failed),
-                'processing_failed': len(processing_failed)
-            }
+            'summary': _batch_summary(results)
         })
         
     except Exception as e:
@@ -356,7 +393,15 @@ def batch_scan():
             cleanup_file(file_path)
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@api_bp.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    """Hit/miss counters of the single-scan result cache"""
+    cache = get_scanner().result_cache
+    if cache is None:
+        return jsonify({'success': True, 'enabled': False})
+    return jsonify({'success': True, 'enabled': True, 'stats': cache.stats()})
+
 @api_bp.route('/', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return "Server is running successfully"
\ No newline at end of file
+    return "Server is running successfully"
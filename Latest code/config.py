@@ -16,9 +16,49 @@ class Config:
     DEBUG = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
     
     # Processing settings
-    MAX_TEXT_LENGTH = 2000  # For grammar checking
     MAX_KEYWORDS = 10       # Limit keywords in response
     
+    # Batch scan settings
+    BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', 0)) or os.cpu_count()
+    BATCH_START_METHOD = os.environ.get('BATCH_START_METHOD', 'spawn')
+    BATCH_CHUNK_SIZE = int(os.environ.get('BATCH_CHUNK_SIZE', 4))  # Files per worker task, scanned with one nlp.pipe run
+    BATCH_WORKER_LANGUAGE_TOOL_POOL_SIZE = int(os.environ.get('BATCH_WORKER_LANGUAGE_TOOL_POOL_SIZE', 1))  # Servers per worker
+    
+    # Job description settings
+    JD_CACHE_SIZE = int(os.environ.get('JD_CACHE_SIZE', 64))  # Parsed job descriptions kept in memory
+    
+    # Keyword relevance settings
+    TFIDF_MODEL_PATH = os.environ.get('TFIDF_MODEL_PATH')  # Defaults to data/tfidf_model.joblib
+    TFIDF_MAX_FEATURES = int(os.environ.get('TFIDF_MAX_FEATURES', 20000))  # Vocabulary size when refitting
+    
+    # Result cache settings
+    SCORER_VERSION = '6'  # Bump whenever scoring changes so cached results are not reused
+    RESULT_CACHE_ENABLED = os.environ.get('RESULT_CACHE_ENABLED', 'True').lower() == 'true'
+    RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', 256))  # Scans kept in memory
+    RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', 24 * 60 * 60))  # Seconds, 0 = no expiry
+    RESULT_CACHE_DB = os.environ.get('RESULT_CACHE_DB')  # SQLite file for the shared on-disk tier
+    RESULT_CACHE_DISK_ENTRIES = int(os.environ.get('RESULT_CACHE_DISK_ENTRIES', 10000))
+    
+    # LanguageTool settings
+    LANGUAGE_TOOL_LANGUAGE = 'en-US'
+    LANGUAGE_TOOL_POOL_SIZE = int(os.environ.get('LANGUAGE_TOOL_POOL_SIZE', 2))  # Servers per process
+    LANGUAGE_TOOL_REMOTE_SERVER = os.environ.get('LANGUAGE_TOOL_REMOTE_SERVER')  # URL of a server shared by every process
+    LANGUAGE_TOOL_CHECK_TIMEOUT = float(os.environ.get('LANGUAGE_TOOL_CHECK_TIMEOUT', 30))  # Seconds
+    LANGUAGE_TOOL_ACQUIRE_TIMEOUT = float(os.environ.get('LANGUAGE_TOOL_ACQUIRE_TIMEOUT', 60))  # Seconds
+    GRAMMAR_CHUNK_CHARS = int(os.environ.get('GRAMMAR_CHUNK_CHARS', 1500))  # Characters per LanguageTool request
+    GRAMMAR_LATENCY_BUDGET = float(os.environ.get('GRAMMAR_LATENCY_BUDGET', 5))  # Seconds per document
+    GRAMMAR_CACHE_SIZE = int(os.environ.get('GRAMMAR_CACHE_SIZE', 20000))  # Sentences kept in memory
+    GRAMMAR_CACHE_DB = os.environ.get('GRAMMAR_CACHE_DB')  # SQLite file for the shared on-disk tier
+    GRAMMAR_CACHE_DISK_ENTRIES = int(os.environ.get('GRAMMAR_CACHE_DISK_ENTRIES', 200000))
+    
+    # spaCy settings
+    SPACY_EXCLUDE = ['lemmatizer']  # Only entities and noun chunks are used
+    SPACY_BATCH_SIZE = int(os.environ.get('SPACY_BATCH_SIZE', 32))
+    SPACY_N_PROCESS = int(os.environ.get('SPACY_N_PROCESS', 1))
+    
+    # Skills settings
+    SKILLS_TAXONOMY_PATH = os.environ.get('SKILLS_TAXONOMY_PATH')  # Defaults to data/skills_taxonomy.json
+    
     @staticmethod
     def init_app(app):
         """Initialize application with config"""
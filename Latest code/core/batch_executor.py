@@ -0,0 +1,157 @@
+import atexit
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Optional, Tuple
+from config import Config
+from core.language_tool_pool import get_language_tool_pool
+from core.scanner import EnhancedATSScanner
+from models.scan_result import ScanResult
+
+logger = logging.getLogger(__name__)
+
+# Scanner owned by the current worker process, created once by _init_worker
+_worker_scanner = None
+
+def _init_worker(language_tool_pool_size: int):
+    """Load spaCy, LanguageTool and the skills data once per worker process"""
+    global _worker_scanner
+    # Created before the scanner, which then shares it, so every worker holds at most this many servers
+    get_language_tool_pool(size=language_tool_pool_size)
+    _worker_scanner = EnhancedATSScanner()
+
+def _scan_chunk_in_worker(file_paths: List[str], job_description: Optional[str]) -> List[Tuple[str, ScanResult]]:
+    """Scan a chunk of files inside a worker with one nlp.pipe run, turning failures into error results"""
+    try:
+        return _worker_scanner.batch_scan(file_paths, job_description)
+    except Exception as e:
+        return [(file_path, EnhancedATSScanner.error_result(e)) for file_path in file_paths]
+
+class BatchScanExecutor:
+    """
+    Fan batch scans out across a pool of worker processes with preloaded models
+
+    Files are sent to the workers in small chunks, each scanned with one
+    nlp.pipe run, so results stream back a few files at a time. A worker
+    process that dies takes its unfinished chunks with it; their files are
+    then rescanned one at a time, so only the file that kills a worker again
+    gets an error result.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, start_method: str = 'spawn',
+                 chunk_size: int = Config.BATCH_CHUNK_SIZE,
+                 language_tool_pool_size: int = Config.BATCH_WORKER_LANGUAGE_TOOL_POOL_SIZE):
+        """
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            start_method: multiprocessing start method used for the workers
+            chunk_size: Most files sent to a worker at once, scanned with a single nlp.pipe run
+            language_tool_pool_size: LanguageTool servers per worker (clients only with LANGUAGE_TOOL_REMOTE_SERVER)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.start_method = start_method
+        self.chunk_size = max(1, chunk_size)
+        self.language_tool_pool_size = max(1, language_tool_pool_size)
+        self._pool = None
+        self._lock = threading.Lock()
+
+        if not Config.LANGUAGE_TOOL_REMOTE_SERVER:
+            logger.info(f"Batch workers may start up to {self.max_workers * self.language_tool_pool_size} "
+                        f"LanguageTool servers; set LANGUAGE_TOOL_REMOTE_SERVER to share one per host")
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                    initargs=(self.language_tool_pool_size,)
+                )
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        """Drop a pool whose workers died so the next batch starts a fresh one"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def scan_files(self, file_paths: List[str], job_description: Optional[str] = None) -> Iterator[Tuple[str, ScanResult]]:
+        """
+        Scan files in parallel and yield results in completion order
+
+        Args:
+            file_paths: Paths of the resumes to scan
+            job_description: Optional job description shared by the whole batch
+
+        Yields:
+            (file_path, ScanResult) tuples; a file that fails produces an
+            error ScanResult without affecting the rest of the batch
+        """
+        if not file_paths:
+            return
+
+        # Spread the files over every worker in small chunks, so results stream back as they finish
+        chunk_size = min(self.chunk_size, math.ceil(len(file_paths) / self.max_workers))
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+
+        pool = self._get_pool()
+        futures = {pool.submit(_scan_chunk_in_worker, chunk, job_description): chunk for chunk in chunks}
+        orphaned = []  # Files of chunks lost with a dead worker
+
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                yield from future.result()
+            except BrokenProcessPool:
+                orphaned.extend(chunk)
+            except Exception as e:
+                logger.error(f"Batch scan failed for {len(chunk)} files: {str(e)}")
+                for file_path in chunk:
+                    yield file_path, EnhancedATSScanner.error_result(e)
+
+        if orphaned:
+            logger.error(f"A worker process died; rescanning {len(orphaned)} files one at a time")
+            self._reset_pool()
+            yield from self._rescan_one_by_one(orphaned, job_description)
+
+    def _rescan_one_by_one(self, file_paths: List[str], job_description: Optional[str]) -> Iterator[Tuple[str, ScanResult]]:
+        """Scan files singly, so a file that kills its worker again is the only one reported as failed"""
+        for file_path in file_paths:
+            try:
+                yield from self._get_pool().submit(_scan_chunk_in_worker, [file_path], job_description).result()
+            except BrokenProcessPool as e:
+                logger.error(f"Worker process died while scanning {file_path}: {str(e)}")
+                self._reset_pool()
+                yield file_path, EnhancedATSScanner.error_result(e)
+            except Exception as e:
+                logger.error(f"Batch scan failed for {file_path}: {str(e)}")
+                yield file_path, EnhancedATSScanner.error_result(e)
+
+    def shutdown(self) -> None:
+        """Stop all worker processes"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_batch_executor() -> BatchScanExecutor:
+    """Return the process-wide batch executor configured from Config"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = BatchScanExecutor(
+                max_workers=Config.BATCH_MAX_WORKERS,
+                start_method=Config.BATCH_START_METHOD
+            )
+            atexit.register(_executor.shutdown)
+        return _executor
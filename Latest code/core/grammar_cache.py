@@ -0,0 +1,113 @@
+import bisect
+import copy
+import hashlib
+from typing import Callable, Dict, List, Tuple
+import nltk
+from core.result_cache import ResultCache
+from models.grammar_report import GrammarReport
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Split text into sentence spans with nltk.sent_tokenize
+
+    Sentences may run across line breaks, so a sentence wrapped over several
+    lines is checked as a whole. Algorithm's Grammar/sentence_cache.py splits
+    sentences the same way; the two trees share no code, so keep them in step.
+
+    Returns:
+        (start, end) offsets of the sentences in text
+    """
+    spans = []
+    position = 0
+    for sentence in nltk.sent_tokenize(text):
+        start = text.find(sentence, position)
+        if start == -1:
+            continue
+        spans.append((start, start + len(sentence)))
+        position = start + len(sentence)
+    return spans
+
+def shift_match(match, offset: int):
+    """Copy of a LanguageTool match moved by offset characters"""
+    shifted = copy.copy(match)
+    shifted.offset = match.offset + offset
+    return shifted
+
+class SentenceGrammarCache:
+    """
+    Check grammar sentence by sentence, reusing the matches of sentences seen before.
+
+    Each sentence's LanguageTool matches are cached under a hash of its text
+    with offsets relative to the sentence. Only sentences missing from the
+    cache are sent to the checker, joined into a single request, and every
+    match is moved back to its position in the full document.
+    """
+
+    SEPARATOR = ' '
+
+    def __init__(self, check: Callable[[str], List], cache: ResultCache):
+        """
+        Args:
+            check: Function returning LanguageTool matches for a text
+                (e.g. LanguageToolPool.check)
+            cache: Cache of per-sentence matches
+        """
+        self._check = check
+        self.cache = cache
+
+    def _key(self, sentence: str) -> str:
+        return f"{hashlib.sha256(sentence.encode('utf-8')).hexdigest()}:{self.cache.version}"
+
+    def check(self, text: str) -> List:
+        """Return the LanguageTool matches for text, ordered by offset"""
+        return self.analyze(text).matches
+
+    def analyze(self, text: str) -> GrammarReport:
+        """Check text and report the matches together with how much of it was checked"""
+        spans = sentence_spans(text)
+        sentence_matches: Dict[str, List] = {}
+        misses: Dict[str, None] = {}
+
+        for start, end in spans:
+            sentence = text[start:end]
+            if sentence in sentence_matches or sentence in misses:
+                continue
+            cached = self.cache.get(self._key(sentence))
+            if cached is None:
+                misses[sentence] = None
+            else:
+                sentence_matches[sentence] = cached
+
+        if misses:
+            for sentence, matches in self._check_sentences(list(misses)).items():
+                sentence_matches[sentence] = matches
+                self.cache.put(self._key(sentence), matches)
+
+        matches = []
+        checked_sentences = 0
+        for start, end in spans:
+            found = sentence_matches.get(text[start:end])
+            if found is None:
+                continue  # Left unchecked by the checker
+            checked_sentences += 1
+            matches.extend(shift_match(match, start) for match in found)
+
+        return GrammarReport(matches=matches, sentence_count=len(spans), checked_sentences=checked_sentences)
+
+    def _check_sentences(self, sentences: List[str]) -> Dict[str, List]:
+        """Check sentences in one request and split the matches back per sentence"""
+        starts = []
+        position = 0
+        for sentence in sentences:
+            starts.append(position)
+            position += len(sentence) + len(self.SEPARATOR)
+
+        results: Dict[str, List] = {sentence: [] for sentence in sentences}
+        for match in self._check(self.SEPARATOR.join(sentences)):
+            index = bisect.bisect_right(starts, match.offset) - 1
+            sentence = sentences[index]
+            relative = match.offset - starts[index]
+            # Matches reaching into the separator belong to no sentence
+            if relative + match.errorLength <= len(sentence):
+                results[sentence].append(shift_match(match, -starts[index]))
+        return results
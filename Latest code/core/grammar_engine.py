@@ -0,0 +1,70 @@
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from typing import Dict, List
+from core.grammar_cache import SentenceGrammarCache
+from core.language_tool_pool import LanguageToolPool
+from core.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+class GrammarEngine(SentenceGrammarCache):
+    """
+    Whole-document grammar checking within a latency budget.
+
+    Uncached sentences are grouped into chunks of about ``chunk_chars``
+    characters that are checked concurrently on the LanguageTool pool. Chunks
+    take every n-th sentence rather than a contiguous run, so when the budget
+    runs out the chunks that did finish are spread over the whole document and
+    the resulting error rate is a sampled estimate instead of one biased
+    towards its beginning. Chunks finishing after the budget still fill the
+    sentence cache for the next scan.
+    """
+
+    def __init__(self, pool: LanguageToolPool, cache: ResultCache,
+                 chunk_chars: int = 1500, latency_budget: float = 5.0):
+        """
+        Args:
+            pool: LanguageTool pool the chunks are checked on
+            cache: Cache of per-sentence matches
+            chunk_chars: Approximate characters per LanguageTool request
+            latency_budget: Seconds to wait for chunk results per document
+        """
+        super().__init__(pool.check, cache)
+        self.chunk_chars = max(1, chunk_chars)
+        self.latency_budget = latency_budget
+        self._executor = ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix='grammar-chunk')
+
+    def _chunks(self, sentences: List[str]) -> List[List[str]]:
+        """Deal sentences round-robin into chunks of about chunk_chars"""
+        total_chars = sum(len(sentence) for sentence in sentences)
+        count = min(len(sentences), max(1, math.ceil(total_chars / self.chunk_chars)))
+        return [sentences[i::count] for i in range(count)]
+
+    def _check_sentences(self, sentences: List[str]) -> Dict[str, List]:
+        """Check chunks concurrently, keeping whatever finishes within the budget"""
+        check_chunk = super()._check_sentences
+        futures = [self._executor.submit(check_chunk, chunk) for chunk in self._chunks(sentences)]
+        results: Dict[str, List] = {}
+
+        try:
+            for future in as_completed(futures, timeout=self.latency_budget):
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    logger.warning(f"Grammar check of a chunk failed: {str(e)}")
+        except FutureTimeoutError:
+            logger.info(f"Grammar budget of {self.latency_budget}s exhausted after checking "
+                        f"{len(results)} of {len(sentences)} sentences; using a sampled estimate")
+            for future in futures:
+                if not future.done() and not future.cancel():
+                    future.add_done_callback(self._cache_late_result)
+
+        return results
+
+    def _cache_late_result(self, future) -> None:
+        """Store the matches of a chunk that finished after its document was scored"""
+        if future.cancelled() or future.exception() is not None:
+            return
+        for sentence, matches in future.result().items():
+            self.cache.put(self._key(sentence), matches)
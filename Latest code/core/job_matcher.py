@@ -1,19 +1,32 @@
-from typing import Dict, List, Any
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import hashlib
+from typing import Dict, List, Any, Optional, Sequence
 from fuzzywuzzy import fuzz
+from config import Config
+from core.lru_cache import LRUCache
 from core.resume_parser import ResumeParser
+from core.tfidf_model import TfidfModel, get_tfidf_model
+from data.skills_database import SkillsDatabase
+from models.job_description import ParsedJobDescription
 from models.scoring_result import ScoringResult
 
 class JobMatcher:
     """Match resume against job description"""
     
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
+    def __init__(self, resume_parser: Optional[ResumeParser] = None, cache_size: int = Config.JD_CACHE_SIZE,
+                 tfidf_model: Optional[TfidfModel] = None):
+        """
+        Args:
+            resume_parser: Parser shared with the scanner; a new one is created if omitted
+            cache_size: Number of parsed job descriptions kept in the LRU cache
+            tfidf_model: Corpus-fitted TF-IDF model; defaults to the one persisted on disk
+        """
+        self.tfidf_model = tfidf_model or get_tfidf_model()
+        self.resume_parser = resume_parser or ResumeParser()
+        self.job_cache = LRUCache(cache_size)
     
     def calculate_job_match_score(self, resume_data: Dict[str, Any], job_description: str) -> ScoringResult:
         """Calculate job-specific matching score"""
-        job_requirements = self._parse_job_description(job_description)
+        job_requirements = self.parse_job_description(job_description)
         
         scores = {}
         feedback = []
@@ -32,7 +45,7 @@ class JobMatcher:
             )
         
         # Skills matching (40% weight)
-        skills_score = self._calculate_skills_match(resume_data['skills'], job_requirements['skills'])
+        skills_score = self._calculate_skills_match(resume_data['skills'], job_requirements.skills)
         scores['skills_match'] = skills_score
         
         # Determine scoring based on skills match
@@ -40,21 +53,21 @@ class JobMatcher:
             feedback.append(f"Excellent skills match ({skills_score:.1%}) - Resume contains required skills")
             keyword_score = self._calculate_keyword_relevance(resume_data, job_description)
             experience_score = self._calculate_experience_relevance(resume_data, job_requirements)
-            education_score = self._calculate_education_match(resume_data['education'], job_requirements['education'])
+            education_score = self._calculate_education_match(resume_data['education'], job_requirements.education)
             
         elif skills_score >= 0.4:
             feedback.append(f"Good skills match ({skills_score:.1%}) - Most required skills present")
             recommendations.append("Consider adding any missing technical skills mentioned in job description")
             keyword_score = self._calculate_keyword_relevance(resume_data, job_description)
             experience_score = self._calculate_experience_relevance(resume_data, job_requirements)
-            education_score = self._calculate_education_match(resume_data['education'], job_requirements['education'])
+            education_score = self._calculate_education_match(resume_data['education'], job_requirements.education)
             
         elif skills_score >= 0.2:
             feedback.append(f"Moderate skills match ({skills_score:.1%}) - Some required skills present")
             recommendations.append("Add more relevant technical skills mentioned in job description")
             keyword_score = self._calculate_keyword_relevance(resume_data, job_description) * 0.8
             experience_score = self._calculate_experience_relevance(resume_data, job_requirements) * 0.8
-            education_score = self._calculate_education_match(resume_data['education'], job_requirements['education']) * 0.8
+            education_score = self._calculate_education_match(resume_data['education'], job_requirements.education) * 0.8
             
         else:
             feedback.append(f"Poor skills match ({skills_score:.1%}) - Required skills not found in resume")
@@ -62,7 +75,7 @@ class JobMatcher:
             recommendations.append("Highlight any transferable skills that might be relevant")
             keyword_score = self._calculate_keyword_relevance(resume_data, job_description) * 0.5
             experience_score = self._calculate_experience_relevance(resume_data, job_requirements) * 0.5
-            education_score = self._calculate_education_match(resume_data['education'], job_requirements['education']) * 0.5
+            education_score = self._calculate_education_match(resume_data['education'], job_requirements.education) * 0.5
         
         scores['keyword_relevance'] = keyword_score
         scores['experience_relevance'] = experience_score
@@ -87,30 +100,44 @@ class JobMatcher:
             recommendations=recommendations
         )
     
-    def _has_meaningful_requirements(self, job_requirements: Dict, job_description: str) -> bool:
+    def _has_meaningful_requirements(self, job_requirements: ParsedJobDescription, job_description: str) -> bool:
         """Check if job description has meaningful requirements"""
         word_count = len(job_description.split())
-        has_skills = len(job_requirements['skills']) > 0
-        has_education = len(job_requirements['education']) > 0
-        has_experience = job_requirements['experience_years'] > 0
+        has_skills = len(job_requirements.skills) > 0
+        has_education = len(job_requirements.education) > 0
+        has_experience = job_requirements.experience_years > 0
         
         if word_count >= 1 and has_skills:
             return True
         
         return word_count >= 15 and (has_skills or has_education or has_experience)
     
-    def _parse_job_description(self, job_description: str) -> Dict[str, Any]:
+    def parse_job_description(self, job_description: str) -> ParsedJobDescription:
+        """Parse job description once and reuse the result for every resume it is matched against"""
+        text_hash = hashlib.sha256(job_description.encode('utf-8')).hexdigest()
+        # Skills added at runtime change what is extracted, so they start a new cache entry
+        cache_key = f"{text_hash}:{SkillsDatabase.get_generation()}"
+        
+        job_requirements = self.job_cache.get(cache_key)
+        if job_requirements is None:
+            job_requirements = self._parse_job_description(job_description, text_hash)
+            self.job_cache.put(cache_key, job_requirements)
+        
+        return job_requirements
+    
+    def _parse_job_description(self, job_description: str, text_hash: str) -> ParsedJobDescription:
         """Parse job description to extract requirements"""
-        parser = ResumeParser()
-        
-        return {
-            'skills': parser._extract_skills(job_description),
-            'education': parser._extract_education(job_description),
-            'experience_years': parser._extract_experience_years(job_description),
-            'keywords': parser._extract_keywords(job_description)
-        }
+        parser = self.resume_parser
+        
+        return ParsedJobDescription(
+            text_hash=text_hash,
+            skills=tuple(parser._extract_skills(job_description)),
+            education=tuple(parser._extract_education(job_description)),
+            experience_years=parser._extract_experience_years(job_description),
+            keywords=tuple(parser._extract_keywords(job_description))
+        )
     
-    def _calculate_skills_match(self, resume_skills: List[str], job_skills: List[str]) -> float:
+    def _calculate_skills_match(self, resume_skills: List[str], job_skills: Sequence[str]) -> float:
         """Calculate skills matching score with improved logic"""
         if not job_skills:
             return 0.6
@@ -161,23 +188,21 @@ class JobMatcher:
         return min(final_score, 1.0)
     
     def _calculate_keyword_relevance(self, resume_data: Dict, job_description: str) -> float:
-        """Calculate keyword relevance using TF-IDF"""
+        """Calculate keyword relevance using the corpus-fitted TF-IDF model"""
         resume_text = ' '.join(resume_data.get('keywords', []))
         
         if not resume_text.strip() or not job_description.strip():
             return 0.0
         
         try:
-            tfidf_matrix = self.vectorizer.fit_transform([resume_text, job_description])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return similarity
+            return self.tfidf_model.similarity(resume_text, job_description)
         except:
             return 0.0
     
-    def _calculate_experience_relevance(self, resume_data: Dict, job_requirements: Dict) -> float:
+    def _calculate_experience_relevance(self, resume_data: Dict, job_requirements: ParsedJobDescription) -> float:
         """Calculate experience relevance"""
         resume_exp = resume_data.get('experience', 0)
-        required_exp = job_requirements.get('experience_years', 0)
+        required_exp = job_requirements.experience_years
         
         if required_exp == 0:
             return 0.8
@@ -189,7 +214,7 @@ class JobMatcher:
         else:
             return 0.2
     
-    def _calculate_education_match(self, resume_education: List[str], job_education: List[str]) -> float:
+    def _calculate_education_match(self, resume_education: List[str], job_education: Sequence[str]) -> float:
         """Calculate education matching score"""
         if not job_education:
             return 0.8
@@ -0,0 +1,200 @@
+import atexit
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional
+import language_tool_python
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class _PooledServer:
+    """A LanguageTool server with the thread that runs its checks"""
+
+    def __init__(self, server):
+        self.server = server
+        self.last_checked = time.monotonic()
+        # One long-lived thread per server: checks on a server never overlap, and
+        # a hung check only blocks the thread of the server being closed for it
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='languagetool-check')
+
+    def check(self, text: str, timeout: float) -> List:
+        """Run a check on this server's thread and wait up to timeout seconds"""
+        return self._executor.submit(self.server.check, text).result(timeout=timeout)
+
+    def close(self) -> None:
+        """Close the server, which also ends a check still running on its thread"""
+        self._executor.shutdown(wait=False)
+        self.server.close()
+
+class LanguageToolPool:
+    """
+    Long-lived local LanguageTool servers shared by every grammar check
+
+    Servers start on demand, up to ``size`` alive at once (idle or busy), and
+    are reused because each one is a JVM that takes seconds to start. Each
+    server runs its checks on its own long-lived thread. A server idle for
+    ``health_check_interval`` seconds is pinged before reuse; a check running
+    past ``check_timeout`` gets its server closed, which also ends the request
+    still waiting on it.
+
+    Algorithm's Grammar/language_tool_pool.py follows the same design; the
+    two trees are deployed separately and share no code, so keep them in step.
+    """
+
+    def __init__(self, language: str = 'en-US', size: int = 2, check_timeout: float = 30.0,
+                 acquire_timeout: float = 60.0, health_check_interval: float = 300.0,
+                 factory: Optional[Callable[[str], object]] = None):
+        """
+        Args:
+            language: LanguageTool language code
+            size: Maximum number of servers alive, and of concurrent checks
+            check_timeout: Seconds a single check may take
+            acquire_timeout: Seconds to wait for a free server
+            health_check_interval: Idle seconds after which a server is pinged before use
+            factory: Creates a server for a language (defaults to a local LanguageTool server)
+        """
+        self.language = language
+        self.size = max(1, size)
+        self.check_timeout = check_timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._factory = factory or language_tool_python.LanguageTool
+        self._idle: List[_PooledServer] = []  # Most recently used last
+        self._live = 0  # Servers idle, busy or starting
+        self._available = threading.Condition()
+        self._closed = False
+
+    def warm_up(self, count: int = 1) -> None:
+        """Start servers ahead of the first request; raises if LanguageTool is unavailable"""
+        with self._available:
+            missing = max(min(count, self.size) - self._live, 0)
+            self._live += missing
+        for _ in range(missing):
+            self._release(self._start())
+
+    def _start(self) -> _PooledServer:
+        """Start a server whose place is already counted in _live"""
+        try:
+            return _PooledServer(self._factory(self.language))
+        except Exception:
+            with self._available:
+                self._live -= 1
+                self._available.notify()
+            raise
+
+    def _acquire(self) -> _PooledServer:
+        """Take the most recently used healthy server, starting one while the pool is not full"""
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._available:
+                while not self._idle and self._live >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if self._closed or remaining <= 0 or not self._available.wait(remaining):
+                        raise TimeoutError("No LanguageTool server became available")
+                if self._closed:
+                    raise RuntimeError("LanguageTool pool is closed")
+                if not self._idle:
+                    self._live += 1
+                    pooled = None
+                else:
+                    pooled = self._idle.pop()
+
+            if pooled is None:
+                return self._start()
+            if time.monotonic() - pooled.last_checked < self.health_check_interval or self._ping(pooled):
+                return pooled
+            self._discard(pooled)
+
+    def _release(self, pooled: _PooledServer) -> None:
+        """Return a healthy server to the pool"""
+        with self._available:
+            if not self._closed:
+                pooled.last_checked = time.monotonic()
+                self._idle.append(pooled)
+                self._available.notify()
+                return
+        self._discard(pooled)
+
+    def _discard(self, pooled: _PooledServer) -> None:
+        """Close a server and free its place"""
+        with self._available:
+            self._live -= 1
+            self._available.notify()
+        try:
+            pooled.close()
+        except Exception as e:
+            logger.warning(f"Failed to close LanguageTool server: {str(e)}")
+
+    def _ping(self, pooled: _PooledServer) -> bool:
+        try:
+            pooled.check('Health check.', self.check_timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"LanguageTool server failed its health check: {str(e)}")
+            return False
+
+    def check(self, text: str, timeout: Optional[float] = None) -> List:
+        """
+        Check text on a pooled server
+
+        Args:
+            text: Text to check
+            timeout: Seconds to wait for the result (defaults to check_timeout)
+
+        Returns:
+            LanguageTool matches for text
+        """
+        timeout = timeout or self.check_timeout
+        pooled = self._acquire()
+        try:
+            matches = pooled.check(text, timeout)
+        except FutureTimeoutError:
+            self._discard(pooled)
+            raise TimeoutError(f"LanguageTool check exceeded {timeout}s")
+        except Exception:
+            self._discard(pooled)
+            raise
+        self._release(pooled)
+        return matches
+
+    def close(self) -> None:
+        """Close every idle server; busy ones are closed when their check ends"""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_language_tool_pool(size: Optional[int] = None) -> LanguageToolPool:
+    """
+    Return the process-wide LanguageTool pool configured from Config
+
+    With LANGUAGE_TOOL_REMOTE_SERVER set the pool only holds clients of that
+    server and starts no JVM of its own.
+
+    Args:
+        size: Pool size used when the pool is created (defaults to LANGUAGE_TOOL_POOL_SIZE)
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            factory = None
+            if Config.LANGUAGE_TOOL_REMOTE_SERVER:
+                factory = functools.partial(language_tool_python.LanguageTool,
+                                            remote_server=Config.LANGUAGE_TOOL_REMOTE_SERVER)
+            _pool = LanguageToolPool(
+                language=Config.LANGUAGE_TOOL_LANGUAGE,
+                size=size or Config.LANGUAGE_TOOL_POOL_SIZE,
+                check_timeout=Config.LANGUAGE_TOOL_CHECK_TIMEOUT,
+                acquire_timeout=Config.LANGUAGE_TOOL_ACQUIRE_TIMEOUT,
+                factory=factory
+            )
+            atexit.register(_pool.close)
+        return _pool
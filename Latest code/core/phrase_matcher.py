@@ -0,0 +1,86 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Union
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    """A vocabulary hit with its character offsets in the scanned text"""
+    value: str
+    start: int
+    end: int
+
+class PhraseMatcher:
+    """
+    Find every occurrence of a fixed vocabulary in a single pass over the text.
+
+    The vocabulary is compiled once into a trie and the trie is rendered as one
+    regular expression, so scanning costs the same whether it holds a hundred
+    phrases or tens of thousands. Matching is case-insensitive and phrases must
+    sit on word boundaries, like ``\\bphrase\\b`` for phrases made of word characters.
+    """
+
+    _TERMINAL = ''  # Trie key holding the value of a phrase ending at that node
+
+    def __init__(self, vocabulary: Union[Iterable[str], Mapping[str, str]]):
+        """
+        Args:
+            vocabulary: Phrases to find, or a mapping of surface form -> value
+                reported for it (e.g. an alias -> its canonical skill name)
+        """
+        if not isinstance(vocabulary, Mapping):
+            vocabulary = {phrase: phrase for phrase in vocabulary}
+
+        self._trie: Dict = {}
+        for phrase, value in vocabulary.items():
+            key = phrase.strip().lower()
+            if not key:
+                continue
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node.setdefault(self._TERMINAL, value)
+
+        body = self._to_regex(self._trie)
+        self._pattern = re.compile(r'(?=(?<!\w)(' + body + r')(?!\w))', re.IGNORECASE) if body else None
+
+    def _to_regex(self, node: Dict) -> str:
+        """Render a trie node as a regex that prefers the longest phrase"""
+        branches = [re.escape(char) + self._to_regex(child)
+                    for char, child in sorted(node.items()) if char != self._TERMINAL]
+
+        if not branches:
+            return ''
+
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if self._TERMINAL in node:
+            body = '(?:' + body + ')?'
+        return body
+
+    def find_all(self, text: str) -> List[PhraseMatch]:
+        """Return every vocabulary hit in text, including phrases nested in longer ones"""
+        if not self._pattern or not text:
+            return []
+
+        matches = []
+        for match in self._pattern.finditer(text):
+            start, end = match.span(1)
+
+            # The regex reports the longest phrase starting here; walk the trie
+            # along it to also report shorter phrases ending on a word boundary
+            node = self._trie
+            for position in range(start, end):
+                node = node.get(text[position].lower())
+                if node is None:
+                    break
+                if self._TERMINAL in node and (position + 1 == end or not self._is_word_char(text[position + 1])):
+                    matches.append(PhraseMatch(node[self._TERMINAL], start, position + 1))
+
+        return matches
+
+    def find(self, text: str) -> List[str]:
+        """Return the distinct values found in text, in order of first appearance"""
+        return list(dict.fromkeys(match.value for match in self.find_all(text)))
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == '_'
@@ -1,7 +1,9 @@
-import nltk
-import language_tool_python
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from models.scoring_result import ScoringResult
+from core.language_tool_pool import get_language_tool_pool
+from core.grammar_engine import GrammarEngine
+from core.result_cache import ResultCache
+from config import Config
 import re
 
 class ResumeQualityAssessor:
@@ -9,10 +11,30 @@ class ResumeQualityAssessor:
     
     def __init__(self):
         try:
-            self.grammar_tool = language_tool_python.LanguageTool('en-US')
+            # Shared pool of long-lived LanguageTool servers; start one now so
+            # the first request does not pay the JVM startup
+            self.grammar_tool = get_language_tool_pool()
+            self.grammar_tool.warm_up()
         except:
             self.grammar_tool = None
             print("Warning: LanguageTool not available. Grammar checking disabled.")
+        
+        # Whole-document checking in concurrent chunks; matches are cached per
+        # sentence, so resubmitted resumes only pay for edited sentences
+        self.grammar_engine = None
+        if self.grammar_tool:
+            self.grammar_engine = GrammarEngine(
+                self.grammar_tool,
+                ResultCache(
+                    max_size=Config.GRAMMAR_CACHE_SIZE,
+                    db_path=Config.GRAMMAR_CACHE_DB,
+                    max_disk_entries=Config.GRAMMAR_CACHE_DISK_ENTRIES,
+                    version=Config.LANGUAGE_TOOL_LANGUAGE,
+                    table='grammar_matches'
+                ),
+                chunk_chars=Config.GRAMMAR_CHUNK_CHARS,
+                latency_budget=Config.GRAMMAR_LATENCY_BUDGET
+            )
     
     def assess_quality(self, text: str, resume_data: Dict[str, Any]) -> ScoringResult:
         """Assess overall resume quality"""
@@ -29,7 +51,7 @@ class ResumeQualityAssessor:
         scores['content_quality'] = content_score
         
         # Grammar and language (25% weight)
-        grammar_score = self._assess_grammar(text)
+        grammar_score, grammar_estimated = self._assess_grammar(text)
         scores['grammar_language'] = grammar_score
         
         # Completeness (25% weight)
@@ -48,7 +70,8 @@ class ResumeQualityAssessor:
             scoring_type='quality_assessment',
             breakdown={k: v * 100 for k, v in scores.items()},
             feedback=feedback,
-            recommendations=recommendations
+            recommendations=recommendations,
+            estimated=grammar_estimated
         )
     
     def _assess_format_structure(self, text: str, resume_data: Dict) -> float:
@@ -114,36 +137,38 @@ class ResumeQualityAssessor:
         
         return min(score, 1.0)
     
-    def _assess_grammar(self, text: str) -> float:
-        """Assess grammar and language quality"""
-        if not self.grammar_tool:
-            return 0.8
+    def _assess_grammar(self, text: str) -> Tuple[float, bool]:
+        """Assess grammar and language quality; also returns whether the score is an estimate"""
+        # Without a grammar check the score is a default, not a measurement
+        if not self.grammar_engine:
+            return 0.8, True
         
         try:
-            text_sample = text[:2000] if len(text) > 2000 else text
-            matches = self.grammar_tool.check(text_sample)
-            
-            sentences = nltk.sent_tokenize(text_sample)
-            sentence_count = len(sentences)
+            # The whole document is checked; if the latency budget runs out the
+            # error rate is estimated from the sentences that were checked
+            report = self.grammar_engine.analyze(text)
             
-            if sentence_count == 0:
-                return 0.0
+            if report.sentence_count == 0:
+                return 0.0, False
             
-            error_rate = len(matches) / sentence_count
+            error_rate = report.error_rate
+            if error_rate is None:
+                return 0.8, True
             
             if error_rate == 0:
-                return 1.0
+                score = 1.0
             elif error_rate <= 0.1:
-                return 0.9
+                score = 0.9
             elif error_rate <= 0.2:
-                return 0.7
+                score = 0.7
             elif error_rate <= 0.3:
-                return 0.5
+                score = 0.5
             else:
-                return 0.3
+                score = 0.3
+            return score, report.sampled
                 
         except Exception:
-            return 0.8
+            return 0.8, True
     
     def _assess_completeness(self, resume_data: Dict) -> float:
         """Assess resume completeness"""
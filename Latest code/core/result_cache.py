@@ -0,0 +1,191 @@
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from config import Config
+from core.lru_cache import LRUCache
+from core.tfidf_model import get_tfidf_model
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+
+def file_digest(file_path: str) -> str:
+    """SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def text_digest(text: Optional[str]) -> str:
+    """SHA-256 of a (possibly missing) job description after trimming whitespace"""
+    return hashlib.sha256((text or '').strip().encode('utf-8')).hexdigest()
+
+class ResultCache:
+    """
+    Two-tier cache keyed by content rather than file name (scan results, grammar matches).
+
+    Entries live in an in-memory LRU and, when a database path is given, in a
+    SQLite table shared by every process using the same file (e.g. the batch
+    workers). Both tiers expire entries after ``ttl`` seconds; the disk tier
+    is additionally trimmed to ``max_disk_entries`` least recently used rows.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: Optional[float] = None,
+                 db_path: Optional[str] = None, max_disk_entries: int = 10000,
+                 version: str = '1', table: str = 'scan_results'):
+        """
+        Args:
+            max_size: Entries kept in memory
+            ttl: Seconds an entry stays valid (None keeps entries until evicted)
+            db_path: SQLite file for the on-disk tier (None disables it)
+            max_disk_entries: Rows kept in the on-disk tier
+            version: Scorer version mixed into every key so that scoring
+                changes never serve stale results
+            table: SQLite table holding this cache's rows
+        """
+        self.ttl = ttl
+        self.db_path = db_path
+        self.max_disk_entries = max_disk_entries
+        self.version = version
+        self.table = table
+        self._memory = LRUCache(max_size)
+        self._lock = threading.Lock()
+        self._conn = None
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+        if db_path:
+            self._init_db()
+
+    @classmethod
+    def from_config(cls) -> Optional['ResultCache']:
+        """Build the cache described by Config, or None when caching is disabled"""
+        if not Config.RESULT_CACHE_ENABLED:
+            return None
+        return cls(
+            max_size=Config.RESULT_CACHE_SIZE,
+            ttl=Config.RESULT_CACHE_TTL or None,
+            db_path=Config.RESULT_CACHE_DB,
+            max_disk_entries=Config.RESULT_CACHE_DISK_ENTRIES,
+            # Refitting the TF-IDF model changes keyword relevance scores
+            version=f'{Config.SCORER_VERSION}:{get_tfidf_model().version}'
+        )
+
+    def _init_db(self) -> None:
+        """Open the SQLite tier, falling back to memory only if it is unusable"""
+        try:
+            self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+                'created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{self.table}_accessed ON {self.table} (accessed_at)')
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache database unavailable, using memory only: {str(e)}")
+            self._conn = None
+
+    def make_key(self, file_path: str, job_description: Optional[str] = None) -> str:
+        """Cache key for a file's content scored against a job description"""
+        return f"{file_digest(file_path)}:{text_digest(job_description)}:{self.version}"
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key from the fastest tier holding it"""
+        entry = self._memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if not self._expired(created_at):
+                return value
+            self._memory.pop(key)
+
+        if self._conn is None:
+            return None
+
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    f'SELECT value, created_at FROM {self.table} WHERE key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    self.disk_misses += 1
+                    return None
+                if self._expired(row[1]):
+                    self._conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+                    self._conn.commit()
+                    self.disk_misses += 1
+                    return None
+                self._conn.execute(f'UPDATE {self.table} SET accessed_at = ? WHERE key = ?', (time.time(), key))
+                self._conn.commit()
+                value = pickle.loads(row[0])
+            except (sqlite3.Error, pickle.UnpicklingError) as e:
+                logger.warning(f"Result cache read failed: {str(e)}")
+                return None
+            self.disk_hits += 1
+
+        # Promote to memory, keeping the original creation time for the TTL
+        self._memory.put(key, (row[1], value))
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value in every tier"""
+        now = time.time()
+        self._memory.put(key, (now, value))
+
+        if self._conn is None:
+            return
+
+        with self._lock:
+            try:
+                self._conn.execute(
+                    f'INSERT OR REPLACE INTO {self.table} (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), now, now)
+                )
+                self._evict(now)
+                self._conn.commit()
+            except (sqlite3.Error, pickle.PicklingError) as e:
+                logger.warning(f"Result cache write failed: {str(e)}")
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows and trim the table to max_disk_entries"""
+        if self.ttl is not None:
+            self._conn.execute(f'DELETE FROM {self.table} WHERE created_at < ?', (now - self.ttl,))
+        self._conn.execute(
+            f'DELETE FROM {self.table} WHERE key IN ('
+            f'SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_disk_entries,)
+        )
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        self._memory.clear()
+        if self._conn is not None:
+            with self._lock:
+                self._conn.execute(f'DELETE FROM {self.table}')
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and sizes of both tiers"""
+        stats = {
+            'memory_entries': len(self._memory),
+            'memory_hits': self._memory.hits,
+            'memory_misses': self._memory.misses,
+            'disk_enabled': self._conn is not None,
+            'disk_hits': self.disk_hits,
+            'disk_misses': self.disk_misses,
+            'version': self.version
+        }
+        if self._conn is not None:
+            with self._lock:
+                stats['disk_entries'] = self._conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+        return stats
@@ -1,28 +1,62 @@
 import re
 import spacy
-from typing import Dict, List, Any
+from spacy.tokens import Doc
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+from config import Config
 from data.skills_database import SkillsDatabase
+from core.phrase_matcher import PhraseMatch
+from core.section_segmenter import get_section_segmenter
+from models.section_segmentation import SectionSegmentation
 
 class ResumeParser:
     """Parse and extract structured information from resume text"""
     
-    def __init__(self):
+    def __init__(self, exclude: Optional[List[str]] = None):
+        """
+        Args:
+            exclude: spaCy pipeline components not to load. Only the named
+                entities and noun chunks are read, so the lemmatizer is
+                excluded by default (Config.SPACY_EXCLUDE).
+        """
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=Config.SPACY_EXCLUDE if exclude is None else exclude)
         except OSError:
             raise Exception("spaCy English model not found. Install with: python -m spacy download en_core_web_sm")
         
         self.skills_db = SkillsDatabase.get_skills()
-        
-    def parse_resume(self, text: str) -> Dict[str, Any]:
-        """Extract structured information from resume text"""
+    
+    def get_doc(self, text: str) -> Doc:
+        """Run the spaCy pipeline once; pass the Doc on instead of re-running the model"""
+        return self.nlp(text)
+    
+    def pipe(self, texts: Iterable[str], batch_size: int = Config.SPACY_BATCH_SIZE,
+             n_process: int = Config.SPACY_N_PROCESS) -> Iterator[Doc]:
+        """Run the spaCy pipeline over many texts in batches"""
+        return self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+    
+    def parse_resumes(self, texts: List[str], batch_size: int = Config.SPACY_BATCH_SIZE,
+                      n_process: int = Config.SPACY_N_PROCESS) -> List[Dict[str, Any]]:
+        """Parse many resumes, running spaCy through nlp.pipe"""
+        docs = self.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self.parse_resume(text, doc) for text, doc in zip(texts, docs)]
+        
+    def parse_resume(self, text: str, doc: Optional[Doc] = None) -> Dict[str, Any]:
+        """Extract structured information from resume text
+        
+        Args:
+            text: Resume text
+            doc: spaCy Doc already computed for text, if any
+        """
+        # Segmented once here; the validator and scorers read it from resume_data
+        segmentation = get_section_segmenter().segment(text)
         return {
             'contact_info': self._extract_contact_info(text),
             'skills': self._extract_skills(text),
             'experience': self._extract_experience_years(text),
             'education': self._extract_education(text),
-            'sections': self._identify_sections(text),
-            'keywords': self._extract_keywords(text),
+            'sections': self._identify_sections(text, segmentation),
+            'segmentation': segmentation,
+            'keywords': self._extract_keywords(text, doc),
             'word_count': len(text.split()),
             'bullet_points': self._count_bullet_points(text)
         }
@@ -39,15 +73,12 @@ class ResumeParser:
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in self.skills_db:
-            skill_lower = skill.lower()
-            if re.search(r'\b' + re.escape(skill_lower) + r'\b', text_lower):
-                found_skills.append(skill)
-        
-        return list(set(found_skills))
+        # Fetched per call so skills added at runtime are picked up
+        return SkillsDatabase.get_matcher().find(text)
+    
+    def _extract_skill_matches(self, text: str) -> List[PhraseMatch]:
+        """Extract every skill occurrence with its character offsets"""
+        return SkillsDatabase.get_matcher().find_all(text)
     
     def _extract_experience_years(self, text: str) -> int:
         """Extract years of experience"""
@@ -78,27 +109,20 @@ class ResumeParser:
         
         return found_education
     
-    def _identify_sections(self, text: str) -> List[str]:
+    def _identify_sections(self, text: str, segmentation: Optional[SectionSegmentation] = None) -> List[str]:
         """Identify common resume sections"""
-        section_patterns = {
-            'experience': r'(?:work\s+)?experience|employment|professional\s+background',
-            'education': r'education|academic|qualifications',
-            'skills': r'skills|technical\s+skills|competencies|expertise',
-            'projects': r'projects|portfolio',
-            'certifications': r'certifications?|certificates?',
-            'achievements': r'achievements?|accomplishments?|awards?'
-        }
+        reported_sections = ['experience', 'education', 'skills', 'projects', 'certifications', 'achievements']
         
-        found_sections = []
-        for section, pattern in section_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                found_sections.append(section)
+        if segmentation is None:
+            segmentation = get_section_segmenter().segment(text)
+        mentioned = set(segmentation.mentions)
         
-        return found_sections
+        return [section for section in reported_sections if section in mentioned]
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _extract_keywords(self, text: str, doc: Optional[Doc] = None) -> List[str]:
         """Extract important keywords using NLP"""
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         keywords = []
         
         for ent in doc.ents:
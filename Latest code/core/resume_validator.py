@@ -1,5 +1,6 @@
 import re
 from typing import Dict, List, Tuple
+from core.section_segmenter import get_section_segmenter
 
 class ResumeValidator:
     """Validate if a document is actually a resume/CV"""
@@ -99,9 +100,11 @@ class ResumeValidator:
         resume_section_matches = sum(1 for section in identified_sections 
                                    if any(rs in section.lower() for rs in self.resume_sections))
         
-        # Check text for section keywords
-        text_section_matches = sum(1 for section in self.resume_sections 
-                                 if section in text_lower)
+        # Check text for section keywords, using the parser's single-pass segmentation when available
+        segmentation = resume_data.get('segmentation') or get_section_segmenter().segment(text_lower)
+        resume_sections = set(self.resume_sections)
+        text_section_matches = sum(1 for phrase in segmentation.phrases 
+                                 if phrase in resume_sections)
         
         found_sections = max(resume_section_matches, text_section_matches)
         
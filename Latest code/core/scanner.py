@@ -67,7 +67,10 @@
         
 #         return results
 
-from typing import Optional, List, Tuple
+import dataclasses
+import logging
+from typing import Optional, List, Tuple, Union
+from spacy.tokens import Doc
 from core.document_parser import DocumentParser
 from core.resume_parser import ResumeParser
 from core.job_matcher import JobMatcher
@@ -75,43 +78,79 @@ from core.quality_assessor import ResumeQualityAssessor
 from core.readability_analyzer import ReadabilityAnalyzer
 from core.resume_validator import ResumeValidator
 from models.scoring_result import ScoringResult
+from models.scan_result import ScanResult
+from core.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
 
 class EnhancedATSScanner:
     """Main ATS Scanner with dual scoring capability"""
     
-    def __init__(self):
+    def __init__(self, result_cache: Optional[ResultCache] = None):
+        """
+        Args:
+            result_cache: Cache of finished scans; defaults to the one
+                described by Config (None there disables caching)
+        """
+        self.result_cache = result_cache if result_cache is not None else ResultCache.from_config()
         self.document_parser = DocumentParser()
         self.resume_parser = ResumeParser()
-        self.job_matcher = JobMatcher()
+        self.job_matcher = JobMatcher(self.resume_parser)
         self.quality_assessor = ResumeQualityAssessor()
         self.readability_analyzer = ReadabilityAnalyzer()
         self.resume_validator = ResumeValidator()
     
-    def scan_resume(self, file_path: str, job_description: Optional[str] = None) -> ScoringResult:
+    def scan_resume(self, file_path: str, job_description: Optional[str] = None) -> ScanResult:
         """
-        Scan resume and return appropriate scoring result
+        Scan resume once and return every artifact produced along the way
         
         Args:
             file_path: Path to resume file
             job_description: Optional job description for job-specific matching
             
         Returns:
-            ScoringResult with appropriate scoring type
+            ScanResult holding the text, parsed data, readability scores,
+            validation outcome and the ScoringResult
         """
-        # Extract text from resume
+        # Identical file content scored against the same JD skips all processing
+        cache_key = self.result_cache.make_key(file_path, job_description) if self.result_cache else None
+        if cache_key:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        text = self._extract_text(file_path)
+        result = self._scan_text(text, self.resume_parser.get_doc(text), job_description)
+        
+        self._cache_result(cache_key, result)
+        return result
+    
+    def _cache_result(self, cache_key: Optional[str], result: ScanResult) -> None:
+        """Store a finished scan unless part of its score is an estimate"""
+        # Not kept, so the next upload is scored on a complete grammar check
+        if cache_key and not result.scoring_result.estimated:
+            # The spaCy Doc is only needed by this request; keeping it would hold one Doc per cached scan
+            self.result_cache.put(cache_key, dataclasses.replace(result, doc=None))
+    
+    def _extract_text(self, file_path: str) -> str:
+        """Extract text from resume, rejecting documents without any"""
         text = self.document_parser.extract_text(file_path)
         
         if not text.strip():
             raise ValueError("No text could be extracted from the document")
         
+        return text
+    
+    def _scan_text(self, text: str, doc: Doc, job_description: Optional[str]) -> ScanResult:
+        """Validate and score extracted text whose spaCy Doc is already computed"""
         # Parse resume data
-        resume_data = self.resume_parser.parse_resume(text)
+        resume_data = self.resume_parser.parse_resume(text, doc)
         
         # Validate if this is actually a resume
         is_resume, validation_reason, confidence_score = self.resume_validator.is_resume(text, resume_data)
         
         if not is_resume:
-            return ScoringResult(
+            scoring_result = ScoringResult(
                 overall_score=0.0,
                 scoring_type='validation_error',
                 breakdown={'validation_confidence': round(confidence_score * 100, 1)},
@@ -126,6 +165,16 @@ class EnhancedATSScanner:
                     "Check that the document includes contact information and professional details"
                 ]
             )
+            return ScanResult(
+                text=text,
+                resume_data=resume_data,
+                readability={},
+                is_resume=False,
+                validation_reason=validation_reason,
+                validation_confidence=confidence_score,
+                scoring_result=scoring_result,
+                doc=doc
+            )
         
         # Add readability analysis (only scores)
         readability_scores = self.readability_analyzer.analyze(text)
@@ -136,26 +185,82 @@ class EnhancedATSScanner:
         
         # Choose scoring method based on job description availability and content
         if job_description and job_description.strip():
-            return self.job_matcher.calculate_job_match_score(resume_data, job_description)
+            scoring_result = self.job_matcher.calculate_job_match_score(resume_data, job_description)
         else:
-            return self.quality_assessor.assess_quality(text, resume_data)
+            scoring_result = self.quality_assessor.assess_quality(text, resume_data)
+        
+        return ScanResult(
+            text=text,
+            resume_data=resume_data,
+            readability=readability_scores,
+            is_resume=True,
+            validation_reason=validation_reason,
+            validation_confidence=confidence_score,
+            scoring_result=scoring_result,
+            doc=doc
+        )
     
-    def batch_scan(self, file_paths: List[str], job_description: Optional[str] = None) -> List[Tuple[str, ScoringResult]]:
-        """Batch scan multiple resumes"""
-        results = []
+    def batch_scan(self, file_paths: List[str], job_description: Optional[str] = None) -> List[Tuple[str, ScanResult]]:
+        """Batch scan multiple resumes, running spaCy over all texts with nlp.pipe"""
+        results: List[Optional[ScanResult]] = [None] * len(file_paths)
+        cache_keys: List[Optional[str]] = [None] * len(file_paths)
+        texts = []
         
-        for file_path in file_paths:
+        for index, file_path in enumerate(file_paths):
             try:
-                result = self.scan_resume(file_path, job_description)
-                results.append((file_path, result))
+                if self.result_cache:
+                    cache_keys[index] = self.result_cache.make_key(file_path, job_description)
+                    results[index] = self.result_cache.get(cache_keys[index])
+                    if results[index] is not None:
+                        continue
+                texts.append((index, self._extract_text(file_path)))
             except Exception as e:
-                error_result = ScoringResult(
-                    overall_score=0.0,
-                    scoring_type='error',
-                    breakdown={},
-                    feedback=[f"Error processing file: {str(e)}"],
-                    recommendations=["Check file format and content"]
-                )
-                results.append((file_path, error_result))
-        
-        return results
\ No newline at end of file
+                results[index] = self.error_result(e)
+        
+        docs = self._pipe_docs([text for _, text in texts])
+        for (index, text), doc in zip(texts, docs):
+            if isinstance(doc, Exception):
+                results[index] = self.error_result(doc)
+                continue
+            try:
+                results[index] = self._scan_text(text, doc, job_description)
+                self._cache_result(cache_keys[index], results[index])
+            except Exception as e:
+                results[index] = self.error_result(e)
+        
+        return list(zip(file_paths, results))
+    
+    def _pipe_docs(self, texts: List[str]) -> List[Union[Doc, Exception]]:
+        """Docs for texts from one nlp.pipe run; if the run fails, each text is processed on its own so only the bad ones fail"""
+        try:
+            return list(self.resume_parser.pipe(texts))
+        except Exception as e:
+            logger.warning(f"spaCy batch of {len(texts)} texts failed, processing them one by one: {str(e)}")
+        
+        docs: List[Union[Doc, Exception]] = []
+        for text in texts:
+            try:
+                docs.append(self.resume_parser.get_doc(text))
+            except Exception as e:
+                docs.append(e)
+        return docs
+    
+    @staticmethod
+    def error_result(error: Exception) -> ScanResult:
+        """Build the scan artifact reported for a file that could not be processed"""
+        return ScanResult(
+            text='',
+            resume_data={},
+            readability={},
+            is_resume=False,
+            validation_reason='',
+            validation_confidence=0.0,
+            scoring_result=ScoringResult(
+                overall_score=0.0,
+                scoring_type='error',
+                breakdown={},
+                feedback=[f"Error processing file: {str(error)}"],
+                recommendations=["Check file format and content"]
+            ),
+            error=str(error)
+        )
@@ -0,0 +1,104 @@
+import re
+from typing import Dict, List, Mapping, Optional
+from models.section_segmentation import SectionSegmentation, SectionSpan
+
+# Canonical section -> phrases that name it
+SECTION_PHRASES: Dict[str, List[str]] = {
+    'experience': ['experience', 'work experience', 'professional experience', 'professional background',
+                   'employment', 'work history', 'employment history'],
+    'education': ['education', 'academic', 'academic background', 'qualifications'],
+    'skills': ['skills', 'technical skills', 'competencies', 'core competencies', 'expertise', 'abilities'],
+    'projects': ['projects', 'personal projects', 'portfolio'],
+    'certifications': ['certification', 'certifications', 'certificate', 'certificates'],
+    'achievements': ['achievement', 'achievements', 'accomplishment', 'accomplishments', 'award', 'awards'],
+    'contact': ['contact', 'contact information', 'personal information'],
+    'summary': ['summary', 'profile', 'objective', 'career objective'],
+}
+
+class SectionSegmenter:
+    """
+    Split a resume into sections in a single pass.
+
+    Every section phrase is compiled into one case-insensitive alternation, so
+    the text is scanned once however many phrases there are. A phrase counts
+    wherever it occurs as a substring (e.g. "experienced" names the experience
+    section), like the checks this replaces and Algorithm's section segmenter.
+    A line naming a section is a heading and the section runs until the next
+    heading; a line naming several sections takes the first in ``sections`` order.
+    """
+
+    def __init__(self, sections: Optional[Mapping[str, List[str]]] = None):
+        """
+        Args:
+            sections: Canonical section name -> phrases naming it (defaults to SECTION_PHRASES)
+        """
+        sections = SECTION_PHRASES if sections is None else sections
+        self.sections = list(sections)
+
+        # Phrase -> sections it names, in sections order
+        self._phrase_sections: Dict[str, List[str]] = {}
+        for name, phrases in sections.items():
+            for phrase in phrases:
+                phrase = phrase.strip().lower()
+                if phrase and name not in self._phrase_sections.setdefault(phrase, []):
+                    self._phrase_sections[phrase].append(name)
+
+        # Longest first so the longest phrase starting at a position is the one matched
+        alternatives = sorted(self._phrase_sections, key=len, reverse=True)
+        # Lookahead so overlapping phrases are all found
+        self._pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(phrase) for phrase in alternatives) + '))', re.IGNORECASE
+        ) if alternatives else None
+        # Phrases contained in each phrase, found whenever the longer one matches
+        self._contained = {
+            phrase: [other for other in alternatives if other in phrase]
+            for phrase in alternatives
+        }
+
+    def segment(self, text: str) -> SectionSegmentation:
+        """Find the section headings, spans and mentions of text"""
+        text = text or ''
+        phrases: Dict[str, None] = {}
+        lines: Dict[int, List] = {}  # line start -> [line end, sections named]
+
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                line_start = text.rfind('\n', 0, match.start()) + 1
+                line = lines.get(line_start)
+                if line is None:
+                    line_end = text.find('\n', match.start())
+                    line = lines[line_start] = [len(text) if line_end == -1 else line_end, set()]
+                for phrase in self._contained[match.group(1).lower()]:
+                    phrases.setdefault(phrase)
+                    line[1].update(self._phrase_sections[phrase])
+
+        mentions: Dict[str, None] = {}
+        headings = []  # (line start, line end, section name)
+        for line_start, (line_end, names) in lines.items():
+            for name in self.sections:
+                if name in names:
+                    mentions.setdefault(name)
+            name = next(name for name in self.sections if name in names)
+            headings.append((line_start, line_end, name))
+
+        spans = []
+        for index, (line_start, line_end, name) in enumerate(headings):
+            end = headings[index + 1][0] if index + 1 < len(headings) else len(text)
+            spans.append(SectionSpan(
+                name=name,
+                heading=text[line_start:line_end].strip(),
+                start=line_start,
+                content_start=min(line_end + 1, end),
+                end=end
+            ))
+
+        return SectionSegmentation(spans=spans, mentions=list(mentions), phrases=list(phrases))
+
+_segmenter = None
+
+def get_section_segmenter() -> SectionSegmenter:
+    """Return the segmenter for the default section phrases, compiling it on first use"""
+    global _segmenter
+    if _segmenter is None:
+        _segmenter = SectionSegmenter()
+    return _segmenter
@@ -0,0 +1,124 @@
+import argparse
+import glob
+import hashlib
+import logging
+import os
+import threading
+from typing import Iterable, List, Optional
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'tfidf_model.joblib')
+FALLBACK_VERSION = 'two-document'
+
+class TfidfModel:
+    """
+    TF-IDF vectorizer fitted offline on a corpus of resumes and job descriptions.
+
+    The fitted vectorizer is only applied with transform, so document
+    frequencies come from the whole corpus and scores for the same pair of
+    texts never change between requests. Without a fitted vectorizer the
+    model falls back to fitting the two compared texts, as before.
+    """
+
+    def __init__(self, vectorizer: Optional[TfidfVectorizer] = None, version: str = FALLBACK_VERSION):
+        """
+        Args:
+            vectorizer: Fitted vectorizer, or None for the two-document fallback
+            version: Identifies the fitted model; part of the result cache version
+        """
+        self.vectorizer = vectorizer
+        self.version = version
+
+    @classmethod
+    def fit(cls, documents: Iterable[str], max_features: int = Config.TFIDF_MAX_FEATURES, min_df: int = 2) -> 'TfidfModel':
+        """Fit a model on a corpus of resume and job description texts"""
+        vectorizer = TfidfVectorizer(stop_words='english', max_features=max_features, min_df=min_df, sublinear_tf=True)
+        vectorizer.fit(documents)
+        return cls(vectorizer)
+
+    @classmethod
+    def load(cls, path: str) -> 'TfidfModel':
+        """Load a model written by save"""
+        with open(path, 'rb') as f:
+            version = hashlib.sha256(f.read()).hexdigest()[:16]
+        return cls(joblib.load(path), version)
+
+    def save(self, path: str) -> None:
+        """Write the fitted vectorizer to disk, replacing any previous model atomically"""
+        if self.vectorizer is None:
+            raise ValueError("Only a fitted model can be saved")
+        temp_path = f'{path}.tmp'
+        joblib.dump(self.vectorizer, temp_path)
+        os.replace(temp_path, path)
+
+    def similarity(self, first: str, second: str) -> float:
+        """Cosine similarity of the TF-IDF vectors of two texts"""
+        if self.vectorizer is not None:
+            matrix = self.vectorizer.transform([first, second])
+        else:
+            # A fresh vectorizer per call keeps the fallback safe to use from several threads
+            matrix = TfidfVectorizer(stop_words='english', max_features=1000).fit_transform([first, second])
+        return float(cosine_similarity(matrix[0:1], matrix[1:2])[0][0])
+
+_model = None
+_model_lock = threading.Lock()
+
+def get_tfidf_model() -> TfidfModel:
+    """Load the persisted model once per process, falling back to two-document fits if it is missing"""
+    global _model
+    with _model_lock:
+        if _model is None:
+            path = Config.TFIDF_MODEL_PATH or DEFAULT_MODEL_PATH
+            try:
+                _model = TfidfModel.load(path)
+            except FileNotFoundError:
+                logger.warning(f"No TF-IDF model at {path}; fitting each comparison on its own texts. "
+                               f"Run python -m core.tfidf_model to build one.")
+                _model = TfidfModel()
+            except Exception as e:
+                logger.error(f"Could not load TF-IDF model from {path}: {e}")
+                _model = TfidfModel()
+        return _model
+
+def read_corpus(patterns: List[str]) -> Iterable[str]:
+    """Texts of the resume and job description files matching the glob patterns"""
+    from core.document_parser import DocumentParser
+    parser = DocumentParser()
+
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            try:
+                if path.lower().endswith('.txt'):
+                    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                        yield f.read()
+                else:
+                    yield parser.extract_text(path)
+            except Exception as e:
+                logger.warning(f"Skipping {path}: {e}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Refit the TF-IDF model, e.g. python -m core.tfidf_model 'corpus/resumes/*.pdf' 'corpus/jobs/*.txt'"""
+    parser = argparse.ArgumentParser(description="Fit the TF-IDF model used for keyword relevance")
+    parser.add_argument('paths', nargs='+', help="Resume (PDF/DOCX) and job description (TXT) files or glob patterns")
+    parser.add_argument('--output', default=Config.TFIDF_MODEL_PATH or DEFAULT_MODEL_PATH, help="Model file to write")
+    parser.add_argument('--max-features', type=int, default=Config.TFIDF_MAX_FEATURES, help="Vocabulary size")
+    parser.add_argument('--min-df', type=int, default=2, help="Minimum number of documents a term must appear in")
+    args = parser.parse_args(argv)
+
+    documents = [text for text in read_corpus(args.paths) if text.strip()]
+    if not documents:
+        parser.error("no documents found")
+
+    model = TfidfModel.fit(documents, args.max_features, min(args.min_df, len(documents)))
+    model.save(args.output)
+    print(f"Fitted {len(model.vectorizer.vocabulary_)} terms on {len(documents)} documents; written to {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
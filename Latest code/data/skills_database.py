@@ -1,56 +1,78 @@
-from typing import List
+import os
+import threading
+from typing import List, Optional, Tuple
+from config import Config
+from core.phrase_matcher import PhraseMatcher
+from data.skills_taxonomy import Skill, SkillsTaxonomy
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skills_taxonomy.json')
 
 class SkillsDatabase:
-    """Centralized skills database"""
+    """Centralized skills database backed by the skills taxonomy"""
+    
+    _taxonomy = None
+    _matcher = None
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def get_taxonomy() -> SkillsTaxonomy:
+        """Load the skills taxonomy once per process"""
+        with SkillsDatabase._lock:
+            if SkillsDatabase._taxonomy is None:
+                path = Config.SKILLS_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH
+                SkillsDatabase._taxonomy = SkillsTaxonomy.load(path)
+            return SkillsDatabase._taxonomy
+    
+    @staticmethod
+    def get_matcher() -> PhraseMatcher:
+        """Return the compiled matcher for every skill name and alias, building it on first use"""
+        taxonomy = SkillsDatabase.get_taxonomy()
+        with SkillsDatabase._lock:
+            if SkillsDatabase._matcher is None:
+                SkillsDatabase._matcher = PhraseMatcher(taxonomy.surface_forms())
+            return SkillsDatabase._matcher
+    
+    @staticmethod
+    def get_generation() -> int:
+        """Changes whenever a skill is added at runtime"""
+        return SkillsDatabase.get_taxonomy().generation
     
     @staticmethod
     def get_skills() -> List[str]:
-        """Load predefined skills database"""
-        return [
-            # Programming Languages
-            "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "PHP", "Go", "Rust", "Swift",
-            "Kotlin", "Scala", "R", "MATLAB", "SQL", "HTML", "CSS", "TypeScript", "ABAP",
-            "Perl", "PowerShell", "Bash", "Shell", "VBA", "Objective-C", "Dart", "Lua",
-            
-            # Frameworks & Libraries
-            "React", "Angular", "Vue.js", "Node.js", "Django", "Flask", "Spring", "Laravel",
-            "Express.js", "Redux", "jQuery", "Bootstrap", "Tailwind CSS", "Next.js", "Nuxt.js",
-            "Svelte", "Ember.js", "Backbone.js", "ASP.NET", "Spring Boot", "Hibernate",
-            
-            # Databases
-            "MySQL", "PostgreSQL", "MongoDB", "Oracle", "SQLite", "Redis", "Cassandra",
-            "DynamoDB", "Firebase", "Elasticsearch", "Neo4j", "CouchDB", "MariaDB",
-            
-            # Cloud & DevOps
-            "AWS", "Azure", "Google Cloud", "Docker", "Kubernetes", "Jenkins", "Git",
-            "GitHub", "GitLab", "CI/CD", "Terraform", "Ansible", "Chef", "Puppet",
-            "Vagrant", "Prometheus", "Grafana", "ELK Stack", "Nginx", "Apache",
-            
-            # Data Science & ML
-            "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "Pandas",
-            "NumPy", "Scikit-learn", "Matplotlib", "Seaborn", "Jupyter", "Keras",
-            "OpenCV", "NLTK", "Spark", "Hadoop", "Tableau", "Power BI",
-            
-            # Mobile Development
-            "iOS", "Android", "React Native", "Flutter", "Xamarin", "Ionic",
-            
-            # Testing
-            "Jest", "Selenium", "Cypress", "JUnit", "PyTest", "Mocha", "Chai",
-            
-            # Soft Skills
-            "Leadership", "Communication", "Problem Solving", "Team Work", "Project Management",
-            "Analytical Thinking", "Creativity", "Adaptability", "Time Management", "Critical Thinking"
-        ]
-    
-    @staticmethod
-    def add_skill(skill: str) -> None:
-        """Add new skill to database (for future expansion)"""
-        # Implementation for dynamic skill addition
-        pass
-    
-    @staticmethod
-    def search_skills(query: str) -> List[str]:
+        """Canonical names of all skills in the database"""
+        return SkillsDatabase.get_taxonomy().names
+    
+    @staticmethod
+    def get_categories() -> List[str]:
+        """Skill categories in the database"""
+        return SkillsDatabase.get_taxonomy().categories()
+    
+    @staticmethod
+    def get_skills_by_category(category: str) -> List[str]:
+        """Canonical names of the skills in a category"""
+        return SkillsDatabase.get_taxonomy().by_category(category)
+    
+    @staticmethod
+    def lookup(name: str) -> Optional[Skill]:
+        """Resolve a skill name or alias such as "k8s" to its canonical skill"""
+        return SkillsDatabase.get_taxonomy().lookup(name)
+    
+    @staticmethod
+    def add_skill(skill: str, category: str = 'Other', aliases: Tuple[str, ...] = ()) -> bool:
+        """Add new skill to the database; returns False if it already exists"""
+        added = SkillsDatabase.get_taxonomy().add(skill, category, aliases)
+        if added:
+            # Rebuilt with the new skill on next use
+            with SkillsDatabase._lock:
+                SkillsDatabase._matcher = None
+        return added
+    
+    @staticmethod
+    def autocomplete(prefix: str, limit: int = 10) -> List[str]:
+        """Skills whose name or alias starts with prefix"""
+        return SkillsDatabase.get_taxonomy().autocomplete(prefix, limit)
+    
+    @staticmethod
+    def search_skills(query: str, limit: Optional[int] = None) -> List[str]:
         """Search for skills matching query"""
-        skills = SkillsDatabase.get_skills()
-        query_lower = query.lower()
-        return [skill for skill in skills if query_lower in skill.lower()]
\ No newline at end of file
+        return SkillsDatabase.get_taxonomy().search(query, limit)
@@ -0,0 +1,191 @@
+import bisect
+import heapq
+import json
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+@dataclass(frozen=True)
+class Skill:
+    """A canonical skill with its category and alternative spellings"""
+    name: str
+    category: str
+    aliases: Tuple[str, ...] = ()
+
+def normalize_skill(name: str) -> str:
+    """Key used for every index: lowercase with collapsed whitespace"""
+    return ' '.join(name.lower().split())
+
+class SkillsTaxonomy:
+    """
+    In-memory skills taxonomy with indexed lookups.
+
+    Skills are stored once and referenced by integer id from four indexes
+    built at load time: an exact-key dict for names and aliases, a sorted key
+    array for prefix (autocomplete) queries, a character n-gram index (every
+    substring of one to three characters) for substring search and a category
+    index. All lookups are sub-linear in the taxonomy size.
+
+    The on-disk format is a compact JSON document of
+    ``{"categories": {category: {canonical name: [aliases]}}}``.
+
+    ``generation`` goes up with every added skill, so results derived from
+    the taxonomy (e.g. parsed job descriptions) can be keyed on it.
+    """
+
+    NGRAM_SIZE = 3
+
+    def __init__(self, skills: Optional[List[Skill]] = None):
+        self._lock = threading.RLock()
+        self._skills: List[Skill] = []
+        self._names: List[str] = []
+        self._by_key: Dict[str, int] = {}
+        self._sorted_keys: List[str] = []
+        self._ngram_index: Dict[str, Set[int]] = {}
+        self._by_category: Dict[str, List[int]] = {}
+        self.generation = 0
+
+        for skill in skills or []:
+            self._add(skill)
+        self._sorted_keys.sort()
+
+    @classmethod
+    def load(cls, path: str) -> 'SkillsTaxonomy':
+        """Load a taxonomy from its JSON file"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        skills = [
+            Skill(name=name, category=category, aliases=tuple(aliases))
+            for category, entries in data.get('categories', {}).items()
+            for name, aliases in entries.items()
+        ]
+        return cls(skills)
+
+    def save(self, path: str) -> None:
+        """Write the taxonomy back to its JSON file"""
+        categories: Dict[str, Dict[str, List[str]]] = {}
+        with self._lock:
+            for skill in self._skills:
+                categories.setdefault(skill.category, {})[skill.name] = list(skill.aliases)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'categories': categories}, f, separators=(',', ':'))
+
+    def _add(self, skill: Skill) -> Optional[int]:
+        """Register a skill in the exact-key index; returns its id or None if already known"""
+        key = normalize_skill(skill.name)
+        if not key or key in self._by_key:
+            return None
+
+        skill_id = len(self._skills)
+        self._skills.append(skill)
+        self._names.append(skill.name)
+        self._by_category.setdefault(skill.category, []).append(skill_id)
+
+        for surface in (skill.name,) + skill.aliases:
+            surface_key = normalize_skill(surface)
+            if surface_key and surface_key not in self._by_key:
+                self._by_key[surface_key] = skill_id
+                self._sorted_keys.append(surface_key)
+                self._index_ngrams(surface_key, skill_id)
+
+        return skill_id
+
+    def add(self, name: str, category: str = 'Other', aliases: Tuple[str, ...] = ()) -> bool:
+        """Add a skill; returns False if the name is already in the taxonomy"""
+        with self._lock:
+            start = len(self._sorted_keys)
+            if self._add(Skill(name=name, category=category, aliases=tuple(aliases))) is None:
+                return False
+
+            # Keep the prefix index sorted without re-sorting every key
+            new_keys = self._sorted_keys[start:]
+            del self._sorted_keys[start:]
+            for key in new_keys:
+                bisect.insort(self._sorted_keys, key)
+            self.generation += 1
+            return True
+
+    def _index_ngrams(self, key: str, skill_id: int) -> None:
+        """Index every substring of up to NGRAM_SIZE characters, so short queries are lookups too"""
+        for size in range(1, self.NGRAM_SIZE + 1):
+            for gram in self._ngrams(key, size):
+                self._ngram_index.setdefault(gram, set()).add(skill_id)
+
+    def _ngrams(self, key: str, size: int = NGRAM_SIZE) -> Set[str]:
+        return {key[i:i + size] for i in range(len(key) - size + 1)}
+
+    @property
+    def names(self) -> List[str]:
+        """Canonical skill names in taxonomy order"""
+        with self._lock:
+            return list(self._names)
+
+    def surface_forms(self) -> Dict[str, str]:
+        """Map every name and alias to its canonical skill name"""
+        with self._lock:
+            return {key: self._skills[skill_id].name for key, skill_id in self._by_key.items()}
+
+    def categories(self) -> List[str]:
+        """Distinct categories in taxonomy order"""
+        with self._lock:
+            return list(self._by_category)
+
+    def by_category(self, category: str) -> List[str]:
+        """Canonical names of the skills in a category"""
+        with self._lock:
+            return [self._skills[skill_id].name for skill_id in self._by_category.get(category, [])]
+
+    def lookup(self, name: str) -> Optional[Skill]:
+        """Resolve a canonical name or alias (e.g. "k8s") to its skill"""
+        skill_id = self._by_key.get(normalize_skill(name))
+        return self._skills[skill_id] if skill_id is not None else None
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[str]:
+        """Canonical names of skills whose name or alias starts with prefix"""
+        prefix = normalize_skill(prefix)
+        results: Dict[str, None] = {}
+
+        with self._lock:
+            position = bisect.bisect_left(self._sorted_keys, prefix)
+            while position < len(self._sorted_keys) and len(results) < limit:
+                key = self._sorted_keys[position]
+                if not key.startswith(prefix):
+                    break
+                results[self._skills[self._by_key[key]].name] = None
+                position += 1
+
+        return list(results)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Canonical names of skills whose name or alias contains query"""
+        query = normalize_skill(query)
+        if not query:
+            names = self.names
+            return names[:limit] if limit else names
+
+        with self._lock:
+            if len(query) <= self.NGRAM_SIZE:
+                # Every substring this short is indexed, so its postings are the exact matches
+                postings = self._ngram_index.get(query, ())
+                matches = heapq.nsmallest(limit, postings) if limit else sorted(postings)
+            else:
+                postings = sorted((self._ngram_index.get(gram, set()) for gram in self._ngrams(query)), key=len)
+                candidates = set.intersection(*postings) if postings else set()
+
+                matches = sorted(
+                    skill_id for skill_id in candidates
+                    if any(query in normalize_skill(surface)
+                           for surface in (self._skills[skill_id].name,) + self._skills[skill_id].aliases)
+                )
+            if limit:
+                matches = matches[:limit]
+
+        return [self._skills[skill_id].name for skill_id in matches]
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_skill(name) in self._by_key
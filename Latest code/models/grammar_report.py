@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+@dataclass
+class GrammarReport:
+    """Data model for the grammar matches found in a document"""
+    matches: List
+    sentence_count: int
+    checked_sentences: int
+
+    @property
+    def sampled(self) -> bool:
+        """True when only part of the document was checked"""
+        return self.checked_sentences < self.sentence_count
+
+    @property
+    def error_rate(self) -> Optional[float]:
+        """Matches per checked sentence, or None if nothing could be checked"""
+        if self.checked_sentences == 0:
+            return None
+        return len(self.matches) / self.checked_sentences
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+@dataclass(frozen=True)
+class ParsedJobDescription:
+    """Data model for requirements extracted from a job description"""
+    text_hash: str
+    skills: Tuple[str, ...]
+    education: Tuple[str, ...]
+    experience_years: int
+    keywords: Tuple[str, ...]
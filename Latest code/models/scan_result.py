@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+from models.scoring_result import ScoringResult
+
+@dataclass
+class ScanResult:
+    """Data model for everything produced while scanning one document"""
+    text: str
+    resume_data: Dict[str, Any]
+    readability: Dict[str, float]
+    is_resume: bool
+    validation_reason: str
+    validation_confidence: float
+    scoring_result: ScoringResult
+    error: Optional[str] = None
+    doc: Any = field(default=None, repr=False, compare=False)  # spaCy Doc shared with downstream consumers
+
+    def __getstate__(self):
+        """Leave the spaCy Doc behind when results cross process boundaries"""
+        state = self.__dict__.copy()
+        state['doc'] = None
+        return state
+
+    @property
+    def is_validation_error(self) -> bool:
+        """True when the document was rejected as not being a resume"""
+        return self.scoring_result.scoring_type == 'validation_error'
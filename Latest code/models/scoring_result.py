@@ -8,4 +8,5 @@ class ScoringResult:
     scoring_type: str  # 'job_match' or 'quality_assessment'
     breakdown: Dict[str, float]
     feedback: List[str]
-    recommendations: List[str]
\ No newline at end of file
+    recommendations: List[str]
+    estimated: bool = False  # Part of the score is a sampled estimate or a default for a failed check; such results are not cached
\ No newline at end of file
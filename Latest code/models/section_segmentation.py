@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass(frozen=True)
+class SectionSpan:
+    """A section of the resume: its heading line and the content up to the next heading"""
+    name: str
+    heading: str
+    start: int
+    content_start: int
+    end: int
+
+@dataclass
+class SectionSegmentation:
+    """Data model for the sections found in a document"""
+    spans: List[SectionSpan] = field(default_factory=list)
+    mentions: List[str] = field(default_factory=list)  # Sections named anywhere in the text, in order of appearance
+    phrases: List[str] = field(default_factory=list)  # Distinct section phrases found, lowercased
+
+    def get(self, name: str) -> List[SectionSpan]:
+        """Spans of one section, in document order"""
+        return [span for span in self.spans if span.name == name]
+
+    @property
+    def headings(self) -> List[str]:
+        """Sections that have a heading line, in order of first appearance"""
+        return list(dict.fromkeys(span.name for span in self.spans))
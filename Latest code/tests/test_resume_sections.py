@@ -0,0 +1,36 @@
+from core.section_segmenter import SECTION_PHRASES, SectionSegmenter, get_section_segmenter
+
+RESUME = """Jane Doe
+PROFESSIONAL SUMMARY
+Experienced engineer with a background in data platforms.
+Work Experience
+Acme Corp - Senior Engineer
+Education
+BSc Computer Science
+"""
+
+def test_phrases_match_as_case_insensitive_substrings():
+    segmentation = get_section_segmenter().segment("Experienced engineer")
+
+    assert segmentation.mentions == ['experience']
+    assert segmentation.phrases == ['experience']
+
+def test_phrases_match_the_substring_checks_they_replace():
+    segmentation = get_section_segmenter().segment(RESUME)
+    text_lower = RESUME.lower()
+    all_phrases = {phrase for phrases in SECTION_PHRASES.values() for phrase in phrases}
+
+    assert set(segmentation.phrases) == {phrase for phrase in all_phrases if phrase in text_lower}
+    assert {'work experience', 'experience'} <= set(segmentation.phrases)
+
+def test_every_line_naming_a_section_is_a_heading():
+    segmentation = get_section_segmenter().segment(RESUME)
+
+    assert [span.name for span in segmentation.spans] == ['summary', 'experience', 'experience', 'education']
+    assert segmentation.spans[-1].heading == 'Education'
+    assert RESUME[segmentation.spans[-1].content_start:segmentation.spans[-1].end].strip() == 'BSc Computer Science'
+
+def test_line_naming_several_sections_takes_the_first_in_order():
+    segmenter = SectionSegmenter({'skills': ['skills'], 'education': ['education']})
+
+    assert [span.name for span in segmenter.segment("Education and Skills").spans] == ['skills']